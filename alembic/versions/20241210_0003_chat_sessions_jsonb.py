@@ -0,0 +1,60 @@
+"""Store chat_sessions.messages_json as JSONB on PostgreSQL.
+
+Plain JSON is stored as text and re-parsed on every read, and has no
+operator class for indexing. JSONB is stored pre-parsed and supports a GIN
+index for containment queries (messages_json @> '[{"role": "user"}]').
+SQLite keeps its JSON column unchanged.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2024-12-10
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert messages_json to JSONB and add a GIN index (PostgreSQL only)."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "chat_sessions",
+        "messages_json",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="messages_json::jsonb",
+    )
+    op.create_index(
+        "ix_chat_sessions_messages_gin",
+        "chat_sessions",
+        ["messages_json"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Revert messages_json to JSON (PostgreSQL only)."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_chat_sessions_messages_gin", table_name="chat_sessions")
+    op.alter_column(
+        "chat_sessions",
+        "messages_json",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="messages_json::json",
+    )
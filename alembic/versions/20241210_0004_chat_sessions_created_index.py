@@ -0,0 +1,44 @@
+"""Extend the chat_sessions composite index with created_at.
+
+The common query is "latest sessions for this timepoint/character", ordered
+by created_at. Adding created_at DESC as the trailing column lets that query
+be answered by a single index range scan without a sort. The standalone
+timepoint_id index is dropped because the composite index's prefix covers it.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2024-12-10
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the (timepoint_id, character_name) index with a covering one."""
+    op.create_index(
+        "ix_chat_sessions_timepoint_character_created",
+        "chat_sessions",
+        ["timepoint_id", "character_name", sa.text("created_at DESC")],
+    )
+    op.drop_index("ix_chat_sessions_timepoint_character", table_name="chat_sessions")
+    op.drop_index("ix_chat_sessions_timepoint_id", table_name="chat_sessions")
+
+
+def downgrade() -> None:
+    """Restore the original chat_sessions indexes."""
+    op.create_index("ix_chat_sessions_timepoint_id", "chat_sessions", ["timepoint_id"])
+    op.create_index(
+        "ix_chat_sessions_timepoint_character",
+        "chat_sessions",
+        ["timepoint_id", "character_name"],
+    )
+    op.drop_index("ix_chat_sessions_timepoint_character_created", table_name="chat_sessions")
@@ -24,7 +24,7 @@ from app.prompts import camera as camera_prompts
 from app.schemas.camera import CameraData
 
 
-@dataclass
+@dataclass(slots=True)
 class CameraInput:
     """Input data for Camera Agent.
 
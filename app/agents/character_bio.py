@@ -14,17 +14,26 @@ Tests:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
+from typing import cast
 
 from app.agents.base import AgentResult, BaseAgent
+from app.core.bio_cache import bio_cache
 from app.core.llm_router import LLMRouter
 from app.prompts import character_bio as char_bio_prompts
-from app.schemas import Character
+from app.schemas import Character, CharacterRole
 from app.schemas.character_identification import CharacterIdentification, CharacterStub
 from app.schemas.graph import GraphData
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Default cap on concurrent bio generations in run_many()
+DEFAULT_BIO_CONCURRENCY = 8
+
+
+@dataclass(slots=True)
 class CharacterBioInput:
     """Input data for Character Bio Agent.
 
@@ -39,6 +48,8 @@ class CharacterBioInput:
         atmosphere: Scene atmosphere
         tension_level: Dramatic tension
         graph_data: Optional relationship graph for this character
+        cast_context: Pre-rendered full_cast.get_cast_context(), shared
+            across the fan-out (computed from full_cast when empty)
     """
 
     stub: CharacterStub
@@ -51,6 +62,7 @@ class CharacterBioInput:
     atmosphere: str = ""
     tension_level: str = "medium"
     graph_data: "GraphData | None" = None  # Relationships for this character
+    cast_context: str = ""
 
     @classmethod
     def from_identification(
@@ -65,6 +77,7 @@ class CharacterBioInput:
         atmosphere: str,
         tension_level: str,
         graph_data: "GraphData | None" = None,
+        cast_context: str | None = None,
     ) -> "CharacterBioInput":
         """Create input for a specific character bio.
 
@@ -79,6 +92,8 @@ class CharacterBioInput:
             atmosphere: Scene atmosphere
             tension_level: Tension level
             graph_data: Optional relationship graph for context
+            cast_context: Pre-rendered cast context; computed from
+                full_cast if not provided
 
         Returns:
             CharacterBioInput for this character
@@ -94,6 +109,9 @@ class CharacterBioInput:
             atmosphere=atmosphere,
             tension_level=tension_level,
             graph_data=graph_data,
+            cast_context=(
+                cast_context if cast_context is not None else full_cast.get_cast_context()
+            ),
         )
 
 
@@ -138,20 +156,18 @@ class CharacterBioAgent(BaseAgent[CharacterBioInput, Character]):
     def get_prompt(self, input_data: CharacterBioInput) -> str:
         """Get the user prompt for character bio generation."""
         stub = input_data.stub
-        cast_context = input_data.full_cast.get_cast_context()
+        cast_context = input_data.cast_context or input_data.full_cast.get_cast_context()
 
         # Extract relationship context from graph data
         relationship_context = ""
         if input_data.graph_data:
             relationships = input_data.graph_data.get_relationships_for(stub.name)
             if relationships:
-                rel_lines = []
-                for rel in relationships:
-                    rel_lines.append(
-                        f"- {rel.character_a} <-> {rel.character_b}: "
-                        f"{rel.relationship_type} ({rel.emotional_tone})"
-                    )
-                relationship_context = "\n".join(rel_lines)
+                relationship_context = "\n".join(
+                    f"- {rel.from_character} <-> {rel.to_character}: "
+                    f"{rel.relationship_type} ({rel.tension_level})"
+                    for rel in relationships
+                )
 
         return char_bio_prompts.get_prompt(
             character_name=stub.name,
@@ -178,8 +194,29 @@ class CharacterBioAgent(BaseAgent[CharacterBioInput, Character]):
 
         Returns:
             AgentResult containing Character
+
+        Note:
+            Successful bios are cached by provider, model and prompt, so repeat
+            requests for the same figure in the same scene skip the LLM.
         """
-        result = await self._call_llm(input_data, temperature=0.7)
+        cache_key = {
+            "provider": self.router.config.primary,
+            "model": self.router.config.capabilities.get(self.capability),
+            "system": self.get_system_prompt(),
+            "prompt": self.get_prompt(input_data),
+        }
+        cached = bio_cache.get(cache_key)
+        if cached is not None:
+            result = AgentResult[Character](
+                success=True,
+                content=cast(Character, cached.content),
+                model_used=cached.model_used,
+                metadata={"cache_hit": True},
+            )
+        else:
+            result = await self._call_llm(input_data, temperature=0.7)
+            if result.success and result.content:
+                bio_cache.put(cache_key, result.content, result.model_used)
 
         if result.success and result.content:
             result.metadata["character_name"] = result.content.name
@@ -187,6 +224,49 @@ class CharacterBioAgent(BaseAgent[CharacterBioInput, Character]):
 
         return result
 
+    async def run_many(
+        self,
+        inputs: list[CharacterBioInput],
+        max_concurrency: int = DEFAULT_BIO_CONCURRENCY,
+        semaphore: asyncio.Semaphore | None = None,
+    ) -> list[AgentResult[Character]]:
+        """Generate bios for several characters concurrently.
+
+        Args:
+            inputs: One CharacterBioInput per character
+            max_concurrency: Maximum bios in flight at once
+            semaphore: Optional shared semaphore (overrides max_concurrency)
+
+        Returns:
+            AgentResults in input order. Exceptions are returned as failed
+            results; use create_fallback_character() for those characters.
+        """
+        limiter = semaphore or asyncio.Semaphore(max_concurrency)
+
+        async def run_one(input_data: CharacterBioInput) -> AgentResult[Character]:
+            async with limiter:
+                try:
+                    return await self.run(input_data)
+                except Exception as e:
+                    logger.warning(f"Bio generation failed for {input_data.stub.name}: {e}")
+                    return AgentResult(success=False, error=str(e))
+
+        return list(await asyncio.gather(*(run_one(i) for i in inputs)))
+
+
+# Shared defaults for create_fallback_character; per-stub fields are
+# filled in with model_copy so the constants are validated only once
+_FALLBACK_TEMPLATE = Character(
+    name="",
+    role=CharacterRole.BACKGROUND,
+    description="",
+    clothing="Period-appropriate attire",
+    expression="Appropriate expression for the moment",
+    pose="Standing naturally",
+    action="Observing the scene",
+    speaks_in_scene=False,
+)
+
 
 def create_fallback_character(stub: CharacterStub) -> Character:
     """Create a minimal fallback character from a stub.
@@ -199,13 +279,9 @@ def create_fallback_character(stub: CharacterStub) -> Character:
     Returns:
         Minimal Character with basic info
     """
-    return Character(
-        name=stub.name,
-        role=stub.role,
-        description=stub.brief_description,
-        clothing="Period-appropriate attire",
-        expression="Appropriate expression for the moment",
-        pose="Standing naturally",
-        action="Observing the scene",
-        speaks_in_scene=stub.speaks_in_scene,
-    )
+    return _FALLBACK_TEMPLATE.model_copy(update={
+        "name": stub.name,
+        "role": stub.role,
+        "description": stub.brief_description,
+        "speaks_in_scene": stub.speaks_in_scene,
+    })
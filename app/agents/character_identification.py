@@ -24,7 +24,7 @@ from app.schemas import SceneData, TimelineData
 from app.schemas.character_identification import CharacterIdentification
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterIdentificationInput:
     """Input data for Character Identification Agent.
 
@@ -25,7 +25,7 @@ from app.prompts import characters as characters_prompts
 from app.schemas import CharacterData, SceneData, TimelineData
 
 
-@dataclass
+@dataclass(slots=True)
 class CharactersInput:
     """Input data for Characters Agent.
 
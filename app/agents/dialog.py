@@ -29,7 +29,7 @@ from app.schemas import Character, CharacterData, DialogData, DialogLine, SceneD
 from app.schemas.graph import GraphData, Relationship
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogInput:
     """Input data for Dialog Agent.
 
@@ -41,7 +41,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogExtensionInput:
     """Input for dialog extension.
 
@@ -25,7 +25,7 @@ from app.prompts import graph as graph_prompts
 from app.schemas.graph import GraphData
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphInput:
     """Input data for Graph Agent.
 
@@ -48,7 +48,7 @@ class ImageGenResult:
     model_used: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageGenInput:
     """Input for image generation.
 
@@ -34,7 +34,7 @@ from app.schemas import (
 from app.schemas.graph import GraphData
 
 
-@dataclass
+@dataclass(slots=True)
 class ImagePromptInput:
     """Input data for Image Prompt Agent.
 
@@ -24,7 +24,7 @@ from app.prompts import moment as moment_prompts
 from app.schemas.moment import MomentData
 
 
-@dataclass
+@dataclass(slots=True)
 class MomentInput:
     """Input data for Moment Agent.
 
@@ -29,7 +29,7 @@ from app.prompts import scene as scene_prompts
 from app.schemas import SceneData, TimelineData
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneInput:
     """Input data for Scene Agent.
 
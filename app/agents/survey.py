@@ -49,7 +49,7 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SurveyInput:
     """Input for character survey.
 
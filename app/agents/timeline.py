@@ -31,7 +31,7 @@ from app.prompts import timeline as timeline_prompts
 from app.schemas import JudgeResult, TimelineData
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineInput:
     """Input data for Timeline Agent.
 
@@ -11,6 +11,9 @@ from app.api.v1.models import router as models_router
 from app.api.v1.temporal import router as temporal_router
 from app.api.v1.timepoints import router as timepoints_router
 
+# Keep the default response class: with a response model set, FastAPI
+# serializes straight to JSON bytes via pydantic-core. A custom class such
+# as ORJSONResponse would disable that path.
 router = APIRouter(prefix="/api/v1")
 router.include_router(timepoints_router)
 router.include_router(temporal_router)
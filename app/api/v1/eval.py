@@ -4,6 +4,7 @@ This module provides endpoints for comparing model performance.
 
 Endpoints:
     POST /api/v1/eval/compare - Run multi-model comparison
+    POST /api/v1/eval/compare/stream - Stream results as each model finishes
     GET /api/v1/eval/models - List available models for evaluation
 
 Examples:
@@ -16,16 +17,20 @@ Examples:
     >>> curl http://localhost:8000/api/v1/eval/models
 """
 
+import json
 import logging
+import time
+from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 from app.eval import (
     EvalComparison,
     EvalRequest,
     ModelEvaluator,
 )
-from app.eval.runner import format_comparison_report
+from app.eval.runner import build_comparison, format_comparison_report, get_evaluator
 from app.eval.schemas import EvalModelsResponse
 
 logger = logging.getLogger(__name__)
@@ -33,13 +38,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/eval", tags=["eval"])
 
 
+def _comparison_report_json(comparison: EvalComparison, report: str) -> bytes:
+    """Encode a comparison and its report as a JSON object.
+
+    The comparison is serialized directly by pydantic-core rather than
+    dumped to a dict and re-encoded.
+
+    Args:
+        comparison: Completed comparison
+        report: Formatted ASCII report
+
+    Returns:
+        JSON bytes of {"comparison": ..., "report": ...}
+    """
+    return b"".join((
+        b'{"comparison":',
+        comparison.model_dump_json().encode(),
+        b',"report":',
+        json.dumps(report).encode(),
+        b"}",
+    ))
+
+
 @router.post(
     "/compare",
     response_model=EvalComparison,
     summary="Run multi-model comparison",
     description="Execute the same prompt across multiple models in parallel and compare results.",
 )
-async def compare_models(request: EvalRequest) -> EvalComparison:
+async def compare_models(
+    request: EvalRequest,
+    evaluator: ModelEvaluator = Depends(get_evaluator),
+) -> EvalComparison:
     """Run multi-model comparison.
 
     Executes the provided query across all specified models (or preset)
@@ -47,6 +77,7 @@ async def compare_models(request: EvalRequest) -> EvalComparison:
 
     Args:
         request: Evaluation request with query and models/preset
+        evaluator: Shared model evaluator
 
     Returns:
         EvalComparison with results for all models and statistics
@@ -57,46 +88,118 @@ async def compare_models(request: EvalRequest) -> EvalComparison:
     logger.info(f"Starting model comparison: query='{request.query[:50]}...', preset={request.preset}")
 
     try:
-        evaluator = ModelEvaluator()
-        try:
-            comparison = await evaluator.compare(request)
-            return comparison
-        finally:
-            await evaluator.close()
+        return await evaluator.compare(request)
 
     except Exception as e:
         logger.error(f"Eval comparison failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _stream_comparison(
+    request: EvalRequest,
+    evaluator: ModelEvaluator,
+) -> AsyncGenerator[str, None]:
+    """Generate SSE events for a streamed comparison.
+
+    Args:
+        request: Evaluation request
+        evaluator: Model evaluator
+
+    Yields:
+        A "result" event per model as it finishes, then a "done" event with
+        the full comparison (or an "error" event)
+    """
+    results = []
+
+    try:
+        # Warm up and reserve tokens before the clock starts, so setup and
+        # rate limit waits aren't billed to the run
+        models = await evaluator.prepare(request)
+        start_time = time.perf_counter()
+
+        async for result in evaluator.compare_stream(request, models):
+            results.append(result)
+            event = {"event": "result", "data": result.model_dump(mode="json")}
+            yield f"data: {json.dumps(event)}\n\n"
+
+        total_duration_ms = int((time.perf_counter() - start_time) * 1000)
+        comparison = build_comparison(request, results, total_duration_ms)
+        event = {"event": "done", "data": comparison.model_dump(mode="json")}
+        yield f"data: {json.dumps(event)}\n\n"
+
+    except Exception as e:
+        logger.error(f"Eval comparison stream failed: {e}")
+        event = {"event": "error", "data": str(e)}
+        yield f"data: {json.dumps(event)}\n\n"
+
+
+@router.post(
+    "/compare/stream",
+    summary="Stream multi-model comparison",
+    description="Execute the comparison and push each model's result as Server-Sent Events.",
+)
+async def compare_models_stream(
+    request: EvalRequest,
+    evaluator: ModelEvaluator = Depends(get_evaluator),
+) -> StreamingResponse:
+    """Run multi-model comparison with SSE streaming results.
+
+    Results arrive in completion order, so the fastest model is shown
+    without waiting for the slowest.
+
+    Event types:
+        - result: One model finished (EvalModelResult)
+        - done: All models finished (EvalComparison)
+        - error: Fatal error occurred
+
+    Args:
+        request: Evaluation request with query and models/preset
+        evaluator: Shared model evaluator
+
+    Returns:
+        StreamingResponse with SSE events
+    """
+    logger.info(f"Starting streamed model comparison: query='{request.query[:50]}...'")
+
+    return StreamingResponse(
+        _stream_comparison(request, evaluator),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post(
     "/compare/report",
     response_model=dict,
     summary="Run comparison and get formatted report",
     description="Execute comparison and return both JSON data and formatted ASCII report.",
 )
-async def compare_models_with_report(request: EvalRequest) -> dict:
+async def compare_models_with_report(
+    request: EvalRequest,
+    evaluator: ModelEvaluator = Depends(get_evaluator),
+) -> Response:
     """Run comparison and return formatted report.
 
     Args:
         request: Evaluation request
+        evaluator: Shared model evaluator
 
     Returns:
-        Dictionary with 'comparison' (JSON) and 'report' (ASCII text)
+        JSON object with 'comparison' (JSON) and 'report' (ASCII text)
     """
     logger.info(f"Starting model comparison with report: query='{request.query[:50]}...'")
 
     try:
-        evaluator = ModelEvaluator()
-        try:
-            comparison = await evaluator.compare(request)
-            report = format_comparison_report(comparison)
-            return {
-                "comparison": comparison.model_dump(),
-                "report": report,
-            }
-        finally:
-            await evaluator.close()
+        comparison = await evaluator.compare(request)
+        report = format_comparison_report(comparison)
+        return Response(
+            content=_comparison_report_json(comparison, report),
+            media_type="application/json",
+        )
 
     except Exception as e:
         logger.error(f"Eval comparison failed: {e}")
@@ -109,14 +212,15 @@ async def compare_models_with_report(request: EvalRequest) -> dict:
     summary="List available models for evaluation",
     description="Get all available models and presets for evaluation.",
 )
-async def list_eval_models() -> EvalModelsResponse:
+async def list_eval_models(
+    evaluator: ModelEvaluator = Depends(get_evaluator),
+) -> EvalModelsResponse:
     """List available models for evaluation.
 
+    Args:
+        evaluator: Shared model evaluator
+
     Returns:
         EvalModelsResponse with presets and model list
     """
-    evaluator = ModelEvaluator()
-    try:
-        return evaluator.get_available_models()
-    finally:
-        await evaluator.close()
+    return evaluator.get_available_models()
@@ -25,6 +25,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
 from typing import Any, AsyncGenerator, Literal
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -253,6 +254,27 @@ class SessionListResponse(BaseModel):
 # =============================================================================
 
 
+def token_sse_formatter(character_name: str) -> Callable[[str], str]:
+    """Build the SSE formatter for one chat stream's token events.
+
+    Produces the same bytes as json.dumps of the full token event, but the
+    constant parts are encoded once per stream and only the token per call.
+
+    Args:
+        character_name: Character speaking in the stream
+
+    Returns:
+        Function mapping a token to its "data: ..." SSE frame
+    """
+    head = 'data: {"event": "token", "data": '
+    tail = f', "character_name": {json.dumps(character_name)}}}\n\n'
+
+    def format_token(token: str) -> str:
+        return f"{head}{json.dumps(token)}{tail}"
+
+    return format_token
+
+
 async def get_timepoint_with_characters(
     timepoint_id: str,
     session: AsyncSession,
@@ -511,16 +533,12 @@ async def chat_with_character_stream(
             response_format=request.response_format,
         )
         full_response = ""
+        format_token = token_sse_formatter(character.name)
 
         try:
             async for token in agent.chat_stream(chat_input):
                 full_response += token
-                event = {
-                    "event": "token",
-                    "data": token,
-                    "character_name": character.name,
-                }
-                yield f"data: {json.dumps(event)}\n\n"
+                yield format_token(token)
 
             # Done event
             event = {
@@ -16,11 +16,14 @@ Tests:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, Query
+import httpx
+from fastapi import APIRouter, Query, Response
 from pydantic import BaseModel, Field
 
 from app.config import ProviderType, settings
@@ -32,8 +35,15 @@ router = APIRouter(prefix="/models", tags=["models"])
 
 # Cache for model list
 _model_cache: dict[str, Any] = {}
-_cache_expiry: datetime | None = None
-CACHE_TTL = timedelta(minutes=15)
+_cache_deadline: float = 0.0  # time.monotonic() value
+CACHE_TTL_SECONDS = 15 * 60
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Serializes cache refreshes so concurrent misses share one upstream fetch
+_fetch_lock = asyncio.Lock()
+
+# Shared client so connections are reused across refreshes
+_http_client: httpx.AsyncClient | None = None
 
 
 # Response Models
@@ -77,15 +87,41 @@ class ProvidersResponse(BaseModel):
     providers: list[ProviderStatus]
 
 
+# OpenRouter API payload (only the fields we read)
+
+
+class _OpenRouterArchitecture(BaseModel):
+    modality: str | None = None
+
+
+class _OpenRouterModel(BaseModel):
+    id: str
+    name: str | None = None
+    context_length: int | None = None
+    architecture: _OpenRouterArchitecture = Field(default_factory=_OpenRouterArchitecture)
+    pricing: dict[str, Any] = Field(default_factory=dict)
+
+
+class _OpenRouterModelList(BaseModel):
+    data: list[_OpenRouterModel] = Field(default_factory=list)
+
+
 # Helper Functions
 
 
-def get_configured_models() -> list[ModelInfo]:
-    """Get list of configured models from settings."""
-    models = []
+@lru_cache(maxsize=4)
+def _build_configured_models(
+    google_enabled: bool, openrouter_enabled: bool
+) -> tuple[ModelInfo, ...]:
+    """Build the configured model list for a provider-key combination.
+
+    Cached so the ModelInfo entries are validated once per process rather
+    than on every request.
+    """
+    models: list[ModelInfo] = []
 
     # Google models
-    if settings.GOOGLE_API_KEY:
+    if google_enabled:
         models.extend([
             ModelInfo(
                 id="gemini-2.5-flash",
@@ -116,7 +152,7 @@ def get_configured_models() -> list[ModelInfo]:
         ])
 
     # OpenRouter models (commonly used)
-    if settings.OPENROUTER_API_KEY:
+    if openrouter_enabled:
         models.extend([
             ModelInfo(
                 id="anthropic/claude-3.5-sonnet",
@@ -143,9 +179,95 @@ def get_configured_models() -> list[ModelInfo]:
             ),
         ])
 
+    return tuple(models)
+
+
+@lru_cache(maxsize=4)
+def _build_configured_index(
+    google_enabled: bool, openrouter_enabled: bool
+) -> dict[str, ModelInfo]:
+    """Index the configured models by ID for O(1) lookup."""
+    return {
+        m.id: m for m in _build_configured_models(google_enabled, openrouter_enabled)
+    }
+
+
+def get_configured_models() -> list[ModelInfo]:
+    """Get list of configured models from settings."""
+    return list(_build_configured_models(
+        bool(settings.GOOGLE_API_KEY), bool(settings.OPENROUTER_API_KEY)
+    ))
+
+
+def get_configured_model(model_id: str) -> ModelInfo | None:
+    """Get a configured model by ID, or None if not configured."""
+    return _build_configured_index(
+        bool(settings.GOOGLE_API_KEY), bool(settings.OPENROUTER_API_KEY)
+    ).get(model_id)
+
+
+def _parse_openrouter_models(content: bytes | bytearray, free_only: bool = False) -> list[ModelInfo]:
+    """Parse an OpenRouter /models response body into ModelInfo entries.
+
+    Args:
+        content: Raw JSON response body
+        free_only: If True, only return free models
+    """
+    # Parse and validate the payload in a single pass
+    payload = _OpenRouterModelList.model_validate_json(content)
+    models = []
+
+    for model_data in payload.data:
+        # Determine capabilities from modality
+        modality = model_data.architecture.modality or "text->text"
+        capabilities = ["text"]
+        if "image" in modality.lower():
+            capabilities.append("vision")
+
+        # Check if model is free
+        pricing = model_data.pricing
+        prompt_price = float(pricing.get("prompt", "1") or "1")
+        completion_price = float(pricing.get("completion", "1") or "1")
+        is_free = prompt_price == 0 and completion_price == 0
+
+        # Skip if we only want free models and this isn't free
+        if free_only and not is_free:
+            continue
+
+        # Fields are already validated above, skip re-validation
+        models.append(ModelInfo.model_construct(
+            id=model_data.id,
+            name=model_data.name or model_data.id,
+            provider="openrouter",
+            capabilities=capabilities,
+            context_length=model_data.context_length,
+            pricing={
+                "prompt": prompt_price,
+                "completion": completion_price,
+            },
+            is_free=is_free,
+            modality=modality,
+        ))
+
     return models
 
 
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared httpx client (lazy initialization)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=15.0)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared httpx client."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
 async def fetch_openrouter_models(free_only: bool = False) -> list[ModelInfo]:
     """Fetch available models from OpenRouter API.
 
@@ -154,70 +276,46 @@ async def fetch_openrouter_models(free_only: bool = False) -> list[ModelInfo]:
     Args:
         free_only: If True, only return free models
     """
-    global _model_cache, _cache_expiry
+    global _model_cache, _cache_deadline
 
     # Check cache
     cache_key = "openrouter_free" if free_only else "openrouter"
-    if _cache_expiry and datetime.now() < _cache_expiry and cache_key in _model_cache:
+    if time.monotonic() < _cache_deadline and cache_key in _model_cache:
         return _model_cache[cache_key]
 
     # Fetch from API
     if not settings.OPENROUTER_API_KEY:
         return []
 
-    try:
-        import httpx
+    async with _fetch_lock:
+        # Another request may have refreshed the cache while we waited
+        if time.monotonic() < _cache_deadline and cache_key in _model_cache:
+            return _model_cache[cache_key]
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        try:
+            # Stream the body into one buffer and parse it once
+            async with _get_http_client().stream(
+                "GET",
                 "https://openrouter.ai/api/v1/models",
                 headers={"Authorization": f"Bearer {settings.OPENROUTER_API_KEY}"},
                 timeout=15.0,
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                models = []
-
-                for model_data in data.get("data", []):
-                    # Determine capabilities from modality
-                    modality = model_data.get("architecture", {}).get("modality", "text->text")
-                    capabilities = ["text"]
-                    if "image" in modality.lower():
-                        capabilities.append("vision")
-
-                    # Check if model is free
-                    pricing = model_data.get("pricing", {})
-                    prompt_price = float(pricing.get("prompt", "1") or "1")
-                    completion_price = float(pricing.get("completion", "1") or "1")
-                    is_free = prompt_price == 0 and completion_price == 0
-
-                    # Skip if we only want free models and this isn't free
-                    if free_only and not is_free:
-                        continue
-
-                    models.append(ModelInfo(
-                        id=model_data["id"],
-                        name=model_data.get("name", model_data["id"]),
-                        provider="openrouter",
-                        capabilities=capabilities,
-                        context_length=model_data.get("context_length"),
-                        pricing={
-                            "prompt": prompt_price,
-                            "completion": completion_price,
-                        },
-                        is_free=is_free,
-                        modality=modality,
-                    ))
-
-                # Update cache
-                _model_cache[cache_key] = models
-                _cache_expiry = datetime.now() + CACHE_TTL
-
-                return models
-
-    except Exception as e:
-        logger.warning(f"Failed to fetch OpenRouter models: {e}")
+            ) as response:
+                if response.status_code != 200:
+                    return []
+                body = bytearray()
+                async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                    body.extend(chunk)
+
+            models = _parse_openrouter_models(body, free_only)
+
+            # Update cache
+            _model_cache[cache_key] = models
+            _cache_deadline = time.monotonic() + CACHE_TTL_SECONDS
+
+            return models
+
+        except Exception as e:
+            logger.warning(f"Failed to fetch OpenRouter models: {e}")
 
     return []
 
@@ -345,13 +443,56 @@ async def get_free_models() -> FreeModelsResponse:
     )
 
 
+def _filter_models(
+    models: list[ModelInfo],
+    provider: str | None,
+    capability: str | None,
+    free_only: bool,
+) -> list[ModelInfo]:
+    """Apply the list_models query filters."""
+    # Apply free filter to configured models too
+    if free_only:
+        models = [m for m in models if m.is_free]
+
+    # Apply filters
+    if provider:
+        models = [m for m in models if m.provider == provider]
+
+    if capability:
+        models = [m for m in models if capability in m.capabilities]
+
+    return models
+
+
+@lru_cache(maxsize=64)
+def _configured_models_json(
+    google_enabled: bool,
+    openrouter_enabled: bool,
+    provider: str | None,
+    capability: str | None,
+    free_only: bool,
+) -> bytes:
+    """Serialized ModelListResponse for configured models only.
+
+    The configured model list is fixed per process, so each filter
+    combination is rendered to JSON once.
+    """
+    models = _filter_models(
+        list(_build_configured_models(google_enabled, openrouter_enabled)),
+        provider,
+        capability,
+        free_only,
+    )
+    return ModelListResponse(models=models, total=len(models)).model_dump_json().encode()
+
+
 @router.get("", response_model=ModelListResponse)
 async def list_models(
     provider: str | None = Query(None, description="Filter by provider (google, openrouter)"),
     capability: str | None = Query(None, description="Filter by capability (text, vision, image_generation)"),
     fetch_remote: bool = Query(False, description="Fetch remote models from OpenRouter"),
     free_only: bool = Query(False, description="Only return free models"),
-) -> ModelListResponse:
+) -> ModelListResponse | Response:
     """List available LLM models.
 
     Returns configured models and optionally fetches
@@ -366,29 +507,31 @@ async def list_models(
     Returns:
         ModelListResponse with available models
     """
+    # Configured-only responses are static: serve precomputed JSON
+    if not fetch_remote:
+        return Response(
+            content=_configured_models_json(
+                bool(settings.GOOGLE_API_KEY),
+                bool(settings.OPENROUTER_API_KEY),
+                provider,
+                capability,
+                free_only,
+            ),
+            media_type="application/json",
+        )
+
     models = get_configured_models()
-    cached = False
-
-    # Optionally fetch remote models
-    if fetch_remote:
-        remote_models = await fetch_openrouter_models(free_only=free_only)
-        cached = bool(_cache_expiry and datetime.now() < _cache_expiry)
-        # Merge, avoiding duplicates
-        existing_ids = {m.id for m in models}
-        for rm in remote_models:
-            if rm.id not in existing_ids:
-                models.append(rm)
 
-    # Apply free filter to configured models too
-    if free_only:
-        models = [m for m in models if m.is_free]
+    # Fetch remote models
+    remote_models = await fetch_openrouter_models(free_only=free_only)
+    cached = time.monotonic() < _cache_deadline
+    # Merge, avoiding duplicates
+    existing_ids = {m.id for m in models}
+    for rm in remote_models:
+        if rm.id not in existing_ids:
+            models.append(rm)
 
-    # Apply filters
-    if provider:
-        models = [m for m in models if m.provider == provider]
-
-    if capability:
-        models = [m for m in models if capability in m.capabilities]
+    models = _filter_models(models, provider, capability, free_only)
 
     return ModelListResponse(
         models=models,
@@ -397,20 +540,14 @@ async def list_models(
     )
 
 
-@router.get("/providers", response_model=ProvidersResponse)
-async def get_providers() -> ProvidersResponse:
-    """Get status of configured providers.
-
-    Returns which providers are available and their
-    default model assignments.
-
-    Returns:
-        ProvidersResponse with provider status
-    """
+@lru_cache(maxsize=4)
+def _build_providers_response(
+    google_available: bool, openrouter_available: bool
+) -> ProvidersResponse:
+    """Build provider status for a provider-key combination."""
     providers = []
 
     # Google provider
-    google_available = bool(settings.GOOGLE_API_KEY)
     providers.append(ProviderStatus(
         provider="google",
         available=google_available,
@@ -420,7 +557,6 @@ async def get_providers() -> ProvidersResponse:
     ))
 
     # OpenRouter provider
-    openrouter_available = bool(settings.OPENROUTER_API_KEY)
     providers.append(ProviderStatus(
         provider="openrouter",
         available=openrouter_available,
@@ -432,6 +568,32 @@ async def get_providers() -> ProvidersResponse:
     return ProvidersResponse(providers=providers)
 
 
+@lru_cache(maxsize=4)
+def _providers_json(google_available: bool, openrouter_available: bool) -> bytes:
+    """Serialized ProvidersResponse for a provider-key combination."""
+    return _build_providers_response(
+        google_available, openrouter_available
+    ).model_dump_json().encode()
+
+
+@router.get("/providers", response_model=ProvidersResponse)
+async def get_providers() -> Response:
+    """Get status of configured providers.
+
+    Returns which providers are available and their
+    default model assignments.
+
+    Returns:
+        ProvidersResponse with provider status, as precomputed JSON
+    """
+    return Response(
+        content=_providers_json(
+            bool(settings.GOOGLE_API_KEY), bool(settings.OPENROUTER_API_KEY)
+        ),
+        media_type="application/json",
+    )
+
+
 @router.get("/{model_id:path}")
 async def get_model_info(model_id: str) -> ModelInfo:
     """Get detailed information about a specific model.
@@ -448,10 +610,9 @@ async def get_model_info(model_id: str) -> ModelInfo:
     from fastapi import HTTPException
 
     # Check configured models
-    models = get_configured_models()
-    for model in models:
-        if model.id == model_id:
-            return model
+    model = get_configured_model(model_id)
+    if model is not None:
+        return model
 
     # Check cached OpenRouter models
     if "openrouter" in _model_cache:
@@ -263,6 +263,8 @@ class Settings(BaseSettings):
 
     Attributes:
         DATABASE_URL: Database connection string (SQLite or PostgreSQL)
+        DB_POOL_SIZE: Persistent connections kept in the PostgreSQL pool
+        DB_MAX_OVERFLOW: Extra connections allowed above the pool size
         GOOGLE_API_KEY: Google AI API key for Gemini models
         OPENROUTER_API_KEY: OpenRouter API key for multi-model access
         PRIMARY_PROVIDER: Primary LLM provider (google or openrouter)
@@ -284,6 +286,16 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./timepoint.db",
         description="Database connection string",
     )
+    DB_POOL_SIZE: int = Field(
+        default=20,
+        description="Connection pool size (PostgreSQL only)",
+        ge=1,
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        description="Connections allowed above the pool size (PostgreSQL only)",
+        ge=0,
+    )
 
     # Provider API Keys
     GOOGLE_API_KEY: str | None = Field(
@@ -378,6 +390,11 @@ class Settings(BaseSettings):
         """Check if using SQLite database."""
         return self.DATABASE_URL.startswith("sqlite")
 
+    @property
+    def is_memory_db(self) -> bool:
+        """Check if using an in-memory SQLite database."""
+        return self.is_sqlite and ":memory:" in self.DATABASE_URL
+
     @property
     def detected_provider(self) -> ProviderType:
         """Auto-detect primary provider based on available API keys.
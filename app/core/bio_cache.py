@@ -0,0 +1,26 @@
+"""Response cache for character bio generation.
+
+Character bios for recurring historical figures are requested again and
+again with identical prompts (same figure, scene, cast and model). This
+module holds the process-wide ResultCache for those bios, so repeat
+requests skip the LLM round-trip.
+
+Examples:
+    >>> from app.core.bio_cache import bio_cache
+    >>> key = {"model": "gemini-2.5-flash", "prompt": prompt}
+    >>> cached = bio_cache.get(key)
+    >>> if cached is None:
+    ...     bio_cache.put(key, character, model_used="gemini-2.5-flash")
+
+Tests:
+    - tests/unit/test_character_parallel.py
+"""
+
+from app.core.result_cache import ResultCache
+
+# Cache limits
+BIO_CACHE_MAX_ENTRIES = 512
+BIO_CACHE_TTL_SECONDS = 3600.0
+
+# Global cache instance
+bio_cache = ResultCache(max_entries=BIO_CACHE_MAX_ENTRIES, ttl_seconds=BIO_CACHE_TTL_SECONDS)
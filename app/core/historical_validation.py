@@ -21,7 +21,13 @@ Tests:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import bisect
+import functools
+import itertools
+import re
+import sys
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field, replace
 from typing import NamedTuple
 
 
@@ -75,9 +81,25 @@ ERAS = [
 ]
 
 
+# Lookup tables for get_era_for_year, built once at import.
+# Eras are sorted by start year so candidates can be found with bisect. Each
+# row is (ERAS index, name, end, region_lower) with regions lowercased up
+# front; the index keeps overlapping eras resolving in ERAS order.
+_ERAS_SORTED = sorted(enumerate(ERAS), key=lambda item: item[1].start)
+_ERA_STARTS = tuple(era.start for _, era in _ERAS_SORTED)
+_ERAS_PRECOMPUTED: tuple[tuple[int, str, int, str], ...] = tuple(
+    (index, era.name, era.end, era.region.lower() if era.region else "")
+    for index, era in _ERAS_SORTED
+)
+_MAX_ERA_SPAN = max(era.end - era.start for era in ERAS)
+
+
+@functools.lru_cache(maxsize=4096)
 def get_era_for_year(year: int, location: str | None = None) -> str | None:
     """Determine the historical era for a given year and location.
 
+    When eras overlap, the first matching entry in ERAS wins.
+
     Args:
         year: The year (negative for BCE)
         location: Optional location hint
@@ -85,19 +107,91 @@ def get_era_for_year(year: int, location: str | None = None) -> str | None:
     Returns:
         Era name or None if no match
     """
-    location_lower = (location or "").lower()
-
-    for era in ERAS:
-        if era.start <= year <= era.end:
+    loc = location.lower() if location else ""
+
+    best_index: int | None = None
+    best_name: str | None = None
+
+    # Walk back from the last era starting at or before `year`; no era
+    # starting earlier than year - _MAX_ERA_SPAN can still be in range.
+    i = bisect.bisect_right(_ERA_STARTS, year) - 1
+    earliest_start = year - _MAX_ERA_SPAN
+    while i >= 0 and _ERA_STARTS[i] >= earliest_start:
+        index, name, end, region_lower = _ERAS_PRECOMPUTED[i]
+        if year <= end and (best_index is None or index < best_index):
             # Check regional match if specified
-            if era.region:
-                region_lower = era.region.lower()
-                if region_lower in location_lower or not location:
-                    return era.name
-            else:
-                return era.name
+            if not region_lower or not loc or region_lower in loc:
+                best_index = index
+                best_name = name
+        i -= 1
+
+    return best_name
+
+
+def get_eras_for_years(
+    years: Sequence[int],
+    locations: Sequence[str | None] | None = None,
+) -> list[str | None]:
+    """Determine the historical era for a batch of years.
+
+    Equivalent to calling get_era_for_year for each pair, but resolves
+    each distinct (year, location) pair only once.
+
+    Args:
+        years: Years to look up (negative for BCE)
+        locations: Optional location hints, parallel to `years`
+
+    Returns:
+        Era names (or None) in the same order as `years`
+
+    Raises:
+        ValueError: If `locations` and `years` differ in length
+    """
+    if locations is None:
+        locations = [None] * len(years)
+    elif len(locations) != len(years):
+        raise ValueError("years and locations must have the same length")
+
+    resolved: dict[tuple[int, str | None], str | None] = {}
+    results = []
+    for pair in zip(years, locations, strict=True):
+        if pair not in resolved:
+            resolved[pair] = get_era_for_year(*pair)
+        results.append(resolved[pair])
+    return results
 
-    return None
+
+def _normalize_terms(terms: Iterable[str]) -> tuple[str, ...]:
+    """Lowercase and intern lookup terms once at import.
+
+    Matching code can then compare module data without re-lowercasing it.
+    """
+    return tuple(sys.intern(term.lower()) for term in terms)
+
+
+def _compile_term_scanner(
+    terms: Iterable[str],
+) -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """Compile terms into a single pattern that finds them as substrings.
+
+    The pattern is a zero-width lookahead so a match is attempted at every
+    position (overlapping terms are all seen). Alternatives are ordered
+    longest first, so each hit is the longest term at that position; the
+    returned table maps it to every term it starts with (itself included).
+
+    Args:
+        terms: Lowercase terms to scan for
+
+    Returns:
+        Tuple of (pattern for findall, longest-hit -> matched terms table)
+    """
+    ordered = sorted(set(terms), key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, ordered)) + "))")
+    table = {
+        term: frozenset(prefix for prefix in ordered if term.startswith(prefix))
+        for term in ordered
+    }
+    return pattern, table
 
 
 # ==============================================================================
@@ -105,54 +199,54 @@ def get_era_for_year(year: int, location: str | None = None) -> str | None:
 # ==============================================================================
 
 # Elements to EXCLUDE for each era (prevents concept bleed from similar periods)
-ERA_NEGATIVE_PROMPTS: dict[str, list[str]] = {
+ERA_NEGATIVE_PROMPTS: dict[str, tuple[str, ...]] = {
     # Ancient Greece - exclude Roman and Egyptian elements
-    "ancient_greece": [
+    "ancient_greece": (
         "roman toga", "roman armor", "gladiator", "colosseum",
         "egyptian hieroglyphics", "pharaoh", "pyramid",
         "medieval armor", "knights", "castles",
-    ],
+    ),
 
     # Roman Republic/Empire - exclude Greek idealization and medieval
-    "roman_republic": [
+    "roman_republic": (
         "greek idealized", "parthenon", "greek columns only",
         "medieval armor", "knights", "castles", "chainmail",
         "renaissance clothing", "doublet",
-    ],
-    "roman_empire": [
+    ),
+    "roman_empire": (
         "medieval armor", "knights", "castles", "chainmail",
         "renaissance clothing", "viking helmet",
-    ],
+    ),
 
     # Medieval - exclude ancient and early modern
-    "early_medieval": [
+    "early_medieval": (
         "roman toga", "greek chiton", "plate armor", "full plate",
         "renaissance doublet", "ruff collar", "musket", "firearm",
-    ],
-    "high_medieval": [
+    ),
+    "high_medieval": (
         "roman toga", "greek chiton", "renaissance doublet",
         "ruff collar", "musket", "firearm", "tricorn hat",
-    ],
-    "late_medieval": [
+    ),
+    "late_medieval": (
         "roman toga", "greek chiton", "musket",
         "tricorn hat", "powdered wig", "bicorne hat",
-    ],
+    ),
 
     # Tudor - exclude Stuart and earlier
-    "tudor_england": [
+    "tudor_england": (
         "powdered wig", "tricorn hat", "roman toga",
         "medieval chainmail", "plate armor on civilians",
         "cavalier hat", "restoration fashion",
-    ],
+    ),
 
     # Stuart - exclude Tudor and Georgian
-    "stuart_england": [
+    "stuart_england": (
         "tudor ruff", "elizabethan collar", "powdered wig",
         "tricorn hat", "georgian fashion", "roman toga",
-    ],
+    ),
 
     # French Revolution (1789-1799) - CRITICAL: exclude Roman/Napoleonic
-    "french_revolution": [
+    "french_revolution": (
         # Roman elements (major source of confusion)
         "roman toga", "ancient toga", "roman sandals", "ancient sandals",
         "laurel wreath", "laurel crown", "roman senator",
@@ -171,10 +265,10 @@ ERA_NEGATIVE_PROMPTS: dict[str, list[str]] = {
         # Anachronistic elements
         "electric lighting", "gas lamp", "photograph", "camera",
         "industrial machinery", "steam engine",
-    ],
+    ),
 
     # Napoleonic Era (1799-1815) - exclude Revolutionary and Roman
-    "napoleonic": [
+    "napoleonic": (
         # Revolutionary elements (pre-1799)
         "sans-culottes", "phrygian cap red", "revolutionary tribunal",
         "jacobin", "guillotine scene",
@@ -186,44 +280,67 @@ ERA_NEGATIVE_PROMPTS: dict[str, list[str]] = {
         # Victorian elements (post-1815)
         "top hat", "victorian dress", "crinoline", "bustle",
         "gaslight", "industrial factory",
-    ],
+    ),
 
     # American Revolution - exclude French Revolution specifics
-    "american_revolution": [
+    "american_revolution": (
         "french revolutionary", "jacobin", "phrygian cap",
         "sans-culottes", "guillotine", "bastille",
         "napoleonic uniform", "bicorne napoleon",
         "roman toga", "ancient greek",
-    ],
+    ),
 
     # Victorian Era - exclude earlier and Edwardian
-    "victorian": [
+    "victorian": (
         "georgian wig", "powdered wig", "tricorn hat",
         "medieval armor", "renaissance doublet",
         "edwardian motoring", "automobile", "airplane",
         "electric streetlight", "neon",
-    ],
+    ),
 
     # WWI - exclude WWII equipment
-    "world_war_1": [
+    "world_war_1": (
         "m1 helmet", "stahlhelm ww2", "german ww2 uniform",
         "sherman tank", "tiger tank", "jet aircraft",
         "radar dish", "atomic symbol",
         "victorian dress", "top hat civilian",
-    ],
+    ),
 
     # WWII - exclude WWI and Cold War
-    "world_war_2": [
+    "world_war_2": (
         "brodie helmet", "pickelhaube", "ww1 biplane",
         "cavalry charge", "horse cavalry combat",
         "jet fighter modern", "helicopter combat",
         "nuclear missile", "space satellite",
         "smartphone", "computer monitor",
-    ],
+    ),
 }
 
+# Used when the era is unknown
+DEFAULT_NEGATIVE_PROMPTS: tuple[str, ...] = (
+    "anachronistic elements",
+    "modern technology",
+    "contemporary clothing",
+)
+
+ERA_NEGATIVE_PROMPTS.update(
+    {era: _normalize_terms(prompts) for era, prompts in ERA_NEGATIVE_PROMPTS.items()}
+)
+DEFAULT_NEGATIVE_PROMPTS = _normalize_terms(DEFAULT_NEGATIVE_PROMPTS)
+
+# Deduplicated, comma-joined prompts per era (combined prompt with no risk extension)
+ERA_NEGATIVE_JOINED: dict[str, str] = {
+    era: ", ".join(dict.fromkeys(prompts)) for era, prompts in ERA_NEGATIVE_PROMPTS.items()
+}
+DEFAULT_NEGATIVE_JOINED = ", ".join(dict.fromkeys(DEFAULT_NEGATIVE_PROMPTS))
+
+# Key items borrowed from a commonly confused era (see get_combined_negative_prompt)
+ERA_TOP5: dict[str, tuple[str, ...]] = {
+    era: prompts[:5] for era, prompts in ERA_NEGATIVE_PROMPTS.items()
+}
 
-def get_era_negative_prompts(year: int, location: str | None = None) -> list[str]:
+
+def get_era_negative_prompts(year: int, location: str | None = None) -> Sequence[str]:
     """Get negative prompts appropriate for the given year and location.
 
     Args:
@@ -231,32 +348,31 @@ def get_era_negative_prompts(year: int, location: str | None = None) -> list[str
         location: Optional location hint
 
     Returns:
-        List of elements to exclude from image generation
+        Elements to exclude from image generation (shared; do not mutate)
     """
-    era = get_era_for_year(year, location)
+    return _negative_prompts_for_era(get_era_for_year(year, location))
 
+
+def _negative_prompts_for_era(era: str | None) -> Sequence[str]:
+    """Negative prompts for an already-resolved era."""
     if era and era in ERA_NEGATIVE_PROMPTS:
-        return ERA_NEGATIVE_PROMPTS[era].copy()
+        return ERA_NEGATIVE_PROMPTS[era]
 
     # Default negative prompts for unknown eras
-    return [
-        "anachronistic elements",
-        "modern technology",
-        "contemporary clothing",
-    ]
+    return DEFAULT_NEGATIVE_PROMPTS
 
 
 # ==============================================================================
 # Commonly Confused Periods Detection
 # ==============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConfusionRisk:
     """Represents a risk of era confusion."""
     target_era: str
     confused_with: str
     risk_level: float  # 0-1
-    distinguishing_features: list[str]
+    distinguishing_features: tuple[str, ...]
     warning: str
 
 
@@ -266,13 +382,13 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="french_revolution",
         confused_with="roman_republic",
         risk_level=0.9,
-        distinguishing_features=[
+        distinguishing_features=(
             "French 1790s dress coat and breeches (NOT toga)",
             "Powdered wigs or natural hair (NOT laurel wreaths)",
             "Indoor legislative chamber (NOT outdoor forum)",
             "Chandeliers and candles (NOT torches)",
             "French tricolor cockade (NOT Roman eagle)",
-        ],
+        ),
         warning="CRITICAL: French Revolution scenes often drift toward Roman imagery. "
                 "The Death of Marat and Jacques-Louis David's neoclassical style causes "
                 "AI models to confuse 1790s France with ancient Rome. "
@@ -282,12 +398,12 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="french_revolution",
         confused_with="napoleonic",
         risk_level=0.7,
-        distinguishing_features=[
+        distinguishing_features=(
             "Revolutionary cockade (NOT imperial eagle)",
             "Sans-culottes or bourgeois dress (NOT military uniform dominant)",
             "Directoire fashion for women (NOT empire waist)",
             "Pre-1799 setting",
-        ],
+        ),
         warning="Distinguish Revolutionary period (1789-1799) from Napoleonic era (1799-1815). "
                 "Revolutionary dress differs significantly from Imperial military uniforms."
     ),
@@ -295,12 +411,12 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="american_revolution",
         confused_with="french_revolution",
         risk_level=0.6,
-        distinguishing_features=[
+        distinguishing_features=(
             "Blue Continental Army coats (NOT French blue)",
             "American tricorn style (NOT French styles)",
             "Colonial architecture (NOT French neoclassical)",
             "English language documents (NOT French)",
-        ],
+        ),
         warning="American and French Revolutions have different aesthetics despite "
                 "occurring in the same era. American colonial vs French neoclassical."
     ),
@@ -308,13 +424,13 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="world_war_1",
         confused_with="world_war_2",
         risk_level=0.8,
-        distinguishing_features=[
+        distinguishing_features=(
             "Brodie/Adrian/Stahlhelm (NOT M1/later Stahlhelm)",
             "Trench warfare setting (NOT mobile warfare)",
             "Bolt-action rifles dominant (NOT semi-auto)",
             "Biplanes (NOT monoplanes)",
             "No tanks early war, primitive tanks later",
-        ],
+        ),
         warning="WWI and WWII have distinct equipment, uniforms, and warfare styles. "
                 "WWI: trenches, biplanes, primitive tanks. WWII: mobile warfare, "
                 "advanced aircraft, iconic tanks."
@@ -323,12 +439,12 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="tudor_england",
         confused_with="stuart_england",
         risk_level=0.7,
-        distinguishing_features=[
+        distinguishing_features=(
             "Tudor: Large ruffs, doublets, codpieces",
             "Stuart: Cavalier hats, falling collars, looser cuts",
             "Tudor: Flat caps, gable hoods",
             "Stuart: Wide-brimmed hats, natural hair/wigs",
-        ],
+        ),
         warning="Tudor (1485-1603) and Stuart (1603-1714) fashion differs significantly. "
                 "Ruffs and doublets vs cavalier style."
     ),
@@ -336,18 +452,33 @@ CONFUSION_PAIRS: list[ConfusionRisk] = [
         target_era="ancient_greece",
         confused_with="roman_republic",
         risk_level=0.7,
-        distinguishing_features=[
+        distinguishing_features=(
             "Greek: Chiton and himation (NOT toga)",
             "Greek: Hoplite armor with round shield (NOT rectangular scutum)",
             "Greek: Column styles (Doric, Ionic, Corinthian)",
             "Roman: Toga with specific draping, different armor",
-        ],
+        ),
         warning="Greek and Roman cultures have distinct dress, armor, and architecture "
                 "despite both being 'ancient classical.'"
     ),
 ]
 
 
+def _index_confusion_pairs() -> dict[str, tuple[ConfusionRisk, ...]]:
+    """Group CONFUSION_PAIRS by target era, highest risk first."""
+    by_era: dict[str, list[ConfusionRisk]] = {}
+    for pair in CONFUSION_PAIRS:
+        by_era.setdefault(pair.target_era, []).append(pair)
+    return {
+        era: tuple(sorted(pairs, key=lambda r: r.risk_level, reverse=True))
+        for era, pairs in by_era.items()
+    }
+
+
+# Confusion risks per target era, pre-sorted by risk level
+CONFUSION_PAIRS_BY_ERA: dict[str, tuple[ConfusionRisk, ...]] = _index_confusion_pairs()
+
+
 def detect_confusion_risks(
     year: int,
     location: str | None = None,
@@ -363,25 +494,22 @@ def detect_confusion_risks(
     Returns:
         List of ConfusionRisk objects for potential confusions
     """
-    era = get_era_for_year(year, location)
+    return _confusion_risks_for_era(get_era_for_year(year, location))
+
+
+def _confusion_risks_for_era(era: str | None) -> list[ConfusionRisk]:
+    """Confusion risks for an already-resolved era."""
     if not era:
         return []
 
-    risks = []
-    for pair in CONFUSION_PAIRS:
-        if pair.target_era == era:
-            risks.append(pair)
-
-    # Sort by risk level
-    risks.sort(key=lambda r: r.risk_level, reverse=True)
-    return risks
+    return list(CONFUSION_PAIRS_BY_ERA.get(era, ()))
 
 
 # ==============================================================================
 # Famous Scene / Artwork Detection
 # ==============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FamousSceneReference:
     """A famous historical artwork or scene that may cause drift."""
     name: str
@@ -389,7 +517,7 @@ class FamousSceneReference:
     year_created: int | None
     depicts_era: str
     depicts_year_approx: int
-    visual_elements: list[str]
+    visual_elements: tuple[str, ...]
     correction_guidance: str
 
 
@@ -401,7 +529,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1806,
         depicts_era="roman_republic",
         depicts_year_approx=-44,
-        visual_elements=["toga", "roman senate", "stabbing", "marble columns"],
+        visual_elements=("toga", "roman senate", "stabbing", "marble columns"),
         correction_guidance="If depicting a non-Roman assassination, explicitly specify "
                            "the correct period dress and architecture. Avoid toga imagery."
     ),
@@ -411,7 +539,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1851,
         depicts_era="american_revolution",
         depicts_year_approx=1776,
-        visual_elements=["boat", "ice", "flag", "standing figure"],
+        visual_elements=("boat", "ice", "flag", "standing figure"),
         correction_guidance="This composition often bleeds into other river crossing scenes. "
                            "Specify exact historical context and period details."
     ),
@@ -421,7 +549,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1793,
         depicts_era="french_revolution",
         depicts_year_approx=1793,
-        visual_elements=["bathtub", "letter", "wound", "neoclassical simplicity"],
+        visual_elements=("bathtub", "letter", "wound", "neoclassical simplicity"),
         correction_guidance="David's neoclassical style may pull generation toward Roman "
                            "aesthetics. Explicitly request French Revolutionary dress."
     ),
@@ -431,7 +559,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1784,
         depicts_era="roman_republic",
         depicts_year_approx=-669,
-        visual_elements=["three swords", "raised arms", "roman architecture", "toga"],
+        visual_elements=("three swords", "raised arms", "roman architecture", "toga"),
         correction_guidance="This iconic pose with raised swords may appear in non-Roman "
                            "oath scenes. Specify correct period if not Roman."
     ),
@@ -441,7 +569,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1830,
         depicts_era="french_revolution",  # Actually July Revolution, but often confused
         depicts_year_approx=1830,
-        visual_elements=["woman with flag", "barricade", "tricolor", "bare chest"],
+        visual_elements=("woman with flag", "barricade", "tricolor", "bare chest"),
         correction_guidance="Often conflated with 1789 Revolution. This depicts 1830 "
                            "July Revolution. Different fashion and context."
     ),
@@ -451,7 +579,7 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1801,
         depicts_era="napoleonic",
         depicts_year_approx=1800,
-        visual_elements=["rearing horse", "pointing upward", "red cape", "bicorne"],
+        visual_elements=("rearing horse", "pointing upward", "red cape", "bicorne"),
         correction_guidance="Iconic Napoleon imagery may bleed into other mounted leader "
                            "portraits. Specify correct leader and period."
     ),
@@ -461,13 +589,50 @@ FAMOUS_SCENES: list[FamousSceneReference] = [
         year_created=1819,
         depicts_era="american_revolution",
         depicts_year_approx=1776,
-        visual_elements=["men at table", "document", "colonial dress", "formal gathering"],
+        visual_elements=("men at table", "document", "colonial dress", "formal gathering"),
         correction_guidance="This formal signing scene composition may appear in other "
                            "document-signing moments. Specify exact historical context."
     ),
 ]
 
 
+# Query keywords that suggest each famous scene (matched as substrings)
+FAMOUS_SCENE_KEYWORDS: dict[tuple[str, ...], str] = {
+    ("caesar", "assassination", "ides", "march", "stabbing", "senate"): "Death of Caesar",
+    ("crossing", "delaware", "washington", "boat", "river"): "Washington Crossing the Delaware",
+    ("marat", "bathtub", "assassination", "charlotte"): "Death of Marat",
+    ("oath", "sword", "brothers", "horatii"): "Oath of the Horatii",
+    ("liberty", "barricade", "leading", "flag"): "Liberty Leading the People",
+    ("napoleon", "alps", "horse", "crossing"): "Napoleon Crossing the Alps",
+    ("declaration", "independence", "signing", "trumbull"): "Signing of the Declaration of Independence",
+}
+
+SCENES_BY_NAME: dict[str, FamousSceneReference] = {scene.name: scene for scene in FAMOUS_SCENES}
+
+
+def _build_scene_matcher() -> tuple[re.Pattern[str], dict[str, frozenset[str]]]:
+    """Compile all scene keywords into a single scanning pattern.
+
+    Returns the scanner pattern and a table mapping each hit to the scenes
+    of every keyword it covers (see _compile_term_scanner).
+    """
+    scenes_by_keyword: dict[str, set[str]] = {}
+    for keywords, scene_name in FAMOUS_SCENE_KEYWORDS.items():
+        for kw in keywords:
+            scenes_by_keyword.setdefault(kw, set()).add(scene_name)
+
+    pattern, covered = _compile_term_scanner(scenes_by_keyword)
+    table = {
+        kw: frozenset().union(*(scenes_by_keyword[term] for term in terms))
+        for kw, terms in covered.items()
+    }
+    return pattern, table
+
+
+_SCENE_PATTERN, _SCENES_FOR_KEYWORD = _build_scene_matcher()
+_SCENE_ORDER = tuple(FAMOUS_SCENE_KEYWORDS.values())
+
+
 def detect_famous_scene_risks(query: str, year: int) -> list[FamousSceneReference]:
     """Detect if query might drift toward famous artwork compositions.
 
@@ -478,28 +643,20 @@ def detect_famous_scene_risks(query: str, year: int) -> list[FamousSceneReferenc
     Returns:
         List of potentially influential famous scenes
     """
-    query_lower = query.lower()
-    risks = []
-
-    # Keyword detection
-    keywords_to_scenes = {
-        ("caesar", "assassination", "ides", "march", "stabbing", "senate"): "Death of Caesar",
-        ("crossing", "delaware", "washington", "boat", "river"): "Washington Crossing the Delaware",
-        ("marat", "bathtub", "assassination", "charlotte"): "Death of Marat",
-        ("oath", "sword", "brothers", "horatii"): "Oath of the Horatii",
-        ("liberty", "barricade", "leading", "flag"): "Liberty Leading the People",
-        ("napoleon", "alps", "horse", "crossing"): "Napoleon Crossing the Alps",
-        ("declaration", "independence", "signing", "trumbull"): "Signing of the Declaration of Independence",
-    }
+    return list(_famous_scene_risks(query.lower()))
 
-    for keywords, scene_name in keywords_to_scenes.items():
-        if any(kw in query_lower for kw in keywords):
-            for scene in FAMOUS_SCENES:
-                if scene.name == scene_name:
-                    risks.append(scene)
-                    break
 
-    return risks
+@functools.lru_cache(maxsize=1024)
+def _famous_scene_risks(query_lower: str) -> tuple[FamousSceneReference, ...]:
+    """Cached core of detect_famous_scene_risks.
+
+    Takes the already-lowercased query, so case variants share an entry.
+    """
+    # Keyword detection - one pass over the query for all scenes
+    keywords = set(_SCENE_PATTERN.findall(query_lower))
+    hits = frozenset().union(*map(_SCENES_FOR_KEYWORD.__getitem__, keywords))
+
+    return tuple(SCENES_BY_NAME[name] for name in _SCENE_ORDER if name in hits)
 
 
 # ==============================================================================
@@ -563,7 +720,7 @@ MUTUAL_EXCLUSIONS: list[tuple[set[str], set[str], str]] = [
 ]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExclusionViolation:
     """A detected mutual exclusion violation."""
     element_a: str
@@ -571,26 +728,69 @@ class ExclusionViolation:
     reason: str
 
 
-def check_mutual_exclusions(elements: list[str]) -> list[ExclusionViolation]:
+MUTUAL_EXCLUSIONS[:] = [
+    (set(_normalize_terms(set_a)), set(_normalize_terms(set_b)), reason)
+    for set_a, set_b, reason in MUTUAL_EXCLUSIONS
+]
+
+
+def _index_mutual_exclusions() -> dict[str, tuple[int, ...]]:
+    """Map each element in MUTUAL_EXCLUSIONS to the rules that mention it."""
+    index: dict[str, list[int]] = {}
+    for i, (set_a, set_b, _) in enumerate(MUTUAL_EXCLUSIONS):
+        for element in set_a | set_b:
+            index.setdefault(element, []).append(i)
+    return {element: tuple(rules) for element, rules in index.items()}
+
+
+# Inverted index: element -> indices of MUTUAL_EXCLUSIONS rules containing it
+ELEMENT_TO_RULES: dict[str, tuple[int, ...]] = _index_mutual_exclusions()
+
+# Finds every exclusion term inside free-text element descriptions
+_EXCLUSION_PATTERN, _EXCLUSION_TERMS_FOR_HIT = _compile_term_scanner(ELEMENT_TO_RULES)
+
+
+def _outermost_terms(terms: set[str]) -> list[str]:
+    """Drop terms contained in a longer found term ("toga" in "roman toga")."""
+    return sorted(
+        term for term in terms
+        if not any(term != other and term in other for other in terms)
+    )
+
+
+def check_mutual_exclusions(elements: Sequence[str]) -> list[ExclusionViolation]:
     """Check if a list of elements contains mutually exclusive items.
 
+    Elements may be short tags ("toga") or free-text descriptions ("a
+    senator in a roman toga"); any rule term appearing inside an element
+    counts as present.
+
     Args:
-        elements: List of visual elements to check
+        elements: Visual elements to check
 
     Returns:
         List of violations found
     """
-    elements_lower = {e.lower() for e in elements}
-    violations = []
+    # One scan over all elements; newlines keep terms from spanning two
+    text = "\n".join(elements).lower()
+    found: set[str] = set()
+    for hit in set(_EXCLUSION_PATTERN.findall(text)):
+        found |= _EXCLUSION_TERMS_FOR_HIT[hit]
 
-    for set_a, set_b, reason in MUTUAL_EXCLUSIONS:
-        found_a = elements_lower & set_a
-        found_b = elements_lower & set_b
+    # Only rules mentioning at least one found term can be violated
+    candidate_rules = {i for term in found for i in ELEMENT_TO_RULES[term]}
+
+    violations = []
+    for i in sorted(candidate_rules):
+        set_a, set_b, reason = MUTUAL_EXCLUSIONS[i]
+        found_a = found & set_a
+        found_b = found & set_b
 
         if found_a and found_b:
+            # The scanner reports nested terms too; name only the outermost
             violations.append(ExclusionViolation(
-                element_a=", ".join(found_a),
-                element_b=", ".join(found_b),
+                element_a=", ".join(_outermost_terms(found_a)),
+                element_b=", ".join(_outermost_terms(found_b)),
                 reason=reason,
             ))
 
@@ -616,29 +816,35 @@ class HistoricalValidationResult:
 
     def get_combined_negative_prompt(self) -> str:
         """Get all negative prompts as a single string."""
-        all_negatives = self.negative_prompts.copy()
-
-        # Add warnings from confusion risks
-        for risk in self.confusion_risks:
-            if risk.risk_level > 0.7:
-                # Add the confused-with era's typical elements
-                confused_era = risk.confused_with
-                if confused_era in ERA_NEGATIVE_PROMPTS:
-                    # Get a few key items from the confused era
-                    all_negatives.extend(ERA_NEGATIVE_PROMPTS[confused_era][:5])
-
-        # Deduplicate
-        seen = set()
-        unique = []
-        for item in all_negatives:
-            if item.lower() not in seen:
-                seen.add(item.lower())
-                unique.append(item)
-
-        return ", ".join(unique)
+        return self.combined_negative_prompt
 
     def get_distinguishing_guidance(self) -> str:
         """Get guidance on how to distinguish from confused eras."""
+        return self.distinguishing_guidance
+
+    @functools.cached_property
+    def combined_negative_prompt(self) -> str:
+        """All negative prompts as a single string (computed once)."""
+        high_risks = [risk for risk in self.confusion_risks if risk.risk_level > 0.7]
+
+        # Common case: the era's own prompts, already joined at import
+        if not high_risks and tuple(self.negative_prompts) == _negative_prompts_for_era(self.era):
+            return ERA_NEGATIVE_JOINED.get(self.era or "", DEFAULT_NEGATIVE_JOINED)
+
+        all_negatives: list[str] = [*self.negative_prompts]
+
+        # Add a few key items from each commonly confused era
+        for risk in high_risks:
+            all_negatives.extend(ERA_TOP5.get(risk.confused_with, ()))
+
+        # Deduplicate case-insensitively, keeping each item's first spelling
+        keys = list(map(str.lower, all_negatives))
+        first_spelling = dict(zip(reversed(keys), reversed(all_negatives), strict=True))
+        return ", ".join(first_spelling[key] for key in dict.fromkeys(keys))
+
+    @functools.cached_property
+    def distinguishing_guidance(self) -> str:
+        """Guidance on how to distinguish from confused eras (computed once)."""
         if not self.confusion_risks:
             return ""
 
@@ -660,6 +866,9 @@ def validate_historical_scene(
 ) -> HistoricalValidationResult:
     """Perform comprehensive historical validation.
 
+    Results are memoized per (year, location, query, visual_elements);
+    each call gets its own result with fresh lists.
+
     Args:
         year: The target year
         location: Optional location hint
@@ -669,37 +878,86 @@ def validate_historical_scene(
     Returns:
         HistoricalValidationResult with all validation data
     """
+    cached = _validate_historical_scene(
+        year, location, query, tuple(visual_elements) if visual_elements else ()
+    )
+    return _copy_result(cached)
+
+
+def validate_many(
+    items: Iterable[tuple[int, str | None, str]],
+) -> list[HistoricalValidationResult]:
+    """Validate a batch of scenes, e.g. every event on a timeline.
+
+    Each distinct (year, location, query) is validated once, however large
+    the batch; every item still gets its own result.
+
+    Args:
+        items: (year, location, query) tuples
+
+    Returns:
+        HistoricalValidationResult per item, in input order
+    """
+    validated: dict[tuple[int, str | None, str], HistoricalValidationResult] = {}
+    results = []
+    for item in items:
+        cached = validated.get(item)
+        if cached is None:
+            cached = validated[item] = _validate_historical_scene(*item, ())
+        results.append(_copy_result(cached))
+    return results
+
+
+def _copy_result(cached: HistoricalValidationResult) -> HistoricalValidationResult:
+    """Give a caller its own copy of a shared validation result."""
+    return replace(
+        cached,
+        negative_prompts=list(cached.negative_prompts),
+        confusion_risks=list(cached.confusion_risks),
+        famous_scene_risks=list(cached.famous_scene_risks),
+        exclusion_violations=list(cached.exclusion_violations),
+        accuracy_warnings=list(cached.accuracy_warnings),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_historical_scene(
+    year: int,
+    location: str | None,
+    query: str,
+    visual_elements: tuple[str, ...],
+) -> HistoricalValidationResult:
+    """Cached core of validate_historical_scene.
+
+    The returned result is shared between callers and must not be mutated.
+    """
+    # Resolve the era once and share it with every check
     era = get_era_for_year(year, location)
-    negative_prompts = get_era_negative_prompts(year, location)
-    confusion_risks = detect_confusion_risks(year, location, query)
-    famous_scene_risks = detect_famous_scene_risks(query, year)
+    negative_prompts = list(_negative_prompts_for_era(era))
+    confusion_risks = _confusion_risks_for_era(era)
+    famous_scene_risks = list(_famous_scene_risks(query.lower()))
 
     # Check exclusions if elements provided
     exclusion_violations = []
     if visual_elements:
         exclusion_violations = check_mutual_exclusions(visual_elements)
 
-    # Calculate confidence score
-    confidence = 1.0
-    if confusion_risks:
-        # Reduce confidence based on confusion risk
-        max_risk = max(r.risk_level for r in confusion_risks)
-        confidence -= max_risk * 0.3
-    if famous_scene_risks:
-        confidence -= 0.1 * len(famous_scene_risks)
-    if exclusion_violations:
-        confidence -= 0.2 * len(exclusion_violations)
-    confidence = max(0.1, confidence)
+    # Calculate confidence score; confusion risks are sorted highest first
+    max_risk = confusion_risks[0].risk_level if confusion_risks else 0.0
+    confidence = max(
+        0.1,
+        1.0
+        - max_risk * 0.3
+        - 0.1 * len(famous_scene_risks)
+        - 0.2 * len(exclusion_violations),
+    )
 
     # Generate warnings
-    warnings = []
-    for risk in confusion_risks:
-        if risk.risk_level > 0.6:
-            warnings.append(risk.warning)
-    for scene in famous_scene_risks:
-        warnings.append(scene.correction_guidance)
-    for violation in exclusion_violations:
-        warnings.append(f"EXCLUSION VIOLATION: {violation.reason}")
+    warnings = list(itertools.chain(
+        (risk.warning for risk in confusion_risks if risk.risk_level > 0.6),
+        (scene.correction_guidance for scene in famous_scene_risks),
+        (f"EXCLUSION VIOLATION: {violation.reason}" for violation in exclusion_violations),
+    ))
 
     return HistoricalValidationResult(
         year=year,
@@ -0,0 +1,107 @@
+"""In-flight request batching for LLM calls.
+
+Groups concurrent, identical LLM requests so that only one upstream call is
+made and its result is fanned out to every waiter. Used by LLMRouter so that
+parallel agent fan-outs (e.g. character bios) never pay for duplicate calls.
+
+Examples:
+    >>> batcher = LLMRequestBatcher()
+    >>> key = ("Character", "prompt text", "system text")
+    >>> result = await batcher.submit(key, lambda: router_call(...))
+
+Tests:
+    - tests/unit/test_llm_batcher.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _Flight:
+    """A running request and the number of callers awaiting it."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+class LLMRequestBatcher:
+    """Coalesce identical concurrent requests into a single call.
+
+    The first caller for a key starts the call; callers arriving with the
+    same key while it is in flight await the same result. Once the call
+    finishes the key is released, so results are never cached. If every
+    waiter is cancelled, the call is cancelled too.
+
+    Attributes:
+        in_flight: Number of distinct requests currently running
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batcher."""
+        self._in_flight: dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently running."""
+        return len(self._in_flight)
+
+    async def submit(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[T]],
+        copy: Callable[[T], T] | None = None,
+    ) -> T:
+        """Run `call` once per key among concurrent submitters.
+
+        Args:
+            key: Hashable identity of the request
+            call: Zero-argument factory producing the upstream awaitable
+            copy: Optional copier for shared results. When given, only the
+                last waiter to resume receives the original result; every
+                other waiter receives a copy, so callers may mutate what
+                they receive.
+
+        Returns:
+            The result of the (possibly shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._in_flight[key] = flight
+            flight.task.add_done_callback(lambda done: self._release(key, done))
+        else:
+            logger.debug("Joining in-flight LLM request")
+
+        flight.waiters += 1
+        try:
+            # Shield so one cancelled waiter doesn't cancel the call for the others
+            result = await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Last waiter left early: nobody needs the result any more
+                flight.task.cancel()
+                self._release(key, flight.task)
+
+        if copy is not None and flight.waiters > 0:
+            return copy(result)
+        return result
+
+    def _release(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """Forget a finished or abandoned request."""
+        flight = self._in_flight.get(key)
+        if flight is not None and flight.task is task:
+            del self._in_flight[key]
@@ -46,6 +46,7 @@ from app.config import (
     get_settings,
     get_tier_max_concurrent,
 )
+from app.core.llm_batcher import LLMRequestBatcher
 from app.core.rate_limiter import acquire_rate_limit, get_tier_from_model
 from app.core.providers import (
     LLMProvider,
@@ -213,6 +214,9 @@ class LLMRouter:
         self.config = config
         self.providers: dict[ProviderType, LLMProvider] = {}
 
+        # Shares identical concurrent structured calls (e.g. parallel agents)
+        self._batcher = LLMRequestBatcher()
+
         # Initialize providers
         self._init_providers(settings)
 
@@ -685,6 +689,30 @@ class LLMRouter:
             ... )
             >>> print(response.content.location)
         """
+        key = (
+            response_model,
+            capability,
+            prompt,
+            tuple(sorted((name, repr(value)) for name, value in kwargs.items())),
+        )
+        return await self._batcher.submit(
+            key,
+            lambda: self._call_structured(prompt, response_model, capability, **kwargs),
+            # Agents post-process the content in place, so each waiter gets its own
+            copy=lambda response: response.model_copy(deep=True),
+        )
+
+    async def _call_structured(
+        self,
+        prompt: str,
+        response_model: type[T],
+        capability: ModelCapability,
+        **kwargs: Any,
+    ) -> LLMResponse[T]:
+        """Call LLM with structured output, with provider fallback.
+
+        See call_structured(); identical concurrent calls are coalesced there.
+        """
         primary_model = self._get_model_for_capability(capability, self.config.primary)
 
         # Try primary provider
@@ -14,8 +14,11 @@ Tests:
     - tests/unit/test_model_capabilities.py
 """
 
-from dataclasses import dataclass, field
+import functools
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any
 
 
@@ -27,7 +30,7 @@ class ImageModelType(str, Enum):
     IMAGEN = "imagen"  # Legacy Imagen API
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImageModelConfig:
     """Configuration for an image generation model.
 
@@ -36,26 +39,31 @@ class ImageModelConfig:
         model_type: Type of image model
         response_modalities: Required response modalities for config
         supports_image_size: Whether model supports imageSize parameter
-        supported_sizes: List of supported image sizes (if any)
+        supported_sizes: Supported image sizes (if any)
         max_resolution: Maximum resolution in pixels
         supports_aspect_ratio: Whether model supports aspectRatio parameter
         use_camel_case_params: Whether to use camelCase for parameters
-        fallback_models: List of fallback models to try on failure
+        fallback_models: Fallback models to try on failure
         timeout_multiplier: Multiplier for timeout (image gen is slower)
     """
 
     model_id: str
     model_type: ImageModelType
-    response_modalities: list[str] = field(default_factory=lambda: ["TEXT", "IMAGE"])
+    response_modalities: Sequence[str] = ("TEXT", "IMAGE")
     supports_image_size: bool = False
-    supported_sizes: list[str] = field(default_factory=list)
+    supported_sizes: Sequence[str] = ()
     max_resolution: int = 1024
     supports_aspect_ratio: bool = True
     use_camel_case_params: bool = True
-    fallback_models: list[str] = field(default_factory=list)
+    fallback_models: Sequence[str] = ()
     timeout_multiplier: float = 2.0
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        """Freeze caller-supplied sequences into tuples."""
+        for name in ("response_modalities", "supported_sizes", "fallback_models"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
 
 # =============================================================================
 # MODEL CAPABILITIES REGISTRY
@@ -66,18 +74,18 @@ class ImageModelConfig:
 # Last updated: 2024-12-04
 # =============================================================================
 
-IMAGE_MODEL_REGISTRY: dict[str, ImageModelConfig] = {
+_IMAGE_MODEL_REGISTRY: dict[str, ImageModelConfig] = {
     # Nano Banana - Fast, reliable, 1024px max
     "gemini-2.5-flash-image": ImageModelConfig(
         model_id="gemini-2.5-flash-image",
         model_type=ImageModelType.GEMINI_NATIVE,
-        response_modalities=["TEXT", "IMAGE"],  # Per Google docs: use both
+        response_modalities=("TEXT", "IMAGE"),  # Per Google docs: use both
         supports_image_size=False,  # Only supports default 1024px
-        supported_sizes=[],
+        supported_sizes=(),
         max_resolution=1024,
         supports_aspect_ratio=True,
         use_camel_case_params=True,
-        fallback_models=[],
+        fallback_models=(),
         timeout_multiplier=2.0,
         notes="GA model, fast and reliable. 1024px only.",
     ),
@@ -85,13 +93,13 @@ IMAGE_MODEL_REGISTRY: dict[str, ImageModelConfig] = {
     "gemini-3-pro-image-preview": ImageModelConfig(
         model_id="gemini-3-pro-image-preview",
         model_type=ImageModelType.GEMINI_PRO,
-        response_modalities=["TEXT", "IMAGE"],  # Requires both
+        response_modalities=("TEXT", "IMAGE"),  # Requires both
         supports_image_size=True,
-        supported_sizes=["1K", "2K", "4K"],
+        supported_sizes=("1K", "2K", "4K"),
         max_resolution=4096,
         supports_aspect_ratio=True,
         use_camel_case_params=True,
-        fallback_models=["gemini-2.5-flash-image"],
+        fallback_models=("gemini-2.5-flash-image",),
         timeout_multiplier=3.0,  # Higher quality takes longer
         notes="Preview model, best quality. Supports 1K/2K/4K.",
     ),
@@ -99,37 +107,43 @@ IMAGE_MODEL_REGISTRY: dict[str, ImageModelConfig] = {
     "imagen-3.0-generate-002": ImageModelConfig(
         model_id="imagen-3.0-generate-002",
         model_type=ImageModelType.IMAGEN,
-        response_modalities=[],  # Not applicable - uses generate_images API
+        response_modalities=(),  # Not applicable - uses generate_images API
         supports_image_size=False,
-        supported_sizes=[],
+        supported_sizes=(),
         max_resolution=1024,
         supports_aspect_ratio=True,
         use_camel_case_params=False,  # Imagen uses snake_case
-        fallback_models=["gemini-2.5-flash-image"],
+        fallback_models=("gemini-2.5-flash-image",),
         timeout_multiplier=2.0,
         notes="Legacy Imagen API. Uses generate_images() not generate_content().",
     ),
 }
 
+# Read-only view of the image registry (lookups are memoized)
+IMAGE_MODEL_REGISTRY: Mapping[str, ImageModelConfig] = MappingProxyType(_IMAGE_MODEL_REGISTRY)
+
 # Default config for unknown models (conservative settings)
 DEFAULT_IMAGE_CONFIG = ImageModelConfig(
     model_id="unknown",
     model_type=ImageModelType.GEMINI_NATIVE,
-    response_modalities=["TEXT", "IMAGE"],  # Safest default
+    response_modalities=("TEXT", "IMAGE"),  # Safest default
     supports_image_size=False,
-    supported_sizes=[],
+    supported_sizes=(),
     max_resolution=1024,
     supports_aspect_ratio=True,
     use_camel_case_params=True,
-    fallback_models=["gemini-2.5-flash-image"],
+    fallback_models=("gemini-2.5-flash-image",),
     timeout_multiplier=2.0,
     notes="Unknown model - using conservative defaults.",
 )
 
 
+@functools.lru_cache(maxsize=256)
 def get_image_model_config(model_id: str) -> ImageModelConfig:
     """Get configuration for an image model.
 
+    Lookups are memoized; the registry is a module constant.
+
     Args:
         model_id: The model identifier.
 
@@ -141,7 +155,19 @@ def get_image_model_config(model_id: str) -> ImageModelConfig:
         >>> config.max_resolution
         1024
     """
-    return IMAGE_MODEL_REGISTRY.get(model_id, DEFAULT_IMAGE_CONFIG)
+    return _IMAGE_MODEL_REGISTRY.get(model_id, DEFAULT_IMAGE_CONFIG)
+
+
+def is_default_image_model(model_id: str) -> bool:
+    """Check if a model is unregistered and falls back to the default config.
+
+    Args:
+        model_id: The model identifier.
+
+    Returns:
+        True if the model uses DEFAULT_IMAGE_CONFIG.
+    """
+    return get_image_model_config(model_id) is DEFAULT_IMAGE_CONFIG
 
 
 def get_model_response_modalities(model_id: str) -> list[str]:
@@ -154,7 +180,7 @@ def get_model_response_modalities(model_id: str) -> list[str]:
         List of response modalities to use.
     """
     config = get_image_model_config(model_id)
-    return config.response_modalities
+    return list(config.response_modalities)
 
 
 def should_include_image_size(model_id: str, requested_size: str | None) -> bool:
@@ -167,12 +193,16 @@ def should_include_image_size(model_id: str, requested_size: str | None) -> bool
     Returns:
         True if the model supports the requested size.
     """
-    config = get_image_model_config(model_id)
+    return _should_include_image_size(get_image_model_config(model_id), requested_size)
+
+
+def _should_include_image_size(config: ImageModelConfig, requested_size: str | None) -> bool:
+    """Size check against an already-loaded config."""
     if not config.supports_image_size:
         return False
     if requested_size and config.supported_sizes:
         return requested_size in config.supported_sizes
-    return config.supports_image_size
+    return True
 
 
 def get_fallback_models(model_id: str) -> list[str]:
@@ -185,7 +215,7 @@ def get_fallback_models(model_id: str) -> list[str]:
         List of fallback model IDs.
     """
     config = get_image_model_config(model_id)
-    return config.fallback_models
+    return list(config.fallback_models)
 
 
 def build_image_config_params(
@@ -205,6 +235,9 @@ def build_image_config_params(
     Returns:
         Dictionary of parameters for the image config.
     """
+    if not aspect_ratio and not image_size:
+        return {}
+
     config = get_image_model_config(model_id)
     params: dict[str, Any] = {}
 
@@ -212,7 +245,7 @@ def build_image_config_params(
         key = "aspectRatio" if config.use_camel_case_params else "aspect_ratio"
         params[key] = aspect_ratio
 
-    if image_size and should_include_image_size(model_id, image_size):
+    if image_size and _should_include_image_size(config, image_size):
         key = "imageSize" if config.use_camel_case_params else "image_size"
         params[key] = image_size
 
@@ -263,7 +296,7 @@ class TextModelCapability(str, Enum):
     EXTENDED_THINKING = "extended_thinking"  # Extended thinking/reasoning
 
 
-@dataclass
+@dataclass(slots=True)
 class TextModelConfig:
     """Configuration for a text generation model.
 
@@ -291,7 +324,7 @@ class TextModelConfig:
 
 
 # Registry of known text models and their capabilities
-TEXT_MODEL_REGISTRY: dict[str, TextModelConfig] = {
+_TEXT_MODEL_REGISTRY: dict[str, TextModelConfig] = {
     # Google Native Models
     "gemini-2.5-flash": TextModelConfig(
         model_id="gemini-2.5-flash",
@@ -406,6 +439,9 @@ TEXT_MODEL_REGISTRY: dict[str, TextModelConfig] = {
     ),
 }
 
+# Read-only view of the text registry (lookups are memoized)
+TEXT_MODEL_REGISTRY: Mapping[str, TextModelConfig] = MappingProxyType(_TEXT_MODEL_REGISTRY)
+
 # Default config for unknown models (conservative - assume JSON mode works)
 DEFAULT_TEXT_CONFIG = TextModelConfig(
     model_id="unknown",
@@ -420,9 +456,12 @@ DEFAULT_TEXT_CONFIG = TextModelConfig(
 )
 
 
+@functools.lru_cache(maxsize=256)
 def get_text_model_config(model_id: str) -> TextModelConfig:
     """Get configuration for a text model.
 
+    Lookups are memoized; the registry is a module constant.
+
     Args:
         model_id: The model identifier.
 
@@ -434,7 +473,13 @@ def get_text_model_config(model_id: str) -> TextModelConfig:
         >>> config.supports_json_schema
         True
     """
-    return TEXT_MODEL_REGISTRY.get(model_id, DEFAULT_TEXT_CONFIG)
+    return _TEXT_MODEL_REGISTRY.get(model_id, DEFAULT_TEXT_CONFIG)
+
+
+def clear_model_config_caches() -> None:
+    """Clear memoized config lookups (for tests that patch _*_MODEL_REGISTRY)."""
+    get_image_model_config.cache_clear()
+    get_text_model_config.cache_clear()
 
 
 def supports_structured_output(model_id: str) -> bool:
@@ -517,8 +562,9 @@ def infer_provider_from_model_id(model_id: str) -> str:
         'google'
     """
     # Check registry first
-    if model_id in TEXT_MODEL_REGISTRY:
-        return TEXT_MODEL_REGISTRY[model_id].provider
+    config = _TEXT_MODEL_REGISTRY.get(model_id)
+    if config is not None:
+        return config.provider
 
     # Infer from model ID pattern
     if "/" in model_id:
@@ -531,23 +577,33 @@ def infer_provider_from_model_id(model_id: str) -> str:
         return "unknown"
 
 
-def get_available_interaction_models() -> list[dict]:
+def _build_interaction_models() -> tuple[Mapping[str, Any], ...]:
+    """Collect read-only info for models that stream and support JSON mode."""
+    return tuple(
+        MappingProxyType({
+            "id": model_id,
+            "provider": config.provider,
+            "supports_json_schema": config.supports_json_schema,
+            "supports_extended_thinking": config.supports_extended_thinking,
+            "notes": config.notes,
+        })
+        for model_id, config in _TEXT_MODEL_REGISTRY.items()
+        if config.supports_streaming and config.supports_json_mode
+    )
+
+
+# Built once at import; the text registry is a module constant
+_INTERACTION_MODELS = _build_interaction_models()
+
+
+def get_available_interaction_models() -> list[dict[str, Any]]:
     """Get list of models suitable for character interactions.
 
     Returns models that support streaming and JSON mode for
     interactive character chat, dialog, and surveys.
 
     Returns:
-        List of model info dicts with id, provider, and notes.
+        List of model info dicts with id, provider, and notes (fresh
+        copies, so callers may modify or serialize them).
     """
-    models = []
-    for model_id, config in TEXT_MODEL_REGISTRY.items():
-        if config.supports_streaming and config.supports_json_mode:
-            models.append({
-                "id": model_id,
-                "provider": config.provider,
-                "supports_json_schema": config.supports_json_schema,
-                "supports_extended_thinking": config.supports_extended_thinking,
-                "notes": config.notes,
-            })
-    return models
+    return [dict(model) for model in _INTERACTION_MODELS]
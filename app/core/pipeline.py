@@ -622,24 +622,24 @@ class GenerationPipeline:
             logger.debug(f"Graph: {len(graph_data.relationships)} relationships")
 
         # Generate bios in parallel (now that we have graph data)
-        async def generate_bio(stub):
-            async with self._semaphore:
-                bio_input = CharacterBioInput.from_identification(
-                    stub=stub,
-                    full_cast=char_identification,
-                    query=query,
-                    year=state.timeline_data.year,
-                    era=state.timeline_data.era,
-                    location=state.timeline_data.location,
-                    setting=state.scene_data.setting,
-                    atmosphere=state.scene_data.atmosphere,
-                    tension_level=state.scene_data.tension_level or "medium",
-                    graph_data=graph_data,
-                )
-                return await self._char_bio_agent.run(bio_input)
-
-        bio_tasks = [generate_bio(stub) for stub in char_identification.characters]
-        bio_results = await asyncio.gather(*bio_tasks, return_exceptions=True)
+        cast_context = char_identification.get_cast_context()
+        bio_inputs = [
+            CharacterBioInput.from_identification(
+                stub=stub,
+                full_cast=char_identification,
+                query=query,
+                year=state.timeline_data.year,
+                era=state.timeline_data.era,
+                location=state.timeline_data.location,
+                setting=state.scene_data.setting,
+                atmosphere=state.scene_data.atmosphere,
+                tension_level=state.scene_data.tension_level or "medium",
+                graph_data=graph_data,
+                cast_context=cast_context,
+            )
+            for stub in char_identification.characters
+        ]
+        bio_results = await self._char_bio_agent.run_many(bio_inputs, semaphore=self._semaphore)
 
         # Wait for Moment
         moment_result = await moment_task
@@ -663,12 +663,8 @@ class GenerationPipeline:
             total_latency += graph_result.latency_ms
         models_used = [id_result.model_used] if id_result.model_used else []
 
-        for i, result in enumerate(bio_results):
-            stub = char_identification.characters[i]
-            if isinstance(result, Exception):
-                logger.warning(f"Bio generation failed for {stub.name}: {result}")
-                characters.append(create_fallback_character(stub))
-            elif result.success and result.content:
+        for stub, result in zip(char_identification.characters, bio_results, strict=True):
+            if result.success and result.content:
                 characters.append(result.content)
                 total_latency += result.latency_ms
                 if result.model_used and result.model_used not in models_used:
@@ -1025,29 +1021,27 @@ class GenerationPipeline:
         # === PHASE 3: Parallel Bio Generation (with graph context) ===
         logger.debug(f"Characters Phase 3: Parallel bio generation ({len(char_identification.characters)} chars)")
 
-        async def generate_bio_with_semaphore(stub):
-            """Generate bio for one character with semaphore control."""
-            async with self._semaphore:
-                bio_input = CharacterBioInput.from_identification(
-                    stub=stub,
-                    full_cast=char_identification,
-                    query=query,
-                    year=state.timeline_data.year,
-                    era=state.timeline_data.era,
-                    location=state.timeline_data.location,
-                    setting=state.scene_data.setting,
-                    atmosphere=state.scene_data.atmosphere,
-                    tension_level=state.scene_data.tension_level or "medium",
-                    graph_data=graph_data,  # Pass graph for relationship context
-                )
-                return await self._char_bio_agent.run(bio_input)
-
-        # Run all bio generations in parallel
-        bio_tasks = [
-            generate_bio_with_semaphore(stub)
+        # Render the shared cast context once for the whole fan-out
+        cast_context = char_identification.get_cast_context()
+        bio_inputs = [
+            CharacterBioInput.from_identification(
+                stub=stub,
+                full_cast=char_identification,
+                query=query,
+                year=state.timeline_data.year,
+                era=state.timeline_data.era,
+                location=state.timeline_data.location,
+                setting=state.scene_data.setting,
+                atmosphere=state.scene_data.atmosphere,
+                tension_level=state.scene_data.tension_level or "medium",
+                graph_data=graph_data,  # Pass graph for relationship context
+                cast_context=cast_context,
+            )
             for stub in char_identification.characters
         ]
-        bio_results = await asyncio.gather(*bio_tasks, return_exceptions=True)
+
+        # Run all bio generations in parallel (bounded by the tier semaphore)
+        bio_results = await self._char_bio_agent.run_many(bio_inputs, semaphore=self._semaphore)
 
         # Assemble characters from results
         characters: list[Character] = []
@@ -1056,12 +1050,8 @@ class GenerationPipeline:
         if graph_result and graph_result.model_used and graph_result.model_used not in models_used:
             models_used.append(graph_result.model_used)
 
-        for i, result in enumerate(bio_results):
-            stub = char_identification.characters[i]
-            if isinstance(result, Exception):
-                logger.warning(f"Bio generation failed for {stub.name}: {result}")
-                characters.append(create_fallback_character(stub))
-            elif result.success and result.content:
+        for stub, result in zip(char_identification.characters, bio_results, strict=True):
+            if result.success and result.content:
                 characters.append(result.content)
                 total_latency += result.latency_ms
                 if result.model_used and result.model_used not in models_used:
@@ -380,7 +380,7 @@ class GoogleProvider(LLMProvider):
 
             # Build generation config with model-specific response modalities
             config_params: dict[str, Any] = {
-                "response_modalities": model_config.response_modalities,
+                "response_modalities": list(model_config.response_modalities),
             }
             if image_config_params:
                 config_params["image_config"] = types.ImageConfig(**image_config_params)
@@ -19,6 +19,7 @@ Tests:
     - tests/integration/test_llm_router.py::test_openrouter_provider_integration
 """
 
+import importlib.util
 import logging
 import time
 from typing import Any, TypeVar
@@ -45,6 +46,62 @@ OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 OPENROUTER_MODELS_URL = f"{OPENROUTER_BASE_URL}/models"
 OPENROUTER_CHAT_URL = f"{OPENROUTER_BASE_URL}/chat/completions"
 
+# Connection pool shared by every provider instance (one per router/agent)
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+HTTP_CONNECT_TIMEOUT = 10.0
+
+# Multiplex concurrent calls over one connection when the optional h2
+# package is installed (pip install "timepoint-flash[http2]")
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Shared clients by (base_url, api_key, timeout)
+_http_clients: dict[tuple[str, str, float], httpx.AsyncClient] = {}
+
+
+def _get_http_client(api_key: str, base_url: str, timeout: float) -> httpx.AsyncClient:
+    """Get or create the shared pooled client for a configuration.
+
+    Args:
+        api_key: OpenRouter API key.
+        base_url: API base URL.
+        timeout: Request timeout in seconds.
+
+    Returns:
+        httpx client whose keep-alive connections are reused across providers.
+    """
+    key = (base_url, api_key, timeout)
+    client = _http_clients.get(key)
+    if client is None or client.is_closed:
+        client = _http_clients[key] = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout, connect=min(timeout, HTTP_CONNECT_TIMEOUT)),
+            limits=HTTP_POOL_LIMITS,
+            http2=HTTP2_ENABLED,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "HTTP-Referer": "https://timepoint.ai",
+                "X-Title": "TIMEPOINT Flash",
+                "Content-Type": "application/json",
+            },
+        )
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the shared OpenRouter clients.
+
+    Should be called at application shutdown.
+    """
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
+
 
 class OpenRouterModel(BaseModel):
     """OpenRouter model metadata.
@@ -113,25 +170,18 @@ class OpenRouterProvider(LLMProvider):
 
     @property
     def client(self) -> httpx.AsyncClient:
-        """Get httpx async client (lazy initialization)."""
+        """Get the shared pooled httpx client (lazy initialization)."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "HTTP-Referer": "https://timepoint.ai",
-                    "X-Title": "TIMEPOINT Flash",
-                    "Content-Type": "application/json",
-                },
-            )
+            self._client = _get_http_client(self.api_key, self.base_url, self.timeout)
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client is not None and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client.
+
+        The pooled client is shared with other providers, so it is only
+        dropped here; close_http_clients() closes it at shutdown.
+        """
+        self._client = None
 
     def _handle_error(self, response: httpx.Response) -> None:
         """Convert HTTP errors to provider errors.
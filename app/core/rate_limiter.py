@@ -6,7 +6,7 @@ Uses the token bucket algorithm for smooth request distribution.
 Features:
     - Token bucket with configurable capacity and refill rate
     - Tier-based rate limits (FREE, PAID, NATIVE)
-    - Async-safe with proper locking
+    - Async-safe without locks (single event loop, no await mid-update)
     - Graceful degradation if rate limiter fails
     - Registry for per-model rate limiters
 
@@ -22,47 +22,69 @@ Tests:
 """
 
 import asyncio
+import functools
 import logging
+import re
 import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
-from typing import ClassVar
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class TierConfig:
+    """Rate limit settings for a model tier.
+
+    Attributes:
+        rpm: Requests per minute
+        burst: Max burst capacity
+        refill_rate: Tokens added per second (~rpm / 60)
+    """
+
+    rpm: int
+    burst: int
+    refill_rate: float
+
+
 # Rate limits per tier (requests per minute and burst capacity)
 # These are conservative estimates based on observed provider behavior
-TIER_RATE_LIMITS: dict[str, dict[str, float]] = {
-    "free": {
-        "rpm": 8,          # Requests per minute (conservative for :free models)
-        "burst": 2,        # Max burst capacity
-        "refill_rate": 0.13,  # ~8 per minute = 0.13 per second
-    },
-    "paid": {
-        "rpm": 45,         # OpenRouter paid tier
-        "burst": 5,        # Allow small bursts
-        "refill_rate": 0.75,  # ~45 per minute = 0.75 per second
-    },
-    "native": {
-        "rpm": 58,         # Google native (leave headroom from 60)
-        "burst": 8,        # Higher burst for native
-        "refill_rate": 0.97,  # ~58 per minute
-    },
+TIER_RATE_LIMITS: dict[str, TierConfig] = {
+    # Conservative for :free models, ~8 per minute
+    "free": TierConfig(rpm=8, burst=2, refill_rate=0.13),
+    # OpenRouter paid tier, small bursts, ~45 per minute
+    "paid": TierConfig(rpm=45, burst=5, refill_rate=0.75),
+    # Google native (leave headroom from 60), higher burst, ~58 per minute
+    "native": TierConfig(rpm=58, burst=8, refill_rate=0.97),
 }
 
 
-@dataclass
+# Graceful degradation: consecutive limiter errors across all buckets, and the
+# kill switch that lets every request through once they pile up
+MAX_CONSECUTIVE_FAILURES = 5
+_consecutive_failures = 0
+_disabled = False
+
+
+@dataclass(slots=True)
 class TokenBucket:
     """Token bucket rate limiter for smooth request distribution.
 
     The token bucket algorithm allows for controlled bursting while
     maintaining a sustainable average rate.
 
+    Buckets are used from a single event loop, and every read-modify-write of
+    tokens runs without an await in between, so updates cannot interleave and
+    no lock is needed; only the wait for a refill yields.
+
     Attributes:
         capacity: Maximum tokens (burst capacity)
         refill_rate: Tokens added per second
         tokens: Current available tokens
         last_refill: Timestamp of last refill
+        failures: Consecutive limiter errors in this bucket
 
     Examples:
         >>> bucket = TokenBucket(capacity=5, refill_rate=0.5)
@@ -74,11 +96,7 @@ class TokenBucket:
     refill_rate: float
     tokens: float = field(default=None)  # type: ignore
     last_refill: float = field(default_factory=time.monotonic)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
-
-    # Class-level tracking for graceful degradation
-    _consecutive_failures: ClassVar[int] = 0
-    _disabled: ClassVar[bool] = False
+    failures: int = 0
 
     def __post_init__(self) -> None:
         """Initialize tokens to capacity if not set."""
@@ -88,8 +106,10 @@ class TokenBucket:
     def _refill(self) -> None:
         """Refill tokens based on elapsed time."""
         now = time.monotonic()
-        elapsed = now - self.last_refill
-        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        if self.tokens < self.capacity:
+            elapsed = now - self.last_refill
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+        # Advance even when full, so idle time is never credited after a spend
         self.last_refill = now
 
     async def acquire(self, timeout: float = 30.0) -> bool:
@@ -105,58 +125,85 @@ class TokenBucket:
             asyncio.TimeoutError: If timeout exceeded (only when timeout > 0)
         """
         # Graceful degradation: if rate limiter is disabled, allow through
-        if TokenBucket._disabled:
+        if _disabled:
             logger.debug("Rate limiter disabled, allowing request through")
             return True
 
         try:
-            async with self._lock:
-                self._refill()
-
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    TokenBucket._consecutive_failures = 0
-                    return True
-
-                # Calculate wait time for next token
-                wait_time = (1 - self.tokens) / self.refill_rate
-                wait_time = min(wait_time, timeout)
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self._record_success()
+                return True
 
-                if wait_time > 0:
-                    logger.debug(
-                        f"Rate limit: waiting {wait_time:.2f}s for token "
-                        f"(tokens={self.tokens:.2f}, rate={self.refill_rate:.3f}/s)"
-                    )
+            # Calculate wait time for next token
+            wait_time = (1 - self.tokens) / self.refill_rate
+            wait_time = min(wait_time, timeout)
 
-            # Wait outside the lock
             if wait_time > 0:
+                logger.debug(
+                    f"Rate limit: waiting {wait_time:.2f}s for token "
+                    f"(tokens={self.tokens:.2f}, rate={self.refill_rate:.3f}/s)"
+                )
                 await asyncio.sleep(wait_time)
 
             # Try again after waiting
-            async with self._lock:
-                self._refill()
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    TokenBucket._consecutive_failures = 0
-                    return True
-
-                # Still not enough tokens after waiting
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self._record_success()
+                return True
+
+            # Still not enough tokens after waiting
+            logger.warning(
+                f"Rate limit wait exceeded: tokens={self.tokens:.2f}, "
+                f"wait_time={wait_time:.2f}s"
+            )
+            return False
+
+        except Exception as e:
+            self._record_failure()
+            logger.warning(f"Rate limiter error (allowing request): {e}")
+            return True
+
+    async def acquire_many(self, n: int, timeout: float = 30.0) -> bool:
+        """Acquire n tokens at once for a burst of parallel calls.
+
+        Reserves all n tokens in one step. The bucket may go into debt (n can
+        exceed capacity); the caller then sleeps until the debt is repaid, and
+        later acquirers wait behind it.
+
+        Args:
+            n: Number of tokens to acquire
+            timeout: Maximum time to wait for the tokens (seconds)
+
+        Returns:
+            True if the tokens were acquired, False if the wait would exceed
+            timeout (nothing is reserved in that case)
+        """
+        if n <= 0 or _disabled:
+            return True
+
+        try:
+            self._refill()
+            wait_time = max(0.0, (n - self.tokens) / self.refill_rate)
+            if wait_time > timeout:
                 logger.warning(
-                    f"Rate limit wait exceeded: tokens={self.tokens:.2f}, "
-                    f"wait_time={wait_time:.2f}s"
+                    f"Rate limit burst of {n} exceeds timeout: "
+                    f"tokens={self.tokens:.2f}, wait_time={wait_time:.2f}s"
                 )
                 return False
+            self.tokens -= n
+            self._record_success()
+
+            if wait_time > 0:
+                logger.debug(f"Rate limit: waiting {wait_time:.2f}s for {n} tokens")
+                await asyncio.sleep(wait_time)
+            return True
 
         except Exception as e:
-            # Graceful degradation: track failures and disable if too many
-            TokenBucket._consecutive_failures += 1
-            if TokenBucket._consecutive_failures >= 5:
-                logger.error(
-                    f"Rate limiter failing repeatedly ({TokenBucket._consecutive_failures}x), "
-                    "disabling for safety"
-                )
-                TokenBucket._disabled = True
-            logger.warning(f"Rate limiter error (allowing request): {e}")
+            self._record_failure()
+            logger.warning(f"Rate limiter error (allowing burst): {e}")
             return True
 
     def available_tokens(self) -> float:
@@ -164,11 +211,32 @@ class TokenBucket:
         self._refill()
         return self.tokens
 
-    @classmethod
-    def reset_failures(cls) -> None:
-        """Reset failure tracking (for testing)."""
-        cls._consecutive_failures = 0
-        cls._disabled = False
+    def _record_success(self) -> None:
+        """Clear failure counters; writes only after a failure."""
+        global _consecutive_failures
+        if self.failures:
+            self.failures = 0
+        if _consecutive_failures:
+            _consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        """Count a limiter error and trip the kill switch if they pile up."""
+        global _consecutive_failures, _disabled
+        self.failures += 1
+        _consecutive_failures += 1
+        if _consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            logger.error(
+                f"Rate limiter failing repeatedly ({_consecutive_failures}x), "
+                "disabling for safety"
+            )
+            _disabled = True
+
+    @staticmethod
+    def reset_failures() -> None:
+        """Reset global failure tracking and re-enable limiting (for testing)."""
+        global _consecutive_failures, _disabled
+        _consecutive_failures = 0
+        _disabled = False
 
 
 class RateLimiterRegistry:
@@ -189,19 +257,31 @@ class RateLimiterRegistry:
     def __init__(self) -> None:
         """Initialize the registry with tier-based limiters."""
         self._limiters: dict[str, TokenBucket] = {}
-        self._lock = asyncio.Lock()
 
         # Pre-create limiters for all tiers
         for tier, config in TIER_RATE_LIMITS.items():
             self._limiters[tier] = TokenBucket(
-                capacity=config["burst"],
-                refill_rate=config["refill_rate"],
+                capacity=config.burst,
+                refill_rate=config.refill_rate,
             )
             logger.debug(
                 f"Created rate limiter for tier '{tier}': "
-                f"capacity={config['burst']}, rate={config['refill_rate']:.3f}/s"
+                f"capacity={config.burst}, rate={config.refill_rate:.3f}/s"
             )
 
+        # Stats are refreshed in place by get_stats and exposed read-only
+        self._stats: dict[str, dict[str, float]] = {
+            tier: {
+                "available_tokens": 0.0,
+                "capacity": limiter.capacity,
+                "refill_rate": limiter.refill_rate,
+            }
+            for tier, limiter in self._limiters.items()
+        }
+        self._stats_view: Mapping[str, Mapping[str, float]] = MappingProxyType({
+            tier: MappingProxyType(tier_stats) for tier, tier_stats in self._stats.items()
+        })
+
     def get_limiter(self, tier: str) -> TokenBucket:
         """Get the rate limiter for a tier.
 
@@ -213,10 +293,11 @@ class RateLimiterRegistry:
 
         Falls back to 'paid' tier if unknown tier specified.
         """
-        if tier not in self._limiters:
+        limiter = self._limiters.get(tier)
+        if limiter is None:
             logger.warning(f"Unknown tier '{tier}', using 'paid' tier limits")
-            tier = "paid"
-        return self._limiters[tier]
+            limiter = self._limiters["paid"]
+        return limiter
 
     async def acquire(self, tier: str, timeout: float = 30.0) -> bool:
         """Acquire a token for the specified tier.
@@ -231,47 +312,62 @@ class RateLimiterRegistry:
         limiter = self.get_limiter(tier)
         return await limiter.acquire(timeout=timeout)
 
-    def get_stats(self) -> dict[str, dict[str, float]]:
+    async def acquire_many(self, tier: str, n: int, timeout: float = 30.0) -> bool:
+        """Acquire n tokens for the specified tier in one step.
+
+        Args:
+            tier: Model tier
+            n: Number of tokens
+            timeout: Maximum wait time
+
+        Returns:
+            True if tokens acquired, False otherwise
+        """
+        limiter = self.get_limiter(tier)
+        return await limiter.acquire_many(n, timeout=timeout)
+
+    def get_stats(self) -> Mapping[str, Mapping[str, float]]:
         """Get current stats for all tiers.
 
+        The same read-only mapping is returned on every call and updated in
+        place; copy it to keep a snapshot.
+
         Returns:
-            Dictionary of tier -> {tokens, capacity, refill_rate}
+            Mapping of tier -> {available_tokens, capacity, refill_rate}
         """
-        return {
-            tier: {
-                "available_tokens": limiter.available_tokens(),
-                "capacity": limiter.capacity,
-                "refill_rate": limiter.refill_rate,
-            }
-            for tier, limiter in self._limiters.items()
-        }
+        for tier, limiter in self._limiters.items():
+            self._stats[tier]["available_tokens"] = limiter.available_tokens()
+        return self._stats_view
 
 
-# Global registry instance
-_registry: RateLimiterRegistry | None = None
-_registry_lock = asyncio.Lock()
+# Global registry instance, built eagerly (construction is cheap and synchronous)
+_registry = RateLimiterRegistry()
 
 
 async def get_registry() -> RateLimiterRegistry:
-    """Get or create the global rate limiter registry.
+    """Get the global rate limiter registry.
+
+    Kept async for existing callers; the registry is created at import.
 
     Returns:
         The singleton RateLimiterRegistry instance
-
-    Thread-safe and async-safe initialization.
     """
-    global _registry
-    if _registry is None:
-        async with _registry_lock:
-            if _registry is None:
-                _registry = RateLimiterRegistry()
-                logger.info("Initialized global rate limiter registry")
     return _registry
 
 
+# Free models have a :free suffix (or a /free path segment)
+_FREE_MODEL_RE = re.compile(r"[:/]free", re.IGNORECASE)
+
+# Native Google models: a gemini- prefix, or no provider prefix and "gemini" in the name
+_NATIVE_MODEL_RE = re.compile(r"gemini-.*|[^/]*gemini[^/]*", re.IGNORECASE | re.DOTALL)
+
+
+@functools.lru_cache(maxsize=512)
 def get_tier_from_model(model_id: str) -> str:
     """Determine the tier from a model ID.
 
+    Results are memoized per model ID, as this runs on every LLM call.
+
     Args:
         model_id: The model identifier (e.g., "google/gemini-2.0-flash-001:free")
 
@@ -281,16 +377,10 @@ def get_tier_from_model(model_id: str) -> str:
     if not model_id:
         return "paid"
 
-    model_lower = model_id.lower()
-
-    # Free models have :free suffix
-    if ":free" in model_lower or "/free" in model_lower:
+    if _FREE_MODEL_RE.search(model_id):
         return "free"
 
-    # Native Google models (no provider prefix or explicit gemini)
-    if model_lower.startswith("gemini-") or (
-        "/" not in model_lower and "gemini" in model_lower
-    ):
+    if _NATIVE_MODEL_RE.fullmatch(model_id):
         return "native"
 
     # Everything else is paid (OpenRouter with provider/model format)
@@ -313,17 +403,39 @@ async def acquire_rate_limit(model_id: str, timeout: float = 30.0) -> bool:
         >>> await acquire_rate_limit("google/gemini-2.0-flash-001:free")
         True  # May wait up to timeout if rate limited
     """
-    tier = get_tier_from_model(model_id)
-    registry = await get_registry()
-    return await registry.acquire(tier, timeout=timeout)
+    return await _registry.acquire(get_tier_from_model(model_id), timeout=timeout)
+
+
+async def acquire_rate_limits(model_ids: Iterable[str], timeout: float = 30.0) -> bool:
+    """Acquire one token per model for a parallel burst of calls.
+
+    Models are grouped by tier so each tier's bucket is charged once,
+    and the tiers are acquired concurrently.
+
+    Args:
+        model_ids: Model identifiers about to be called (repeats allowed)
+        timeout: Maximum wait time in seconds
+
+    Returns:
+        True if every tier granted its tokens, False otherwise
+
+    Examples:
+        >>> await acquire_rate_limits(["gemini-2.5-flash", "openai/gpt-4o"])
+        True
+    """
+    counts = Counter(map(get_tier_from_model, model_ids))
+    results = await asyncio.gather(*(
+        _registry.acquire_many(tier, n, timeout=timeout) for tier, n in counts.items()
+    ))
+    return all(results)
 
 
 def reset_rate_limiters() -> None:
     """Reset all rate limiters (for testing).
 
-    Clears the global registry and resets failure tracking.
+    Replaces the global registry and resets failure tracking.
     """
     global _registry
-    _registry = None
+    _registry = RateLimiterRegistry()
     TokenBucket.reset_failures()
     logger.debug("Rate limiters reset")
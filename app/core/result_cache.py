@@ -0,0 +1,138 @@
+"""In-process cache for structured LLM results.
+
+Keeps recent pydantic results in process memory, keyed by a blake2b digest
+of the canonical request, so repeat requests skip the LLM round-trip. Used
+for character bios (app/core/bio_cache.py) and eval runs (app/eval/runner.py).
+
+Examples:
+    >>> from app.core.result_cache import ResultCache
+    >>> cache = ResultCache(max_entries=128, ttl_seconds=600)
+    >>> key = {"model": "gemini-2.5-flash", "prompt": prompt}
+    >>> cached = cache.get(key)
+    >>> if cached is None:
+    ...     cache.put(key, result, model_used="gemini-2.5-flash")
+
+Tests:
+    - tests/unit/test_result_cache.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Default cache limits
+RESULT_CACHE_MAX_ENTRIES = 512
+RESULT_CACHE_TTL_SECONDS = 3600.0
+
+
+class CachedResult(NamedTuple):
+    """A cached structured result."""
+
+    content: BaseModel
+    model_used: str | None
+
+
+def make_cache_key(key_data: dict[str, Any]) -> str:
+    """Build a stable cache key from request data.
+
+    Args:
+        key_data: JSON-serializable request description
+
+    Returns:
+        Hex digest of the canonical JSON encoding
+    """
+    canonical = json.dumps(key_data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    """Bounded LRU cache of structured LLM results with a TTL.
+
+    Entries are deep-copied on the way out so callers may mutate what
+    they receive without affecting the cache.
+
+    Attributes:
+        max_entries: Maximum number of cached results
+        ttl_seconds: Lifetime of an entry
+        hits: Number of cache hits
+        misses: Number of cache misses
+    """
+
+    def __init__(
+        self,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+        ttl_seconds: float = RESULT_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Lifetime of an entry in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, tuple[float, CachedResult]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key_data: dict[str, Any]) -> CachedResult | None:
+        """Look up a cached result.
+
+        Args:
+            key_data: Request description (see make_cache_key)
+
+        Returns:
+            A copy of the cached result, or None on a miss
+        """
+        key = make_cache_key(key_data)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        cached = entry[1]
+        return CachedResult(cached.content.model_copy(deep=True), cached.model_used)
+
+    def put(
+        self,
+        key_data: dict[str, Any],
+        content: BaseModel,
+        model_used: str | None = None,
+    ) -> None:
+        """Store a result.
+
+        Args:
+            key_data: Request description (see make_cache_key)
+            content: Structured result to cache
+            model_used: Model that produced the result
+        """
+        key = make_cache_key(key_data)
+        deadline = time.monotonic() + self.ttl_seconds
+        self._entries[key] = (deadline, CachedResult(content.model_copy(deep=True), model_used))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
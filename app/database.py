@@ -28,6 +28,7 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
 from app.config import get_settings
 
@@ -45,8 +46,10 @@ def get_engine() -> AsyncEngine:
         AsyncEngine: SQLAlchemy async engine.
 
     Note:
-        For SQLite, enables WAL mode and foreign keys.
-        For PostgreSQL, configures connection pooling.
+        For SQLite, enables WAL mode and foreign keys. In-memory databases
+        share one connection so every session sees the same tables.
+        For PostgreSQL, configures connection pooling from
+        DB_POOL_SIZE / DB_MAX_OVERFLOW.
     """
     global _engine
 
@@ -55,11 +58,13 @@ def get_engine() -> AsyncEngine:
 
         # Engine configuration varies by database type
         if settings.is_sqlite:
-            # SQLite configuration
+            # SQLite configuration - pooling only applies to file databases
+            pool_kwargs = {"poolclass": StaticPool} if settings.is_memory_db else {}
             _engine = create_async_engine(
                 settings.DATABASE_URL,
                 echo=settings.DEBUG,
                 connect_args={"check_same_thread": False},
+                **pool_kwargs,
             )
 
             # Enable SQLite optimizations
@@ -76,8 +81,8 @@ def get_engine() -> AsyncEngine:
             _engine = create_async_engine(
                 settings.DATABASE_URL,
                 echo=settings.DEBUG,
-                pool_size=5,
-                max_overflow=10,
+                pool_size=settings.DB_POOL_SIZE,
+                max_overflow=settings.DB_MAX_OVERFLOW,
                 pool_pre_ping=True,
             )
 
@@ -20,6 +20,8 @@ Tests:
     - tests/unit/test_eval.py
 """
 
+from typing import TYPE_CHECKING, Any
+
 from app.eval.schemas import (
     EvalModelConfig,
     EvalModelResult,
@@ -27,7 +29,24 @@ from app.eval.schemas import (
     EvalRequest,
     ModelPreset,
 )
-from app.eval.runner import ModelEvaluator
+
+if TYPE_CHECKING:
+    from app.eval.runner import ModelEvaluator
+
+
+def __getattr__(name: str) -> Any:
+    """Import the runner on first use (PEP 562).
+
+    Keeps `from app.eval.schemas import ...` from pulling in the provider
+    SDKs that the runner depends on.
+    """
+    if name == "ModelEvaluator":
+        from app.eval.runner import ModelEvaluator
+
+        globals()[name] = ModelEvaluator
+        return ModelEvaluator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "EvalModelConfig",
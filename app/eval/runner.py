@@ -4,10 +4,12 @@ This module provides the ModelEvaluator class that runs the same prompt
 across multiple models in parallel and collects comparative metrics.
 
 Features:
-    - Parallel execution via asyncio.gather()
+    - Parallel execution, with results streamed as models finish
+    - Per-provider concurrency caps (EVAL_PROVIDER_CONCURRENCY)
     - Per-model timing measurement
     - Support for predefined model sets
     - Integration with existing rate limiting
+    - Opt-in replay of recent results (EvalRequest.use_cache)
 
 Examples:
     >>> evaluator = ModelEvaluator()
@@ -15,18 +17,26 @@ Examples:
     >>> comparison = await evaluator.compare(request)
     >>> for r in comparison.results:
     ...     print(f"{r.label}: {r.latency_ms}ms")
+
+    >>> async for result in evaluator.compare_stream(request):
+    ...     print(f"{result.label}: {result.latency_ms}ms")
 """
 
 import asyncio
+import contextlib
+import io
 import logging
 import time
-from datetime import datetime
-from typing import Any
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any, TextIO, cast
 
 from app.config import ProviderType, VerifiedModels, get_settings
-from app.core.providers import ModelCapability
+from app.core.providers import LLMProvider, ModelCapability
 from app.core.providers.google import GoogleProvider
 from app.core.providers.openrouter import OpenRouterProvider
+from app.core.rate_limiter import acquire_rate_limits
+from app.core.result_cache import ResultCache
 from app.eval.schemas import (
     EvalComparison,
     EvalModelConfig,
@@ -38,22 +48,44 @@ from app.eval.schemas import (
 
 logger = logging.getLogger(__name__)
 
+# Successful results by (model, provider, query), for EvalRequest.use_cache
+EVAL_CACHE_MAX_ENTRIES = 256
+EVAL_CACHE_TTL_SECONDS = 3600.0
+eval_cache = ResultCache(max_entries=EVAL_CACHE_MAX_ENTRIES, ttl_seconds=EVAL_CACHE_TTL_SECONDS)
 
-def get_preset_models(preset: ModelPreset) -> list[EvalModelConfig]:
-    """Get model configurations for a preset.
+# Concurrent calls allowed per provider within one evaluator, so large presets
+# queue instead of tripping upstream 429s
+EVAL_PROVIDER_CONCURRENCY = {"google": 4, "openrouter": 8}
+
+# Display names of the providers ModelEvaluator knows how to configure
+_PROVIDER_LABELS = {"google": "Google", "openrouter": "OpenRouter"}
+
+# Fixed pieces of the ASCII comparison report
+REPORT_WIDTH = 70
+_REPORT_BAR = "=" * REPORT_WIDTH
+_REPORT_RULE = "-" * REPORT_WIDTH
+_REPORT_TITLE = "MULTI-MODEL EVALUATION REPORT".center(REPORT_WIDTH)
+_REPORT_RESULTS_TITLE = "RESULTS (sorted by latency)".center(REPORT_WIDTH)
+_REPORT_STATS_TITLE = "STATISTICS".center(REPORT_WIDTH)
+_REPORT_MEDALS = ("1st", "2nd", "3rd")
+
+
+def _build_preset_models(preset: ModelPreset) -> tuple[EvalModelConfig, ...]:
+    """Expand a preset from VerifiedModels.
 
     Args:
         preset: The preset to expand
 
     Returns:
-        List of model configurations
+        Tuple of model configurations
     """
     models: list[EvalModelConfig] = []
 
+    # Configs come from the static model lists, so skip validation
     if preset in (ModelPreset.VERIFIED, ModelPreset.ALL, ModelPreset.GOOGLE_NATIVE):
         # Add Google native models
         for model_id in VerifiedModels.GOOGLE_TEXT:
-            models.append(EvalModelConfig(
+            models.append(EvalModelConfig.model_construct(
                 model_id=model_id,
                 provider="google",
                 label=f"Google {model_id}",
@@ -64,13 +96,35 @@ def get_preset_models(preset: ModelPreset) -> list[EvalModelConfig]:
         for model_id in VerifiedModels.OPENROUTER_TEXT:
             # Skip free models for more reliable comparison
             if ":free" not in model_id:
-                models.append(EvalModelConfig(
+                models.append(EvalModelConfig.model_construct(
                     model_id=model_id,
                     provider="openrouter",
                     label=f"OpenRouter {model_id.split('/')[-1]}",
                 ))
 
-    return models
+    return tuple(models)
+
+
+# Every preset expanded once at import; VerifiedModels is static
+_PRESET_MODELS: dict[ModelPreset, tuple[EvalModelConfig, ...]] = {
+    preset: _build_preset_models(preset) for preset in ModelPreset
+}
+
+
+# Shared response for ModelEvaluator.get_available_models (built on first use)
+_models_response: EvalModelsResponse | None = None
+
+
+def get_preset_models(preset: ModelPreset) -> list[EvalModelConfig]:
+    """Get model configurations for a preset.
+
+    Args:
+        preset: The preset to expand
+
+    Returns:
+        List of model configurations (shared; do not mutate the configs)
+    """
+    return list(_PRESET_MODELS[preset])
 
 
 def get_all_available_models() -> list[EvalModelConfig]:
@@ -102,8 +156,8 @@ class ModelEvaluator:
         """Initialize evaluator with providers."""
         settings = get_settings()
 
-        self.google_provider: GoogleProvider | None = None
-        self.openrouter_provider: OpenRouterProvider | None = None
+        # Configured providers by EvalModelConfig.provider name
+        self._providers: dict[str, LLMProvider] = {}
 
         if settings.has_provider(ProviderType.GOOGLE):
             self.google_provider = GoogleProvider(api_key=settings.GOOGLE_API_KEY)
@@ -113,6 +167,61 @@ class ModelEvaluator:
             self.openrouter_provider = OpenRouterProvider(api_key=settings.OPENROUTER_API_KEY)
             logger.info("Initialized OpenRouter provider for eval")
 
+        # Cap in-flight calls per provider; every model is still scheduled at once
+        self._semaphores: dict[str, asyncio.Semaphore] = {
+            provider: asyncio.Semaphore(limit)
+            for provider, limit in EVAL_PROVIDER_CONCURRENCY.items()
+        }
+
+        self._warmed = False
+
+    @property
+    def google_provider(self) -> GoogleProvider | None:
+        """Google API provider instance, if configured."""
+        return cast(GoogleProvider | None, self._providers.get("google"))
+
+    @google_provider.setter
+    def google_provider(self, provider: GoogleProvider | None) -> None:
+        self._set_provider("google", provider)
+
+    @property
+    def openrouter_provider(self) -> OpenRouterProvider | None:
+        """OpenRouter API provider instance, if configured."""
+        return cast(OpenRouterProvider | None, self._providers.get("openrouter"))
+
+    @openrouter_provider.setter
+    def openrouter_provider(self, provider: OpenRouterProvider | None) -> None:
+        self._set_provider("openrouter", provider)
+
+    def _set_provider(self, provider_name: str, provider: LLMProvider | None) -> None:
+        """Register (or with None, remove) the provider for a name."""
+        if provider is None:
+            self._providers.pop(provider_name, None)
+        else:
+            self._providers[provider_name] = provider
+
+    async def warmup(self) -> None:
+        """Prepare provider connections before the first timed call.
+
+        Builds the Gen AI client (a heavy first import) and opens a pooled
+        TLS connection to OpenRouter, so the first comparison measures the
+        models rather than connection setup. Only the first call does any
+        work, and failures are ignored.
+        """
+        if self._warmed:
+            return
+        self._warmed = True
+        if self.google_provider:
+            try:
+                _ = self.google_provider.client
+            except Exception as e:
+                logger.debug(f"Google warmup failed: {e}")
+        if self.openrouter_provider:
+            try:
+                await self.openrouter_provider.client.head("/models")
+            except Exception as e:
+                logger.debug(f"OpenRouter warmup failed: {e}")
+
     def _get_provider(self, provider_name: str):
         """Get provider instance by name.
 
@@ -125,22 +234,32 @@ class ModelEvaluator:
         Raises:
             ValueError: If provider not configured
         """
-        if provider_name == "google":
-            if not self.google_provider:
-                raise ValueError("Google provider not configured")
-            return self.google_provider
-        elif provider_name == "openrouter":
-            if not self.openrouter_provider:
-                raise ValueError("OpenRouter provider not configured")
-            return self.openrouter_provider
-        else:
+        provider = self._providers.get(provider_name)
+        if provider is None:
+            if provider_name in _PROVIDER_LABELS:
+                raise ValueError(f"{_PROVIDER_LABELS[provider_name]} provider not configured")
             raise ValueError(f"Unknown provider: {provider_name}")
+        return provider
+
+    def _sem_for(self, provider_name: str) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Get the concurrency limit for a provider.
+
+        Args:
+            provider_name: "google" or "openrouter"
+
+        Returns:
+            The provider's semaphore, or a no-op context for unknown providers
+            (which fail in _get_provider without making a call)
+        """
+        return self._semaphores.get(provider_name) or contextlib.nullcontext()
 
     async def run_single(
         self,
         model_config: EvalModelConfig,
         query: str,
         timeout_seconds: int = 120,
+        use_cache: bool = False,
+        include_full_output: bool = False,
     ) -> EvalModelResult:
         """Run evaluation for a single model.
 
@@ -148,70 +267,225 @@ class ModelEvaluator:
             model_config: Model configuration
             query: The prompt to send
             timeout_seconds: Maximum time to wait
+            use_cache: Replay a recent successful result for this model and
+                query if there is one (keeps its measured latency)
+            include_full_output: Keep the whole response in `output`; by
+                default only the preview and length are returned
 
         Returns:
             EvalModelResult with timing and output
         """
-        started_at = datetime.utcnow()
-        start_time = time.time()
+        cache_key = {
+            "model": model_config.model_id,
+            "provider": model_config.provider,
+            "query": query,
+        }
+        if use_cache and (cached := eval_cache.get(cache_key)) is not None:
+            now = datetime.now(timezone.utc)
+            update = {
+                "label": model_config.label,
+                "cached": True,
+                "started_at": now,
+                "completed_at": now,
+            }
+            if not include_full_output:
+                update["output"] = None
+            # eval_cache only ever holds EvalModelResults
+            return cast(EvalModelResult, cached.content).model_copy(update=update)
+
+        async with self._sem_for(model_config.provider):
+            # Time from slot acquisition so queueing isn't billed to the model
+            started_at = datetime.now(timezone.utc)
+            start_time = time.perf_counter()
+
+            output: str | None = None
+            error: str | None = None
+            try:
+                output = await self._call_provider(model_config, query, timeout_seconds)
+                latency_ms = int((time.perf_counter() - start_time) * 1000)
+            except asyncio.TimeoutError:
+                latency_ms = timeout_seconds * 1000
+                error = f"Timeout after {timeout_seconds}s"
+            except Exception as e:
+                latency_ms = int((time.perf_counter() - start_time) * 1000)
+                error = str(e)
+
+        # Results are built from trusted values, so skip validation
+        result = EvalModelResult.model_construct(
+            model_id=model_config.model_id,
+            provider=model_config.provider,
+            label=model_config.label,
+            success=error is None,
+            latency_ms=latency_ms,
+            output=output,
+            output_length=len(output) if output is not None else 0,
+            # output_length tells callers if the preview was cut
+            output_preview=output[:200] if output is not None else None,
+            error=error,
+            started_at=started_at,
+            completed_at=datetime.now(timezone.utc),
+        )
 
-        try:
-            provider = self._get_provider(model_config.provider)
+        # The cache stores a copy with the full output, so any request can replay it
+        if use_cache and error is None:
+            eval_cache.put(cache_key, result)
+        if not include_full_output:
+            result.output = None
+        return result
 
-            # Call the model with timeout
-            response = await asyncio.wait_for(
-                provider.call_text(query, model_config.model_id),
-                timeout=timeout_seconds,
-            )
+    async def _call_provider(
+        self,
+        model_config: EvalModelConfig,
+        query: str,
+        timeout_seconds: int,
+    ) -> str:
+        """Send the prompt to a model.
 
-            end_time = time.time()
-            latency_ms = int((end_time - start_time) * 1000)
-
-            # Extract output
-            output = response.content if response.content else ""
-            output_length = len(output)
-            output_preview = output[:200] + "..." if len(output) > 200 else output
-
-            return EvalModelResult(
-                model_id=model_config.model_id,
-                provider=model_config.provider,
-                label=model_config.label,
-                success=True,
-                latency_ms=latency_ms,
-                output=output,
-                output_length=output_length,
-                output_preview=output_preview,
-                error=None,
-                started_at=started_at,
-                completed_at=datetime.utcnow(),
-            )
+        Args:
+            model_config: Model configuration
+            query: The prompt to send
+            timeout_seconds: Maximum time to wait
 
-        except asyncio.TimeoutError:
-            return EvalModelResult(
-                model_id=model_config.model_id,
-                provider=model_config.provider,
-                label=model_config.label,
-                success=False,
-                latency_ms=timeout_seconds * 1000,
-                error=f"Timeout after {timeout_seconds}s",
-                started_at=started_at,
-                completed_at=datetime.utcnow(),
-            )
+        Returns:
+            The response text ("" if the model returned nothing)
 
-        except Exception as e:
-            end_time = time.time()
-            latency_ms = int((end_time - start_time) * 1000)
+        Raises:
+            asyncio.TimeoutError: If the model doesn't answer in time
+            Exception: Whatever the provider raised
+        """
+        provider = self._get_provider(model_config.provider)
+        response = await asyncio.wait_for(
+            provider.call_text(query, model_config.model_id),
+            timeout=timeout_seconds,
+        )
+        return response.content or ""
+
+    def _resolve_models(self, request: EvalRequest) -> list[EvalModelConfig]:
+        """Get the models a request should test.
+
+        Args:
+            request: Evaluation request with models or preset
+
+        Returns:
+            Explicit models, else the preset (VERIFIED by default)
+        """
+        if request.models:
+            return request.models
+        return get_preset_models(request.preset or ModelPreset.VERIFIED)
+
+    async def _run_guarded(
+        self,
+        index: int,
+        model: EvalModelConfig,
+        request: EvalRequest,
+    ) -> tuple[int, EvalModelResult]:
+        """Run one model, turning unexpected errors into a failed result.
+
+        Args:
+            index: Position of the model in the request
+            model: Model configuration
+            request: Evaluation request
 
-            return EvalModelResult(
-                model_id=model_config.model_id,
-                provider=model_config.provider,
-                label=model_config.label,
+        Returns:
+            (index, result) so callers can restore request order
+        """
+        try:
+            result = await self.run_single(
+                model,
+                request.query,
+                request.timeout_seconds,
+                use_cache=request.use_cache,
+                include_full_output=request.include_full_output,
+            )
+        except Exception as e:
+            now = datetime.now(timezone.utc)
+            result = EvalModelResult.model_construct(
+                model_id=model.model_id,
+                provider=model.provider,
+                label=model.label,
                 success=False,
-                latency_ms=latency_ms,
                 error=str(e),
-                started_at=started_at,
-                completed_at=datetime.utcnow(),
+                started_at=now,
+                completed_at=now,
             )
+        return index, result
+
+    async def _stream_indexed(
+        self,
+        models: list[EvalModelConfig],
+        request: EvalRequest,
+    ) -> AsyncIterator[tuple[int, EvalModelResult]]:
+        """Run models in parallel, yielding each result as it finishes.
+
+        Calls still running when the consumer stops are cancelled.
+
+        Args:
+            models: Models to test
+            request: Evaluation request
+
+        Yields:
+            (index, result) in completion order
+        """
+        logger.info(f"Running eval comparison with {len(models)} models")
+
+        tasks = [
+            asyncio.ensure_future(self._run_guarded(i, model, request))
+            for i, model in enumerate(models)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def prepare(self, request: EvalRequest) -> list[EvalModelConfig]:
+        """Resolve a request's models and get ready to run them untimed.
+
+        Warms up the providers and reserves rate limit tokens for the whole
+        burst (one step per tier). Any wait for tokens happens here, so
+        callers start their clock afterwards and it isn't billed as model time.
+
+        Args:
+            request: Evaluation request with query and models/preset
+
+        Returns:
+            The models to test (empty if there are none)
+        """
+        models = self._resolve_models(request)
+        if not models:
+            return models
+
+        await self.warmup()
+        if not await acquire_rate_limits(model.model_id for model in models):
+            logger.warning("Rate limit tokens not acquired for eval burst, proceeding anyway")
+        return models
+
+    async def compare_stream(
+        self,
+        request: EvalRequest,
+        models: list[EvalModelConfig] | None = None,
+    ) -> AsyncIterator[EvalModelResult]:
+        """Run multi-model comparison, yielding results as models finish.
+
+        The fastest model's result is available as soon as it returns rather
+        than after the slowest model (or its timeout).
+
+        Args:
+            request: Evaluation request with query and models/preset
+            models: Models returned by prepare(); when omitted, prepare()
+                runs first (so the first result also waits for any rate
+                limit reservation)
+
+        Yields:
+            EvalModelResult for each model, in completion order
+        """
+        if models is None:
+            models = await self.prepare(request)
+        if not models:
+            return
+        async for _, result in self._stream_indexed(models, request):
+            yield result
 
     async def compare(self, request: EvalRequest) -> EvalComparison:
         """Run multi-model comparison.
@@ -222,165 +496,166 @@ class ModelEvaluator:
             request: Evaluation request with query and models/preset
 
         Returns:
-            EvalComparison with all results and statistics
+            EvalComparison with all results (in request order) and statistics
         """
-        start_time = time.time()
-
-        # Get models to test
-        if request.models:
-            models = request.models
-        elif request.preset:
-            models = get_preset_models(request.preset)
-        else:
-            models = get_preset_models(ModelPreset.VERIFIED)
-
+        # Warm up and reserve tokens before the clock starts, so setup and
+        # rate limit waits aren't billed to the run
+        models = await self.prepare(request)
         if not models:
-            return EvalComparison(
+            return EvalComparison.model_construct(
                 query=request.query,
                 prompt_type=request.prompt_type,
                 models_tested=0,
             )
 
-        logger.info(f"Running eval comparison with {len(models)} models")
-
-        # Run all models in parallel
-        tasks = [
-            self.run_single(model, request.query, request.timeout_seconds)
-            for model in models
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results
-        processed_results: list[EvalModelResult] = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                # Create error result for exceptions
-                model = models[i]
-                processed_results.append(EvalModelResult(
-                    model_id=model.model_id,
-                    provider=model.provider,
-                    label=model.label,
-                    success=False,
-                    error=str(result),
-                    started_at=datetime.utcnow(),
-                    completed_at=datetime.utcnow(),
-                ))
-            else:
-                processed_results.append(result)
-
-        end_time = time.time()
-        total_duration_ms = int((end_time - start_time) * 1000)
-
-        # Build comparison
-        comparison = EvalComparison(
-            query=request.query,
-            prompt_type=request.prompt_type,
-            total_duration_ms=total_duration_ms,
-            results=processed_results,
-        )
-        comparison.compute_stats()
+        start_time = time.perf_counter()
 
-        logger.info(
-            f"Eval complete: {comparison.success_count}/{comparison.models_tested} successful, "
-            f"fastest={comparison.fastest_model}, "
-            f"total_time={total_duration_ms}ms"
-        )
+        by_index = {i: result async for i, result in self._stream_indexed(models, request)}
+        results = [by_index[i] for i in range(len(models))]
 
-        return comparison
+        total_duration_ms = int((time.perf_counter() - start_time) * 1000)
+        return build_comparison(request, results, total_duration_ms)
 
     def get_available_models(self) -> EvalModelsResponse:
         """Get all available models for evaluation.
 
         Returns:
-            Response with presets and model list
+            Response with presets and model list (shared; do not mutate)
         """
-        all_models = get_all_available_models()
-
-        presets = {
-            ModelPreset.VERIFIED.value: len(get_preset_models(ModelPreset.VERIFIED)),
-            ModelPreset.GOOGLE_NATIVE.value: len(get_preset_models(ModelPreset.GOOGLE_NATIVE)),
-            ModelPreset.OPENROUTER.value: len(get_preset_models(ModelPreset.OPENROUTER)),
-            ModelPreset.ALL.value: len(all_models),
-        }
-
-        return EvalModelsResponse(presets=presets, models=all_models)
+        global _models_response
+        if _models_response is None:
+            # Presets are static, so the response is built once and shared
+            _models_response = EvalModelsResponse.model_construct(
+                presets={preset.value: len(models) for preset, models in _PRESET_MODELS.items()},
+                models=get_all_available_models(),
+            )
+        return _models_response
 
     async def close(self) -> None:
         """Close provider connections."""
-        if self.google_provider and hasattr(self.google_provider, 'close'):
-            await self.google_provider.close()
-        if self.openrouter_provider and hasattr(self.openrouter_provider, 'close'):
-            await self.openrouter_provider.close()
+        for provider in self._providers.values():
+            if hasattr(provider, 'close'):
+                await provider.close()
+
+
+# Shared evaluator instance (initialized lazily)
+_evaluator: ModelEvaluator | None = None
+
+
+def get_evaluator() -> ModelEvaluator:
+    """Get or create the shared ModelEvaluator.
+
+    Reusing one evaluator keeps provider HTTP clients and their connection
+    pools alive across eval requests.
+
+    Returns:
+        The shared ModelEvaluator instance
+    """
+    global _evaluator
+    if _evaluator is None:
+        _evaluator = ModelEvaluator()
+    return _evaluator
 
 
-def format_comparison_report(comparison: EvalComparison) -> str:
+async def close_evaluator() -> None:
+    """Close the shared ModelEvaluator.
+
+    Should be called at application shutdown.
+    """
+    global _evaluator
+    if _evaluator is not None:
+        await _evaluator.close()
+        _evaluator = None
+
+
+def build_comparison(
+    request: EvalRequest,
+    results: list[EvalModelResult],
+    total_duration_ms: int,
+) -> EvalComparison:
+    """Build a comparison with statistics from collected results.
+
+    The results come from the runner, so they are not re-validated.
+
+    Args:
+        request: The evaluation request
+        results: Result for each model tested
+        total_duration_ms: Wall-clock time for the whole comparison
+
+    Returns:
+        EvalComparison with computed statistics
+    """
+    comparison = EvalComparison.model_construct(
+        query=request.query,
+        prompt_type=request.prompt_type,
+        total_duration_ms=total_duration_ms,
+        results=results,
+    )
+    comparison.compute_stats()
+
+    logger.info(
+        f"Eval complete: {comparison.success_count}/{comparison.models_tested} successful, "
+        f"fastest={comparison.fastest_model}, "
+        f"total_time={total_duration_ms}ms"
+    )
+
+    return comparison
+
+
+def format_comparison_report(comparison: EvalComparison, out: TextIO | None = None) -> str:
     """Format comparison results as an ASCII report.
 
     Args:
         comparison: The comparison results
+        out: Stream to write the report to instead of building a string
 
     Returns:
-        Formatted string report
+        Formatted string report ("" when written to `out`)
     """
-    lines = []
-    width = 70
-
-    lines.append("=" * width)
-    lines.append("MULTI-MODEL EVALUATION REPORT".center(width))
-    lines.append("=" * width)
-    lines.append("")
-    lines.append(f"Query: {comparison.query[:60]}{'...' if len(comparison.query) > 60 else ''}")
-    lines.append(f"Models Tested: {comparison.models_tested}")
-    lines.append(f"Total Time: {comparison.total_duration_ms}ms")
-    lines.append(f"Success Rate: {comparison.success_rate:.1f}%")
-    lines.append("")
-    lines.append("-" * width)
-    lines.append("RESULTS (sorted by latency)".center(width))
-    lines.append("-" * width)
-
-    # Sort by latency (successful first, then failed)
-    successful = sorted(
-        [r for r in comparison.results if r.success],
-        key=lambda r: r.latency_ms
-    )
+    own_buf: io.StringIO | None = None
+    if out is None:
+        out = own_buf = io.StringIO()
+    write = out.write
+
+    write(f"{_REPORT_BAR}\n{_REPORT_TITLE}\n{_REPORT_BAR}\n\n")
+    write(f"Query: {comparison.query[:60]}{'...' if len(comparison.query) > 60 else ''}\n")
+    write(f"Models Tested: {comparison.models_tested}\n")
+    write(f"Total Time: {comparison.total_duration_ms}ms\n")
+    write(f"Success Rate: {comparison.success_rate:.1f}%\n\n")
+    write(f"{_REPORT_RULE}\n{_REPORT_RESULTS_TITLE}\n{_REPORT_RULE}\n")
+
+    # Successful by latency (reusing compute_stats' order when current), then failed
+    successful = comparison.successful_by_latency()
     failed = [r for r in comparison.results if not r.success]
 
-    medals = ["1st", "2nd", "3rd"]
-
     for i, result in enumerate(successful):
-        rank = medals[i] if i < len(medals) else f"{i+1}th"
-        status = "OK"
-        lines.append(f"  {rank:4} {result.label[:35]:35} {result.latency_ms:6}ms  [{status}]")
+        rank = _REPORT_MEDALS[i] if i < len(_REPORT_MEDALS) else f"{i+1}th"
+        write(f"  {rank:4} {result.label[:35]:35} {result.latency_ms:6}ms  [OK]\n")
         if result.output_preview:
             preview = result.output_preview[:50].replace('\n', ' ')
-            lines.append(f"       Output: {preview}...")
+            write(f"       Output: {preview}...\n")
 
     for result in failed:
-        status = "FAIL"
-        lines.append(f"       {result.label[:35]:35} {'N/A':>6}   [{status}]")
+        write(f"       {result.label[:35]:35} {'N/A':>6}   [FAIL]\n")
         if result.error:
-            lines.append(f"       Error: {result.error[:50]}")
+            write(f"       Error: {result.error[:50]}\n")
 
-    lines.append("")
-    lines.append("-" * width)
-    lines.append("STATISTICS".center(width))
-    lines.append("-" * width)
+    write(f"\n{_REPORT_RULE}\n{_REPORT_STATS_TITLE}\n{_REPORT_RULE}\n")
 
-    if comparison.latency_stats.min_ms > 0:
-        lines.append(f"  Fastest: {comparison.fastest_model}")
-        lines.append(f"  Slowest: {comparison.slowest_model}")
-        lines.append(f"  Avg Latency: {comparison.latency_stats.avg_ms}ms")
-        lines.append(f"  Latency Range: {comparison.latency_stats.min_ms}ms - {comparison.latency_stats.max_ms}ms")
+    stats = comparison.latency_stats
+    if stats.min_ms > 0:
+        write(f"  Fastest: {comparison.fastest_model}\n")
+        write(f"  Slowest: {comparison.slowest_model}\n")
+        write(f"  Avg Latency: {stats.avg_ms}ms\n")
+        write(f"  Latency Range: {stats.min_ms}ms - {stats.max_ms}ms\n")
 
         # Calculate speedup factor
-        if comparison.latency_stats.avg_ms > 0:
-            speedup = comparison.latency_stats.avg_ms / comparison.latency_stats.min_ms
-            lines.append(f"  Fastest is {speedup:.1f}x faster than average")
+        if stats.avg_ms > 0:
+            speedup = stats.avg_ms / stats.min_ms
+            write(f"  Fastest is {speedup:.1f}x faster than average\n")
     else:
-        lines.append("  No successful results to analyze")
+        write("  No successful results to analyze\n")
 
-    lines.append("")
-    lines.append("=" * width)
+    write(f"\n{_REPORT_BAR}")
 
-    return "\n".join(lines)
+    return own_buf.getvalue() if own_buf is not None else ""
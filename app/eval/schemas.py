@@ -12,11 +12,11 @@ Examples:
     >>> request = EvalRequest(query="moon landing 1969", models=[config])
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ModelPreset(str, Enum):
@@ -58,12 +58,15 @@ class EvalModelResult(BaseModel):
         label: Human-readable model name
         success: Whether the call succeeded
         latency_ms: Time from request to response in milliseconds
-        output: The model's response text (truncated for large outputs)
+        output: The model's full response text (only when requested via
+            EvalRequest.include_full_output)
         output_length: Character count of full output
         output_preview: First 200 chars of output for display
         error: Error message if failed
         started_at: When the test started
         completed_at: When the test completed
+        cached: Whether the result was replayed from the eval cache
+            (latency_ms is then the originally measured latency)
     """
 
     model_id: str
@@ -77,6 +80,7 @@ class EvalModelResult(BaseModel):
     error: str | None = None
     started_at: datetime
     completed_at: datetime
+    cached: bool = False
 
     @property
     def latency_seconds(self) -> float:
@@ -123,7 +127,7 @@ class EvalComparison(BaseModel):
 
     query: str
     prompt_type: str = "text"
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     total_duration_ms: int = 0
     models_tested: int = 0
     results: list[EvalModelResult] = Field(default_factory=list)
@@ -135,11 +139,36 @@ class EvalComparison(BaseModel):
     latency_stats: EvalLatencyStats = Field(default_factory=EvalLatencyStats)
     ranking: list[str] = Field(default_factory=list)
 
+    # (results it was computed from, successful results by latency)
+    _latency_order: tuple[tuple[EvalModelResult, ...], list[EvalModelResult]] | None = (
+        PrivateAttr(default=None)
+    )
+
+    def successful_by_latency(self) -> list[EvalModelResult]:
+        """Successful results, fastest first.
+
+        The order is reused while results holds the same result objects as
+        when it was computed, and re-sorted otherwise.
+
+        Returns:
+            A new list of the successful results sorted by latency
+        """
+        results = tuple(self.results)
+        cached = self._latency_order
+        if cached is None or len(cached[0]) != len(results) or any(
+            old is not new for old, new in zip(cached[0], results, strict=True)
+        ):
+            successful = sorted((r for r in results if r.success), key=lambda r: r.latency_ms)
+            cached = self._latency_order = (results, successful)
+        return list(cached[1])
+
     def compute_stats(self) -> None:
         """Compute statistics from results."""
         self.models_tested = len(self.results)
 
-        successful = [r for r in self.results if r.success]
+        # Sort once; ranking, every latency statistic and the report read from it
+        self._latency_order = None
+        successful = self.successful_by_latency()
         self.success_count = len(successful)
         self.failure_count = self.models_tested - self.success_count
         self.success_rate = (
@@ -148,20 +177,19 @@ class EvalComparison(BaseModel):
         )
 
         if successful:
-            # Sort by latency
-            sorted_results = sorted(successful, key=lambda r: r.latency_ms)
-            self.ranking = [r.model_id for r in sorted_results]
+            self.ranking = [r.model_id for r in successful]
 
-            self.fastest_model = sorted_results[0].model_id
-            self.slowest_model = sorted_results[-1].model_id
+            self.fastest_model = successful[0].model_id
+            self.slowest_model = successful[-1].model_id
 
             latencies = [r.latency_ms for r in successful]
+            count = len(latencies)
             self.latency_stats = EvalLatencyStats(
-                min_ms=min(latencies),
-                max_ms=max(latencies),
-                avg_ms=int(sum(latencies) / len(latencies)),
-                median_ms=latencies[len(latencies) // 2],
-                range_ms=max(latencies) - min(latencies),
+                min_ms=latencies[0],
+                max_ms=latencies[-1],
+                avg_ms=sum(latencies) // count,
+                median_ms=(latencies[(count - 1) // 2] + latencies[count // 2]) // 2,
+                range_ms=latencies[-1] - latencies[0],
             )
 
 
@@ -174,6 +202,10 @@ class EvalRequest(BaseModel):
         preset: Predefined model set to use (alternative to models)
         prompt_type: Type of prompt for context
         timeout_seconds: Maximum time per model call
+        use_cache: Replay recent successful results for the same model
+            and query instead of calling the provider again
+        include_full_output: Return each model's full response rather than
+            just its preview and length
     """
 
     query: str = Field(..., min_length=1, description="Prompt to evaluate")
@@ -185,6 +217,12 @@ class EvalRequest(BaseModel):
     )
     prompt_type: str = Field("text", description="Type of prompt")
     timeout_seconds: int = Field(120, ge=10, le=600, description="Timeout per model")
+    use_cache: bool = Field(
+        False, description="Reuse recent results for identical model and query"
+    )
+    include_full_output: bool = Field(
+        False, description="Return full model responses, not just previews"
+    )
 
     def model_post_init(self, __context: Any) -> None:
         """Validate that either models or preset is provided."""
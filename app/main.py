@@ -29,8 +29,11 @@ from pydantic import BaseModel
 
 from app import __version__
 from app.api.v1 import router as v1_router
+from app.api.v1.models import close_http_client as close_models_client
 from app.config import get_settings, validate_presets_or_raise
+from app.core.providers.openrouter import close_http_clients as close_openrouter_clients
 from app.database import check_db_connection, close_db, init_db
+from app.eval.runner import close_evaluator
 
 # Configure logging
 logging.basicConfig(
@@ -90,6 +93,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down TIMEPOINT Flash")
+    await close_models_client()
+    await close_evaluator()
+    await close_openrouter_clients()
     await close_db()
 
 
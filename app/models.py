@@ -30,10 +30,13 @@ from sqlalchemy import (
     DateTime,
     Enum as SQLEnum,
     ForeignKey,
+    Index,
     String,
     Text,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -365,12 +368,28 @@ class ChatSessionModel(Base):
         id: Unique session identifier (UUID)
         timepoint_id: Associated timepoint
         character_name: Name of the character being chatted with
-        messages_json: JSON array of chat messages
+        messages_json: JSON array of chat messages (JSONB on PostgreSQL)
         created_at: Session creation timestamp
         updated_at: Last message timestamp
     """
 
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # Latest sessions per timepoint/character; the prefix also serves
+        # timepoint_id lookups, so that column needs no index of its own
+        Index(
+            "ix_chat_sessions_timepoint_character_created",
+            "timepoint_id",
+            "character_name",
+            text("created_at DESC"),
+        ),
+        # GIN index for JSONB containment queries (PostgreSQL only)
+        Index(
+            "ix_chat_sessions_messages_gin",
+            "messages_json",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36),
@@ -380,11 +399,10 @@ class ChatSessionModel(Base):
     timepoint_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("timepoints.id"),
-        index=True,
     )
     character_name: Mapped[str] = mapped_column(String(100), index=True)
     messages_json: Mapped[list[dict[str, Any]] | None] = mapped_column(
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         default=list,
     )
     created_at: Mapped[datetime] = mapped_column(
@@ -8,6 +8,9 @@ Examples:
     >>> prompt = get_prompt(query, year, era, location, setting, ...)
 """
 
+import functools
+import string
+
 SYSTEM_PROMPT = """You are a historical character planner for TIMEPOINT, an AI system that
 generates immersive visual scenes from temporal moments.
 
@@ -77,6 +80,12 @@ Respond with valid JSON:
 
 Keep it FAST - detailed descriptions come next."""
 
+# USER_PROMPT_TEMPLATE parsed once into (literal text, placeholder) pairs,
+# with "{{"/"}}" already unescaped
+_USER_PROMPT_PARTS: tuple[tuple[str, str | None], ...] = tuple(
+    (literal, field) for literal, field, _, _ in string.Formatter().parse(USER_PROMPT_TEMPLATE)
+)
+
 
 def get_prompt(
     query: str,
@@ -103,21 +112,48 @@ def get_prompt(
     Returns:
         Formatted user prompt
     """
-    year_str = f"{abs(year)} BCE" if year < 0 else str(year)
-    figures_str = ", ".join(detected_figures) if detected_figures else "None detected"
-
-    return USER_PROMPT_TEMPLATE.format(
-        query=query,
-        year=year_str,
-        era=era or "Unknown",
-        location=location,
-        setting=setting,
-        atmosphere=atmosphere,
-        tension_level=tension_level,
-        detected_figures=figures_str,
+    return _render_prompt(
+        query,
+        year,
+        era,
+        location,
+        setting,
+        atmosphere,
+        tension_level,
+        tuple(detected_figures) if detected_figures else (),
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _render_prompt(
+    query: str,
+    year: int,
+    era: str | None,
+    location: str,
+    setting: str,
+    atmosphere: str,
+    tension_level: str,
+    detected_figures: tuple[str, ...],
+) -> str:
+    """Cached core of get_prompt (figures as a hashable tuple)."""
+    values = {
+        "query": query,
+        "year": f"{abs(year)} BCE" if year < 0 else str(year),
+        "era": era or "Unknown",
+        "location": location,
+        "setting": setting,
+        "atmosphere": atmosphere,
+        "tension_level": tension_level,
+        "detected_figures": ", ".join(detected_figures) if detected_figures else "None detected",
+    }
+
+    # Equivalent to USER_PROMPT_TEMPLATE.format(**values) without re-parsing it
+    return "".join([
+        literal if field is None else f"{literal}{values[field]}"
+        for literal, field in _USER_PROMPT_PARTS
+    ])
+
+
 def get_system_prompt() -> str:
     """Get the system prompt for character identification."""
     return SYSTEM_PROMPT
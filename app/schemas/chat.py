@@ -16,11 +16,13 @@ Tests:
 
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Callable
 from datetime import datetime
 from enum import Enum
-from typing import Literal
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 
 # =============================================================================
@@ -46,6 +48,9 @@ class ChatMessage(BaseModel):
         timestamp: When the message was sent
     """
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     role: ChatRole = Field(..., description="Message sender role")
     content: str = Field(..., description="Message content")
     character_name: str | None = Field(
@@ -57,14 +62,29 @@ class ChatMessage(BaseModel):
         description="Message timestamp",
     )
 
+    # Prompt line builders by role (one dict lookup per message)
+    _PROMPT_FORMATTERS: ClassVar[dict[ChatRole, Callable[[ChatMessage], str]]] = {
+        ChatRole.USER: lambda m: f"User: {m.content}",
+        ChatRole.CHARACTER: lambda m: f"{m.character_name or 'Character'}: {m.content}",
+        ChatRole.SYSTEM: lambda m: f"[System: {m.content}]",
+    }
+
     def to_prompt_format(self) -> str:
         """Convert to format for LLM prompt."""
-        if self.role == ChatRole.USER:
-            return f"User: {self.content}"
-        elif self.role == ChatRole.CHARACTER:
-            return f"{self.character_name or 'Character'}: {self.content}"
-        else:
-            return f"[System: {self.content}]"
+        return self._PROMPT_FORMATTERS[self.role](self)
+
+    @classmethod
+    def join_transcript(cls, messages: list[ChatMessage]) -> str:
+        """Render messages as prompt lines, one per message.
+
+        Args:
+            messages: Messages in conversation order
+
+        Returns:
+            Newline-joined to_prompt_format() lines
+        """
+        formatters = cls._PROMPT_FORMATTERS
+        return "\n".join([formatters[m.role](m) for m in messages])
 
 
 class ResponseFormat(str, Enum):
@@ -173,6 +193,9 @@ class ChatSession(BaseModel):
 class ChatSessionSummary(BaseModel):
     """Summary of a chat session for listing."""
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     id: str
     character_name: str
     message_count: int
@@ -314,6 +337,9 @@ class CharacterSurveyResponse(BaseModel):
         emotional_tone: Emotional tone of response
     """
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     character_name: str = Field(..., description="Character name")
     question: str = Field(..., description="Question asked")
     response: str = Field(..., description="Character's response")
@@ -334,6 +360,10 @@ class CharacterSurveyResponse(BaseModel):
 class SurveyResult(BaseModel):
     """Complete survey results.
 
+    Response lookups are indexed. Assigning a new responses list rebuilds the
+    index; mutating the list in place (append, item assignment) is not
+    supported and leaves lookups stale.
+
     Attributes:
         timepoint_id: Associated timepoint
         questions: Questions that were asked
@@ -343,6 +373,9 @@ class SurveyResult(BaseModel):
         total_characters: Number of characters surveyed
     """
 
+    # Validate assignments so replacing responses resets the indexes
+    model_config = ConfigDict(validate_assignment=True)
+
     timepoint_id: str = Field(..., description="Timepoint ID")
     questions: list[str] = Field(..., description="Questions asked")
     responses: list[CharacterSurveyResponse] = Field(
@@ -356,13 +389,47 @@ class SurveyResult(BaseModel):
     mode: SurveyMode = Field(..., description="Execution mode used")
     total_characters: int = Field(..., description="Number of characters surveyed")
 
+    # Lookup indexes, built on first use; None until then
+    _by_character: dict[str, list[CharacterSurveyResponse]] | None = PrivateAttr(default=None)
+    _by_question: dict[str, list[CharacterSurveyResponse]] | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _reset_indexes(self) -> SurveyResult:
+        """Drop the lookup indexes whenever the model is (re)validated."""
+        self._by_character = None
+        self._by_question = None
+        return self
+
+    def _ensure_indexes(
+        self,
+    ) -> tuple[dict[str, list[CharacterSurveyResponse]], dict[str, list[CharacterSurveyResponse]]]:
+        """Build the lookup indexes if they are not built yet.
+
+        Returns:
+            (responses by lowercased character name, responses by question)
+        """
+        if self._by_character is not None and self._by_question is not None:
+            return self._by_character, self._by_question
+
+        by_character: dict[str, list[CharacterSurveyResponse]] = defaultdict(list)
+        by_question: dict[str, list[CharacterSurveyResponse]] = defaultdict(list)
+        for response in self.responses:
+            by_character[response.character_name.lower()].append(response)
+            by_question[response.question].append(response)
+
+        self._by_character = dict(by_character)
+        self._by_question = dict(by_question)
+        return self._by_character, self._by_question
+
     def get_responses_by_character(self, name: str) -> list[CharacterSurveyResponse]:
         """Get all responses from a specific character."""
-        return [r for r in self.responses if r.character_name.lower() == name.lower()]
+        by_character, _ = self._ensure_indexes()
+        return list(by_character.get(name.lower(), ()))
 
     def get_responses_by_question(self, question: str) -> list[CharacterSurveyResponse]:
         """Get all responses to a specific question."""
-        return [r for r in self.responses if r.question == question]
+        _, by_question = self._ensure_indexes()
+        return list(by_question.get(question, ()))
 
 
 # =============================================================================
@@ -379,10 +446,28 @@ class ChatStreamEvent(BaseModel):
         character_name: Character name (for context)
     """
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     event: Literal["token", "done", "error"] = Field(..., description="Event type")
     data: str = Field(..., description="Event data")
     character_name: str | None = Field(default=None, description="Character name")
 
+    @classmethod
+    def token(cls, data: str, character_name: str | None = None) -> ChatStreamEvent:
+        """Build a token event without validation (for trusted server code)."""
+        return cls.model_construct(event="token", data=data, character_name=character_name)
+
+    @classmethod
+    def done(cls, data: str, character_name: str | None = None) -> ChatStreamEvent:
+        """Build a done event without validation (for trusted server code)."""
+        return cls.model_construct(event="done", data=data, character_name=character_name)
+
+    @classmethod
+    def error(cls, data: str, character_name: str | None = None) -> ChatStreamEvent:
+        """Build an error event without validation (for trusted server code)."""
+        return cls.model_construct(event="error", data=data, character_name=character_name)
+
 
 class DialogStreamEvent(BaseModel):
     """SSE event for dialog streaming.
@@ -394,11 +479,31 @@ class DialogStreamEvent(BaseModel):
         line_number: Line number in sequence
     """
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     event: Literal["line", "done", "error"] = Field(..., description="Event type")
     data: dict | str = Field(..., description="Event data")
     speaker: str | None = Field(default=None, description="Speaker name")
     line_number: int | None = Field(default=None, description="Line number")
 
+    @classmethod
+    def line(cls, data: dict | str, speaker: str, line_number: int) -> DialogStreamEvent:
+        """Build a line event without validation (for trusted server code)."""
+        return cls.model_construct(
+            event="line", data=data, speaker=speaker, line_number=line_number
+        )
+
+    @classmethod
+    def done(cls, data: dict | str) -> DialogStreamEvent:
+        """Build a done event without validation (for trusted server code)."""
+        return cls.model_construct(event="done", data=data)
+
+    @classmethod
+    def error(cls, data: str) -> DialogStreamEvent:
+        """Build an error event without validation (for trusted server code)."""
+        return cls.model_construct(event="error", data=data)
+
 
 class SurveyStreamEvent(BaseModel):
     """SSE event for survey streaming.
@@ -411,6 +516,9 @@ class SurveyStreamEvent(BaseModel):
         progress: Progress through survey (0-100)
     """
 
+    # Built once and never modified
+    model_config = ConfigDict(frozen=True)
+
     event: Literal["response", "summary", "done", "error"] = Field(
         ...,
         description="Event type",
@@ -419,3 +527,30 @@ class SurveyStreamEvent(BaseModel):
     character_name: str | None = Field(default=None, description="Character name")
     question: str | None = Field(default=None, description="Current question")
     progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
+
+    @classmethod
+    def response(
+        cls,
+        data: dict | str,
+        character_name: str,
+        question: str,
+        progress: int,
+    ) -> SurveyStreamEvent:
+        """Build a response event without validation (for trusted server code)."""
+        return cls.model_construct(
+            event="response",
+            data=data,
+            character_name=character_name,
+            question=question,
+            progress=progress,
+        )
+
+    @classmethod
+    def done(cls, data: dict | str) -> SurveyStreamEvent:
+        """Build a done event without validation (for trusted server code)."""
+        return cls.model_construct(event="done", data=data, progress=100)
+
+    @classmethod
+    def error(cls, data: str) -> SurveyStreamEvent:
+        """Build an error event without validation (for trusted server code)."""
+        return cls.model_construct(event="error", data=data)
@@ -1,25 +1,42 @@
 """
 Google Generative AI Suite integration.
 """
-import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
-from pydantic import BaseModel
-from typing import Type, TypeVar, Optional, Any
+import functools
 import json
 import logging
+from typing import Any, Optional, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Configure the SDK
-if settings.GOOGLE_API_KEY:
-    genai.configure(api_key=settings.GOOGLE_API_KEY)
-else:
+if not settings.GOOGLE_API_KEY:
     logger.warning("GOOGLE_API_KEY not set. Google AI calls will fail.")
 
+# google.generativeai, imported and configured on first Google call (see _ensure_genai)
+genai: Any = None
+
+def _ensure_genai() -> Any:
+    """
+    Import and configure the Google SDK on first use.
+
+    The SDK pulls in gRPC and protobuf, so OpenRouter-only deployments never load it.
+    """
+    global genai
+    if genai is None:
+        import google.generativeai as _genai
+
+        # Configure the SDK
+        if settings.GOOGLE_API_KEY:
+            _genai.configure(api_key=settings.GOOGLE_API_KEY)
+        genai = _genai
+    return genai
+
 T = TypeVar('T', bound=BaseModel)
 
-def _truncate_long_fields(data: dict, model: Type[BaseModel]) -> dict:
+def _truncate_long_fields(data: dict, model: type[BaseModel]) -> dict:
     """
     Truncate string fields that exceed max_length constraints in the Pydantic model.
 
@@ -72,7 +89,11 @@ def _is_valid_google_key() -> bool:
     invalid_values = {"placeholder", "your_key_here", "YOUR_API_KEY", ""}
     return settings.GOOGLE_API_KEY.strip() not in invalid_values
 
-def _get_safety_settings():
+@functools.lru_cache(maxsize=1)
+def _safety_settings() -> dict:
+    """Safety thresholds shared by every Gemini call, built once after the SDK loads."""
+    from google.generativeai.types import HarmBlockThreshold, HarmCategory
+
     return {
         HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
         HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_ONLY_HIGH,
@@ -80,7 +101,45 @@ def _get_safety_settings():
         HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_ONLY_HIGH,
     }
 
-def _clean_schema_for_google(schema: dict, is_root: bool = True) -> dict:
+# Fields to remove at all levels
+# Google's protobuf Schema only supports: type, format, description, nullable, enum, items, properties, required
+_UNSUPPORTED_SCHEMA_FIELDS: frozenset[str] = frozenset({
+    "default",
+    "examples",
+    "additionalProperties",
+    "title",
+    "$defs",
+    "definitions",
+    "anyOf",  # Union types - not supported
+    "oneOf",  # Alternative union syntax
+    "allOf",  # Composition - not supported
+    "not",  # Negation - not supported
+    "const",  # Constant values - use enum instead
+    "minLength",  # String constraints
+    "maxLength",
+    "pattern",
+    "minimum",  # Number constraints
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "multipleOf",
+    "minItems",  # Array constraints
+    "maxItems",
+    "uniqueItems",
+    "minProperties",  # Object constraints
+    "maxProperties",
+    "patternProperties",
+    "dependencies",
+    "propertyNames",
+    "if",  # Conditional schemas
+    "then",
+    "else",
+    "$schema",  # Schema metadata
+    "$id",
+    "$ref",  # References - inline instead
+})
+
+def _clean_schema_for_google(schema: dict) -> dict:
     """
     Remove fields from Pydantic schema that Google's protobuf doesn't support.
 
@@ -90,74 +149,110 @@ def _clean_schema_for_google(schema: dict, is_root: bool = True) -> dict:
     - "examples", "additionalProperties" and other JSON Schema extensions
     - "$defs" (use inline definitions instead)
 
-    This recursively cleans the schema to be compatible.
+    Walks the schema with an explicit stack (no recursion), building the
+    cleaned copy as it goes; the input is not modified.
     """
     if not isinstance(schema, dict):
         return schema
 
-    # Fields to remove at all levels
-    # Google's protobuf Schema only supports: type, format, description, nullable, enum, items, properties, required
-    unsupported_fields = {
-        "default",
-        "examples",
-        "additionalProperties",
-        "title",
-        "$defs",
-        "definitions",
-        "anyOf",  # Union types - not supported
-        "oneOf",  # Alternative union syntax
-        "allOf",  # Composition - not supported
-        "not",  # Negation - not supported
-        "const",  # Constant values - use enum instead
-        "minLength",  # String constraints
-        "maxLength",
-        "pattern",
-        "minimum",  # Number constraints
-        "maximum",
-        "exclusiveMinimum",
-        "exclusiveMaximum",
-        "multipleOf",
-        "minItems",  # Array constraints
-        "maxItems",
-        "uniqueItems",
-        "minProperties",  # Object constraints
-        "maxProperties",
-        "patternProperties",
-        "dependencies",
-        "propertyNames",
-        "if",  # Conditional schemas
-        "then",
-        "else",
-        "$schema",  # Schema metadata
-        "$id",
-        "$ref",  # References - inline instead
-    }
+    cleaned: dict = {}
+    # (source dict, cleaned dict to fill)
+    stack = [(schema, cleaned)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            # Skip unsupported fields
+            if key in _UNSUPPORTED_SCHEMA_FIELDS:
+                continue
+
+            # Clean nested dicts
+            if isinstance(value, dict):
+                child = target[key] = {}
+                stack.append((value, child))
+            # Clean dicts inside lists
+            elif isinstance(value, list):
+                items = target[key] = []
+                for item in value:
+                    if isinstance(item, dict):
+                        child = {}
+                        stack.append((item, child))
+                        items.append(child)
+                    else:
+                        items.append(item)
+            else:
+                target[key] = value
 
-    cleaned = {}
-    for key, value in schema.items():
-        # Skip unsupported fields
-        if key in unsupported_fields:
-            continue
+    return cleaned
 
-        # Recursively clean nested dicts
-        if isinstance(value, dict):
-            cleaned[key] = _clean_schema_for_google(value, is_root=False)
-        # Recursively clean lists of dicts
-        elif isinstance(value, list):
-            cleaned[key] = [
-                _clean_schema_for_google(item, is_root=False) if isinstance(item, dict) else item
-                for item in value
-            ]
-        else:
-            cleaned[key] = value
+@functools.lru_cache(maxsize=256)
+def _schema_json_for(model: type[BaseModel]) -> str:
+    """
+    Pretty-printed JSON schema of a response model, for the system prompt.
 
-    return cleaned
+    Schema generation is a pure function of the class, so it runs once per model.
+    """
+    return json.dumps(model.model_json_schema(), indent=2)
+
+# Map model names to OpenRouter equivalents
+# Gemini 2.5 models use same name in OpenRouter: google/gemini-2.5-*
+# Gemini 1.5 models have different naming on OpenRouter
+_OPENROUTER_MODEL_MAP: dict[str, str] = {
+    # Gemini 2.5 (current, recommended)
+    "gemini-2.5-flash": "google/gemini-2.5-flash",
+    "gemini-2.5-pro": "google/gemini-2.5-pro",
+    # Gemini 1.5 (legacy, may be deprecated on OpenRouter)
+    "gemini-1.5-flash": "google/gemini-pro-1.5",  # fallback to pro
+    "gemini-1.5-pro": "google/gemini-pro-1.5",
+    "gemini-1.5-flash-latest": "google/gemini-pro-1.5",
+    "gemini-1.5-pro-latest": "google/gemini-pro-1.5",
+}
+
+@functools.lru_cache(maxsize=1)
+def _model_aliases() -> dict[str, str]:
+    """
+    Generic model names ("judge", "creative") mapped to configured models.
+
+    Settings are loaded once at import, so the map is built on first use.
+    """
+    return {
+        "judge": settings.JUDGE_MODEL,
+        "creative": settings.CREATIVE_MODEL,
+    }
+
+@functools.lru_cache(maxsize=128)
+def _get_gen_model(
+    model_name: str,
+    system_instruction: str,
+    temperature: float,
+    max_tokens: int
+) -> Any:
+    """
+    JSON-mode GenerativeModel for a model/system prompt/config combination.
+
+    Models hold no per-request state, so repeat calls (e.g. chat turns with the
+    same character and schema) reuse one instance instead of rebuilding it.
+    """
+    genai = _ensure_genai()
+
+    # Create the model without response_schema (instructor will handle validation)
+    # Note: Using JSON mode without schema for better compatibility
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_instruction,
+        safety_settings=_safety_settings(),
+        generation_config=genai.GenerationConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            response_mime_type="application/json"
+            # Not using response_schema - let instructor validate instead
+        )
+    )
 
 async def call_llm(
     model: str,
     system_prompt: str,
     user_prompt: str,
-    response_model: Type[T],
+    response_model: type[T],
     temperature: float = 0.7,
     max_tokens: int = 8192
 ) -> T:
@@ -169,31 +264,14 @@ async def call_llm(
     try:
         # Use configured model or fallback to config default
         # Map "judge" etc to actual model names if passed generic names
-        actual_model = model
-        if model == "judge":
-            actual_model = settings.JUDGE_MODEL
-        elif model == "creative":
-            actual_model = settings.CREATIVE_MODEL
+        actual_model = _model_aliases().get(model, model)
 
         # If no valid Google API key, route to OpenRouter
         if not _is_valid_google_key():
             logger.info(f"[GoogleAI] No valid Google API key, routing to OpenRouter for {actual_model}")
             from app.services.openrouter import call_llm as openrouter_call_llm
 
-            # Map model names to OpenRouter equivalents
-            # Gemini 2.5 models use same name in OpenRouter: google/gemini-2.5-*
-            # Gemini 1.5 models have different naming on OpenRouter
-            openrouter_models = {
-                # Gemini 2.5 (current, recommended)
-                "gemini-2.5-flash": "google/gemini-2.5-flash",
-                "gemini-2.5-pro": "google/gemini-2.5-pro",
-                # Gemini 1.5 (legacy, may be deprecated on OpenRouter)
-                "gemini-1.5-flash": "google/gemini-pro-1.5",  # fallback to pro
-                "gemini-1.5-pro": "google/gemini-pro-1.5",
-                "gemini-1.5-flash-latest": "google/gemini-pro-1.5",
-                "gemini-1.5-pro-latest": "google/gemini-pro-1.5",
-            }
-            openrouter_model = openrouter_models.get(actual_model, f"google/{actual_model}")
+            openrouter_model = _OPENROUTER_MODEL_MAP.get(actual_model, f"google/{actual_model}")
 
             return await openrouter_call_llm(
                 model=openrouter_model,
@@ -207,21 +285,9 @@ async def call_llm(
         logger.info(f"[GoogleAI] Calling {actual_model}")
 
         # Create enhanced system prompt with schema information
-        schema_prompt = f"{system_prompt}\n\nIMPORTANT: You MUST return valid JSON that EXACTLY matches this schema:\n{json.dumps(response_model.model_json_schema(), indent=2)}"
-
-        # Create the model without response_schema (instructor will handle validation)
-        # Note: Using JSON mode without schema for better compatibility
-        gen_model = genai.GenerativeModel(
-            model_name=actual_model,
-            system_instruction=schema_prompt,
-            safety_settings=_get_safety_settings(),
-            generation_config=genai.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                response_mime_type="application/json"
-                # Not using response_schema - let instructor validate instead
-            )
-        )
+        schema_prompt = f"{system_prompt}\n\nIMPORTANT: You MUST return valid JSON that EXACTLY matches this schema:\n{_schema_json_for(response_model)}"
+
+        gen_model = _get_gen_model(actual_model, schema_prompt, temperature, max_tokens)
 
         # Generate content
         response = await gen_model.generate_content_async(user_prompt)
@@ -230,6 +296,12 @@ async def call_llm(
         json_text = response.text
         logger.info(f"[GoogleAI] Response received ({len(json_text)} chars)")
 
+        # Fast path: pydantic's native JSON parser, no intermediate dict
+        try:
+            return response_model.model_validate_json(json_text)
+        except ValidationError:
+            pass
+
         # Parse JSON to dict first
         data = json.loads(json_text)
 
@@ -263,6 +335,7 @@ async def generate_image(prompt: str, model: str = None) -> str:
     logger.info(f"[Imagen] Generating image with {model}")
     
     try:
+        genai = _ensure_genai()
         gen_model = genai.GenerativeModel(model)
         
         # Attempt 1: Use generate_images (standard for Imagen models in some SDKs)
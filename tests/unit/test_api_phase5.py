@@ -2,11 +2,17 @@
 
 Tests:
     - Streaming endpoint models
+    - Chat token SSE framing
     - Delete endpoint models
     - Temporal navigation models
     - Model discovery endpoints
 """
 
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -15,6 +21,7 @@ from app.api.v1.timepoints import (
     GenerateRequest,
     StreamEvent,
 )
+from app.api.v1.interactions import token_sse_formatter
 from app.api.v1.temporal import (
     NavigationRequest,
     NavigationResponse,
@@ -24,6 +31,8 @@ from app.api.v1.models import (
     ModelListResponse,
     ProviderStatus,
     ProvidersResponse,
+    _parse_openrouter_models,
+    get_configured_model,
     get_configured_models,
 )
 
@@ -111,6 +120,23 @@ class TestStreamEvent:
         assert "abc123" in json_str
 
 
+@pytest.mark.fast
+class TestTokenSseFormatter:
+    """Tests for token_sse_formatter."""
+
+    def test_matches_json_dumps(self):
+        """Test frames are identical to json.dumps of the full event."""
+        format_token = token_sse_formatter('Jean "Le Rond" d\'Alembert')
+
+        for token in ["Hello", ' "quoted"\n', "café ☕", ""]:
+            event = {
+                "event": "token",
+                "data": token,
+                "character_name": 'Jean "Le Rond" d\'Alembert',
+            }
+            assert format_token(token) == f"data: {json.dumps(event)}\n\n"
+
+
 # DeleteResponse Tests
 
 
@@ -327,3 +353,117 @@ class TestGetConfiguredModels:
             assert model.id is not None
             assert model.name is not None
             assert model.provider is not None
+
+    def test_lookup_by_id(self):
+        """Test that configured models can be looked up by ID."""
+        for model in get_configured_models():
+            assert get_configured_model(model.id) is model
+        assert get_configured_model("nonexistent-model-id") is None
+
+    def test_returns_fresh_list(self):
+        """Test that callers can extend the returned list without affecting the cache."""
+        models = get_configured_models()
+        models.append(ModelInfo(id="extra", name="Extra", provider="test"))
+        assert all(m.id != "extra" for m in get_configured_models())
+
+
+# OpenRouter Model Parsing Tests
+
+
+OPENROUTER_PAYLOAD = b"""{
+    "data": [
+        {
+            "id": "meta/llama:free",
+            "name": "Llama (free)",
+            "context_length": 131072,
+            "architecture": {"modality": "text+image->text"},
+            "pricing": {"prompt": "0", "completion": "0"},
+            "description": "ignored"
+        },
+        {
+            "id": "openai/gpt-4o",
+            "context_length": 128000,
+            "pricing": {"prompt": "0.000005", "completion": "0.000015"}
+        }
+    ]
+}"""
+
+
+@pytest.mark.fast
+class TestParseOpenRouterModels:
+    """Tests for _parse_openrouter_models function."""
+
+    def test_parses_all_models(self):
+        """Test parsing capabilities, pricing and defaults."""
+        models = _parse_openrouter_models(OPENROUTER_PAYLOAD)
+        assert [m.id for m in models] == ["meta/llama:free", "openai/gpt-4o"]
+
+        free, paid = models
+        assert free.capabilities == ["text", "vision"]
+        assert free.is_free is True
+        assert free.modality == "text+image->text"
+        assert paid.name == "openai/gpt-4o"
+        assert paid.capabilities == ["text"]
+        assert paid.modality == "text->text"
+        assert paid.pricing == {"prompt": 0.000005, "completion": 0.000015}
+        assert paid.is_free is False
+        assert paid.is_available is True
+
+    def test_free_only(self):
+        """Test filtering to free models."""
+        models = _parse_openrouter_models(OPENROUTER_PAYLOAD, free_only=True)
+        assert [m.id for m in models] == ["meta/llama:free"]
+
+    def test_serializes_like_validated_model(self):
+        """Test that parsed models serialize the same as validated ones."""
+        parsed = _parse_openrouter_models(OPENROUTER_PAYLOAD)[1]
+        validated = ModelInfo.model_validate(parsed.model_dump())
+        assert parsed.model_dump_json() == validated.model_dump_json()
+
+
+@pytest.mark.fast
+class TestFetchOpenRouterModels:
+    """Tests for fetch_openrouter_models caching."""
+
+    async def test_concurrent_misses_share_one_fetch(self, monkeypatch):
+        """Test that concurrent cache misses issue a single upstream request."""
+        from app.api.v1 import models as models_module
+
+        monkeypatch.setattr(models_module, "_model_cache", {})
+        monkeypatch.setattr(models_module, "_cache_deadline", 0.0)
+
+        calls = 0
+
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, content=OPENROUTER_PAYLOAD)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch.object(models_module, "_get_http_client", return_value=client):
+            results = await asyncio.gather(
+                *(models_module.fetch_openrouter_models() for _ in range(5))
+            )
+        await client.aclose()
+
+        assert calls == 1
+        assert all([m.id for m in r] == ["meta/llama:free", "openai/gpt-4o"] for r in results)
+
+    async def test_non_200_response_is_not_cached(self, monkeypatch):
+        """Test that an error status returns no models and leaves the cache empty."""
+        from app.api.v1 import models as models_module
+
+        monkeypatch.setattr(models_module, "_model_cache", {})
+        monkeypatch.setattr(models_module, "_cache_deadline", 0.0)
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        with patch.object(models_module, "_get_http_client", return_value=client):
+            assert await models_module.fetch_openrouter_models() == []
+        await client.aclose()
+
+        assert models_module._model_cache == {}
@@ -8,9 +8,14 @@ Tests for:
 - Fallback character creation
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
-from app.schemas import CharacterRole
+from app.agents.base import AgentResult
+from app.core.bio_cache import bio_cache
+from app.core.providers import LLMResponse
+from app.schemas import Character, CharacterRole, GraphData, Relationship
 from app.schemas.character_identification import CharacterIdentification, CharacterStub
 from app.agents.character_bio import (
     CharacterBioAgent,
@@ -273,6 +278,90 @@ class TestCharacterBioInput:
         )
         assert input_data.stub == stub
         assert input_data.year == 1776
+        assert input_data.cast_context == full_cast.get_cast_context()
+
+    def test_prompt_uses_shared_cast_context(self):
+        """Test that get_prompt uses a pre-rendered cast context."""
+        stub = CharacterStub(
+            name="Franklin",
+            role=CharacterRole.PRIMARY,
+            brief_description="Elder statesman",
+        )
+        full_cast = CharacterIdentification(
+            characters=[stub],
+            focal_character="Franklin",
+            group_dynamics="Founding fathers",
+        )
+        input_data = CharacterBioInput.from_identification(
+            stub=stub,
+            full_cast=full_cast,
+            query="signing declaration",
+            year=1776,
+            era=None,
+            location="Philadelphia",
+            setting="",
+            atmosphere="",
+            tension_level="high",
+            cast_context="SHARED CAST CONTEXT",
+        )
+        prompt = CharacterBioAgent(router=MagicMock()).get_prompt(input_data)
+        assert "SHARED CAST CONTEXT" in prompt
+
+    def test_prompt_includes_graph_relationships(self):
+        """Test that graph relationships are rendered into the bio prompt."""
+        stub = CharacterStub(
+            name="Franklin",
+            role=CharacterRole.PRIMARY,
+            brief_description="Elder statesman",
+        )
+        full_cast = CharacterIdentification(
+            characters=[stub],
+            focal_character="Franklin",
+            group_dynamics="Founding fathers",
+        )
+        graph_data = GraphData(
+            relationships=[
+                Relationship(
+                    from_character="Franklin",
+                    to_character="Adams",
+                    relationship_type="ally",
+                    tension_level="tense",
+                ),
+                Relationship(from_character="Jefferson", to_character="Adams"),
+            ],
+        )
+        input_data = CharacterBioInput.from_identification(
+            stub=stub,
+            full_cast=full_cast,
+            query="signing declaration",
+            year=1776,
+            era=None,
+            location="Philadelphia",
+            setting="",
+            atmosphere="",
+            tension_level="high",
+            graph_data=graph_data,
+        )
+        prompt = CharacterBioAgent(router=MagicMock()).get_prompt(input_data)
+        assert "- Franklin <-> Adams: ally (tense)" in prompt
+        assert "Jefferson" not in prompt
+
+    def test_input_uses_slots(self):
+        """Test that inputs reject undeclared attributes."""
+        stub = CharacterStub(
+            name="Franklin",
+            role=CharacterRole.PRIMARY,
+            brief_description="Elder statesman",
+        )
+        full_cast = CharacterIdentification(
+            characters=[stub],
+            focal_character="Franklin",
+            group_dynamics="Founding fathers",
+        )
+        input_data = CharacterBioInput(stub=stub, full_cast=full_cast, query="q", year=1776)
+        assert not hasattr(input_data, "__dict__")
+        with pytest.raises(AttributeError):
+            input_data.yaer = 1776
 
 
 # Fallback Character Tests
@@ -308,6 +397,19 @@ class TestFallbackCharacter:
         character = create_fallback_character(stub)
         assert character.speaks_in_scene is True
 
+    def test_fallbacks_are_independent(self):
+        """Test that fallback characters don't share state."""
+        stub = CharacterStub(
+            name="Guard",
+            role=CharacterRole.BACKGROUND,
+            brief_description="Standing watch",
+        )
+        first = create_fallback_character(stub)
+        first.action = "Running"
+        second = create_fallback_character(stub)
+        assert second.action == "Observing the scene"
+        assert second.model_fields_set >= {"name", "role", "description", "clothing"}
+
 
 # Agent Initialization Tests
 
@@ -366,6 +468,43 @@ class TestPrompts:
         assert "44 BCE" in prompt
         assert "Caesar, Brutus" in prompt
 
+    def test_char_id_prompt_matches_template(self):
+        """Test the pre-parsed prompt renders exactly like str.format."""
+        from app.prompts import character_identification
+
+        prompt = character_identification.get_prompt(
+            query="moon landing",
+            year=1969,
+            era=None,
+            location="Sea of Tranquility",
+            setting="Lunar surface",
+            atmosphere="Awe",
+            tension_level="medium",
+        )
+        assert prompt == character_identification.USER_PROMPT_TEMPLATE.format(
+            query="moon landing",
+            year="1969",
+            era="Unknown",
+            location="Sea of Tranquility",
+            setting="Lunar surface",
+            atmosphere="Awe",
+            tension_level="medium",
+            detected_figures="None detected",
+        )
+
+    def test_char_id_prompt_is_cached(self):
+        """Test repeated prompts are served from the cache."""
+        from app.prompts import character_identification
+
+        character_identification._render_prompt.cache_clear()
+        args = ("query", 1850, None, "London", "Street", "Busy", "low")
+
+        first = character_identification.get_prompt(*args, detected_figures=["Dickens"])
+        second = character_identification.get_prompt(*args, detected_figures=["Dickens"])
+
+        assert second is first
+        assert character_identification._render_prompt.cache_info().hits == 1
+
     def test_char_bio_prompt(self):
         """Test character bio prompt generation."""
         from app.prompts import character_bio
@@ -411,3 +550,85 @@ class TestPrompts:
         )
         assert "Background Guard" in prompt
         assert "None" in prompt  # No relationships
+
+
+# CharacterBioAgent Run Tests
+
+
+@pytest.mark.fast
+class TestCharacterBioAgentRun:
+    """Tests for CharacterBioAgent.run caching."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_bio_uses_cache(self):
+        """Test that an identical bio request is served from the cache."""
+        bio_cache.clear()
+        stub = CharacterStub(
+            name="Caesar",
+            role=CharacterRole.PRIMARY,
+            brief_description="Roman dictator",
+        )
+        input_data = CharacterBioInput(
+            stub=stub,
+            full_cast=CharacterIdentification(
+                characters=[stub], focal_character="Caesar", group_dynamics="Conspiracy"
+            ),
+            query="assassination of Caesar",
+            year=-44,
+        )
+
+        router = MagicMock()
+        router.call_structured = AsyncMock(return_value=LLMResponse(
+            content=Character(name="Caesar", role=CharacterRole.PRIMARY, description="Dictator"),
+            model="test-model",
+            provider="google",
+        ))
+        agent = CharacterBioAgent(router=router)
+
+        first = await agent.run(input_data)
+        second = await agent.run(input_data)
+
+        assert router.call_structured.await_count == 1
+        assert second.success is True
+        assert second.content.name == "Caesar"
+        assert second.model_used == "test-model"
+        assert second.metadata["cache_hit"] is True
+        assert "cache_hit" not in first.metadata
+        bio_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_run_many_preserves_order_and_catches_errors(self):
+        """Test run_many returns results in input order and converts exceptions."""
+        stubs = [
+            CharacterStub(name=name, role=CharacterRole.SECONDARY, brief_description="Senator")
+            for name in ("Brutus", "Cassius", "Casca")
+        ]
+        full_cast = CharacterIdentification(
+            characters=stubs, focal_character="Brutus", group_dynamics="Conspiracy"
+        )
+        inputs = [
+            CharacterBioInput(stub=stub, full_cast=full_cast, query="ides of march", year=-44)
+            for stub in stubs
+        ]
+
+        agent = CharacterBioAgent(router=MagicMock())
+
+        async def fake_run(input_data):
+            if input_data.stub.name == "Cassius":
+                raise RuntimeError("provider down")
+            return AgentResult(
+                success=True,
+                content=Character(
+                    name=input_data.stub.name,
+                    role=CharacterRole.SECONDARY,
+                    description="Senator",
+                ),
+            )
+
+        agent.run = fake_run
+        results = await agent.run_many(inputs, max_concurrency=2)
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[0].content.name == "Brutus"
+        assert results[1].error == "provider down"
+        assert results[2].content.name == "Casca"
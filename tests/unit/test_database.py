@@ -0,0 +1,69 @@
+"""Unit tests for database engine setup.
+
+Tests for app/database.py - engine and pool configuration.
+
+Run with:
+    pytest tests/unit/test_database.py -v
+"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from app import database
+from app.config import Settings
+
+
+@pytest.fixture
+def engine_for(monkeypatch):
+    """Build a fresh engine for a given DATABASE_URL."""
+    created = []
+
+    def build(url: str):
+        settings = Settings(DATABASE_URL=url, GOOGLE_API_KEY="test-key", DEBUG=False)
+        monkeypatch.setattr(database, "get_settings", lambda: settings)
+        monkeypatch.setattr(database, "_engine", None)
+        monkeypatch.setattr(database, "_async_session_factory", None)
+        engine = database.get_engine()
+        created.append(engine)
+        return engine
+
+    yield build
+
+    for engine in created:
+        engine.sync_engine.dispose()
+
+
+@pytest.mark.fast
+class TestGetEngine:
+    """Tests for get_engine."""
+
+    def test_get_engine_is_singleton(self, engine_for):
+        """Test that repeated calls return the same engine."""
+        engine = engine_for("sqlite+aiosqlite:///:memory:")
+        assert database.get_engine() is engine
+
+    def test_memory_sqlite_uses_static_pool(self, engine_for):
+        """Test that in-memory SQLite shares a single connection."""
+        engine = engine_for("sqlite+aiosqlite:///:memory:")
+        assert isinstance(engine.pool, StaticPool)
+
+    def test_file_sqlite_uses_default_pool(self, engine_for, tmp_path):
+        """Test that file-backed SQLite keeps the default pool."""
+        engine = engine_for(f"sqlite+aiosqlite:///{tmp_path}/test.db")
+        assert not isinstance(engine.pool, StaticPool)
+
+    @pytest.mark.asyncio
+    async def test_memory_sqlite_tables_visible_across_sessions(self, engine_for):
+        """Test that tables created in one session are visible in the next."""
+        engine_for("sqlite+aiosqlite:///:memory:")
+
+        async with database.get_session() as session:
+            await session.execute(text("CREATE TABLE probe (id INTEGER)"))
+            await session.execute(text("INSERT INTO probe VALUES (1)"))
+
+        async with database.get_session() as session:
+            result = await session.execute(text("SELECT COUNT(*) FROM probe"))
+            assert result.scalar() == 1
+
+        await database.get_engine().dispose()
@@ -7,11 +7,13 @@ Run with:
     pytest tests/unit/test_eval.py -v -m fast
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.core.rate_limiter import reset_rate_limiters
 from app.eval.schemas import (
     EvalComparison,
     EvalLatencyStats,
@@ -23,8 +25,11 @@ from app.eval.schemas import (
 )
 from app.eval.runner import (
     ModelEvaluator,
+    close_evaluator,
+    eval_cache,
     format_comparison_report,
     get_all_available_models,
+    get_evaluator,
     get_preset_models,
 )
 
@@ -271,6 +276,57 @@ class TestEvalComparison:
         assert comparison.slowest_model == "slow-model"
         assert comparison.latency_stats.avg_ms == 1000  # (500 + 1500) / 2
 
+    def test_median_uses_sorted_latencies(self):
+        """Test the median and ranking are independent of result order."""
+        def result(model_id: str, latency_ms: int) -> EvalModelResult:
+            return EvalModelResult(
+                model_id=model_id,
+                provider="google",
+                label=model_id,
+                success=True,
+                latency_ms=latency_ms,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+            )
+
+        comparison = EvalComparison(
+            query="test",
+            results=[result("c", 3000), result("a", 100), result("b", 200)],
+        )
+        comparison.compute_stats()
+
+        assert comparison.ranking == ["a", "b", "c"]
+        assert comparison.latency_stats.median_ms == 200
+        assert comparison.latency_stats.range_ms == 2900
+
+        comparison.results.append(result("d", 400))
+        comparison.compute_stats()
+        assert comparison.latency_stats.median_ms == 300  # (200 + 400) / 2
+
+    def test_successful_by_latency_tracks_replaced_results(self):
+        """Test that the latency order is recomputed when results are replaced."""
+        def result(model_id: str, latency_ms: int) -> EvalModelResult:
+            return EvalModelResult(
+                model_id=model_id,
+                provider="google",
+                label=model_id,
+                success=True,
+                latency_ms=latency_ms,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+            )
+
+        comparison = EvalComparison(query="test", results=[result("a", 100), result("b", 200)])
+        comparison.compute_stats()
+        assert [r.model_id for r in comparison.successful_by_latency()] == ["a", "b"]
+
+        # Same length, not re-run through compute_stats
+        comparison.results = [result("a", 300), result("b", 200)]
+        assert [r.model_id for r in comparison.successful_by_latency()] == ["b", "a"]
+
+        comparison.results[0] = result("c", 50)
+        assert [r.model_id for r in comparison.successful_by_latency()] == ["c", "b"]
+
 
 @pytest.mark.fast
 class TestEvalModelsResponse:
@@ -321,6 +377,19 @@ class TestGetPresetModels:
         # ALL should have at least as many as VERIFIED
         assert len(all_models) >= len(verified)
 
+    def test_presets_are_built_once(self):
+        """Test repeated expansions reuse configs but return fresh lists."""
+        first = get_preset_models(ModelPreset.VERIFIED)
+        second = get_preset_models(ModelPreset.VERIFIED)
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
+    def test_preset_configs_are_valid(self):
+        """Test the unvalidated preset configs match validated ones."""
+        for model in get_preset_models(ModelPreset.ALL):
+            assert EvalModelConfig.model_validate(model.model_dump()) == model
+
 
 @pytest.mark.fast
 class TestGetAllAvailableModels:
@@ -428,6 +497,39 @@ class TestFormatComparisonReport:
         assert "Broken Model" in report
         assert "Connection timeout" in report
 
+    def test_report_to_stream(self):
+        """Test writing to a stream produces the same report."""
+        import io
+
+        comparison = EvalComparison(query="test query", prompt_type="text")
+        out = io.StringIO()
+
+        assert format_comparison_report(comparison, out) == ""
+        assert out.getvalue() == format_comparison_report(comparison)
+
+    def test_report_order_matches_ranking(self):
+        """Test successful rows follow the ranking from compute_stats."""
+        results = [
+            EvalModelResult(
+                model_id=model_id,
+                provider="google",
+                label=f"Label {model_id}",
+                success=True,
+                latency_ms=latency_ms,
+                started_at=datetime.utcnow(),
+                completed_at=datetime.utcnow(),
+            )
+            for model_id, latency_ms in (("slow", 900), ("fast", 100), ("mid", 500))
+        ]
+        comparison = EvalComparison(query="test query", results=results)
+        comparison.compute_stats()
+
+        report = format_comparison_report(comparison)
+        positions = [report.index(f"Label {model_id}") for model_id in comparison.ranking]
+
+        assert comparison.ranking == ["fast", "mid", "slow"]
+        assert positions == sorted(positions)
+
 
 @pytest.mark.fast
 class TestModelEvaluator:
@@ -450,6 +552,20 @@ class TestModelEvaluator:
             with pytest.raises(ValueError, match="Unknown provider"):
                 evaluator._get_provider("invalid")
 
+    def test_evaluator_provider_attributes_drive_dispatch(self):
+        """Test assigning a provider attribute registers it for lookup."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        provider = MagicMock()
+        evaluator.openrouter_provider = provider
+        assert evaluator._get_provider("openrouter") is provider
+
+        evaluator.openrouter_provider = None
+        with pytest.raises(ValueError, match="OpenRouter provider not configured"):
+            evaluator._get_provider("openrouter")
+
     def test_evaluator_get_available_models(self):
         """Test get_available_models returns response."""
         with patch("app.eval.runner.get_settings") as mock_settings:
@@ -461,11 +577,35 @@ class TestModelEvaluator:
             assert "verified" in response.presets
             assert "all" in response.presets
 
+    def test_evaluator_models_response_is_shared(self):
+        """Test the models response is built once and reused."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        response = evaluator.get_available_models()
+
+        assert evaluator.get_available_models() is response
+        assert response.presets["all"] == len(response.models)
+
+    def test_package_exports_evaluator_lazily(self):
+        """Test app.eval resolves ModelEvaluator from the runner on access."""
+        import app.eval
+
+        assert app.eval.ModelEvaluator is ModelEvaluator
+        with pytest.raises(AttributeError):
+            _ = app.eval.NoSuchThing
+
 
 @pytest.mark.fast
 class TestModelEvaluatorAsync:
     """Async tests for ModelEvaluator."""
 
+    @pytest.fixture(autouse=True)
+    def reset_limiters(self):
+        """Start each comparison with full rate limit buckets."""
+        reset_rate_limiters()
+
     @pytest.mark.asyncio
     async def test_run_single_timeout(self):
         """Test run_single handles timeout."""
@@ -486,6 +626,22 @@ class TestModelEvaluatorAsync:
             assert result.error is not None
             assert "Google provider not configured" in result.error
 
+    @pytest.mark.asyncio
+    async def test_run_single_reports_provider_timeout(self):
+        """Test a timed-out call is charged the full timeout."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        config = EvalModelConfig(model_id="slow-model", provider="google", label="Slow")
+        with patch.object(evaluator, "_call_provider", AsyncMock(side_effect=asyncio.TimeoutError)):
+            result = await evaluator.run_single(config, "query", timeout_seconds=30)
+
+        assert result.success is False
+        assert result.latency_ms == 30_000
+        assert result.error == "Timeout after 30s"
+        assert (result.output, result.output_preview, result.output_length) == (None, None, 0)
+
     @pytest.mark.asyncio
     async def test_compare_falls_back_to_preset(self):
         """Test compare falls back to preset when models is empty."""
@@ -523,6 +679,238 @@ class TestModelEvaluatorAsync:
             assert comparison.query == "test query"
             assert comparison.total_duration_ms >= 0
 
+    @pytest.mark.asyncio
+    async def test_compare_excludes_warmup_from_duration(self):
+        """Test the first comparison's timer starts after warmup."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        async def slow_client_head(path):
+            await asyncio.sleep(0.2)
+
+        provider = MagicMock()
+        provider.client.head = slow_client_head
+        provider.call_text = AsyncMock(return_value=MagicMock(content="Rome"))
+        evaluator.openrouter_provider = provider
+
+        request = EvalRequest(
+            query="test query",
+            models=[EvalModelConfig(model_id="m1", provider="openrouter", label="M1")],
+        )
+        comparison = await evaluator.compare(request)
+
+        assert comparison.results[0].success
+        assert comparison.total_duration_ms < 200
+
+    @pytest.mark.asyncio
+    async def test_compare_excludes_rate_limit_wait_from_duration(self):
+        """Test the burst's rate limit wait happens before the timer starts."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        provider = MagicMock()
+        provider.client.head = AsyncMock()
+        provider.call_text = AsyncMock(return_value=MagicMock(content="Rome"))
+        evaluator.openrouter_provider = provider
+
+        async def slow_acquire(model_ids, timeout=30.0):
+            await asyncio.sleep(0.2)
+            return True
+
+        request = EvalRequest(
+            query="test query",
+            models=[EvalModelConfig(model_id="m1", provider="openrouter", label="M1")],
+        )
+        with patch("app.eval.runner.acquire_rate_limits", slow_acquire):
+            comparison = await evaluator.compare(request)
+
+        assert comparison.results[0].success
+        assert comparison.total_duration_ms < 200
+
+    @pytest.mark.asyncio
+    async def test_run_single_replays_cached_result(self):
+        """Test use_cache skips the provider for a repeated model and query."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        provider = MagicMock()
+        provider.call_text = AsyncMock(return_value=MagicMock(content="Rome"))
+        evaluator.google_provider = provider
+        config = EvalModelConfig(model_id="cache-model", provider="google", label="Cached")
+        eval_cache.clear()
+
+        first = await evaluator.run_single(config, "query", use_cache=True)
+        second = await evaluator.run_single(config, "query", use_cache=True)
+
+        assert provider.call_text.await_count == 1
+        assert (first.cached, second.cached) == (False, True)
+        assert second.output_preview == "Rome"
+        assert second.latency_ms == first.latency_ms
+        eval_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_run_single_keeps_full_output_only_on_request(self):
+        """Test results carry just the preview unless full output is requested."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        text = "x" * 500
+        provider = MagicMock()
+        provider.call_text = AsyncMock(return_value=MagicMock(content=text))
+        evaluator.google_provider = provider
+        config = EvalModelConfig(model_id="long-model", provider="google", label="Long")
+        eval_cache.clear()
+
+        brief = await evaluator.run_single(config, "query", use_cache=True)
+        full = await evaluator.run_single(
+            config, "query", use_cache=True, include_full_output=True
+        )
+
+        assert brief.output is None
+        assert brief.output_preview == text[:200]
+        assert brief.output_length == 500
+        assert full.cached is True
+        assert full.output == text
+        eval_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_run_single_without_cache_always_calls(self):
+        """Test that results are not cached unless requested."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        provider = MagicMock()
+        provider.call_text = AsyncMock(return_value=MagicMock(content="Rome"))
+        evaluator.google_provider = provider
+        config = EvalModelConfig(model_id="cache-model", provider="google", label="Cached")
+        eval_cache.clear()
+
+        await evaluator.run_single(config, "query")
+        result = await evaluator.run_single(config, "query", use_cache=True)
+
+        assert provider.call_text.await_count == 2
+        assert result.cached is False
+        eval_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_compare_warms_up_once(self):
+        """Test compare opens provider connections before the first run only."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        openrouter = MagicMock()
+        openrouter.client.head = AsyncMock(side_effect=OSError("offline"))
+        openrouter.call_text = AsyncMock(return_value=MagicMock(content="ok"))
+        evaluator.openrouter_provider = openrouter
+        request = EvalRequest(
+            query="test query",
+            models=[EvalModelConfig(model_id="x/y", provider="openrouter", label="X")],
+        )
+
+        await evaluator.compare(request)
+        comparison = await evaluator.compare(request)
+
+        openrouter.client.head.assert_awaited_once_with("/models")
+        assert comparison.success_count == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_caps_concurrency_per_provider(self):
+        """Test no more than the provider limit of calls run at once."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            with patch.dict("app.eval.runner.EVAL_PROVIDER_CONCURRENCY", {"openrouter": 2}):
+                evaluator = ModelEvaluator()
+
+        running = peak = 0
+
+        async def call_text(query, model_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return MagicMock(content="ok")
+
+        openrouter = MagicMock()
+        openrouter.client.head = AsyncMock()
+        openrouter.call_text = call_text
+        evaluator.openrouter_provider = openrouter
+        request = EvalRequest(
+            query="test query",
+            models=[
+                EvalModelConfig(model_id=f"x/m{i}", provider="openrouter", label=f"M{i}")
+                for i in range(5)
+            ],
+        )
+
+        comparison = await evaluator.compare(request)
+
+        assert comparison.success_count == 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_compare_stream_yields_fastest_first(self):
+        """Test results stream in completion order while compare keeps request order."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        delays = {"x/slow": 0.05, "x/fast": 0.0}
+
+        async def call_text(query, model_id):
+            await asyncio.sleep(delays[model_id])
+            return MagicMock(content=model_id)
+
+        openrouter = MagicMock()
+        openrouter.client.head = AsyncMock()
+        openrouter.call_text = call_text
+        evaluator.openrouter_provider = openrouter
+        request = EvalRequest(
+            query="test query",
+            models=[
+                EvalModelConfig(model_id=model_id, provider="openrouter", label=model_id)
+                for model_id in delays
+            ],
+        )
+
+        streamed = [result.model_id async for result in evaluator.compare_stream(request)]
+        comparison = await evaluator.compare(request)
+
+        assert streamed == ["x/fast", "x/slow"]
+        assert [r.model_id for r in comparison.results] == ["x/slow", "x/fast"]
+        assert comparison.fastest_model == "x/fast"
+
+    @pytest.mark.asyncio
+    async def test_unvalidated_results_round_trip(self):
+        """Test constructed results serialize to a valid comparison."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            evaluator = ModelEvaluator()
+
+        openrouter = MagicMock()
+        openrouter.client.head = AsyncMock()
+        openrouter.call_text = AsyncMock(return_value=MagicMock(content="ok"))
+        evaluator.openrouter_provider = openrouter
+        request = EvalRequest(
+            query="test query",
+            models=[
+                EvalModelConfig(model_id="x/ok", provider="openrouter", label="OK"),
+                EvalModelConfig(model_id="gemini", provider="google", label="Down"),
+            ],
+        )
+
+        comparison = await evaluator.compare(request)
+        restored = EvalComparison.model_validate_json(comparison.model_dump_json())
+
+        assert restored.model_dump() == comparison.model_dump()
+        assert (restored.success_count, restored.failure_count) == (1, 1)
+
     @pytest.mark.asyncio
     async def test_evaluator_close(self):
         """Test close method is callable."""
@@ -532,3 +920,116 @@ class TestModelEvaluatorAsync:
 
             # Should not raise
             await evaluator.close()
+
+    @pytest.mark.asyncio
+    async def test_shared_evaluator(self):
+        """Test get_evaluator reuses one instance until closed."""
+        with patch("app.eval.runner.get_settings") as mock_settings:
+            mock_settings.return_value.has_provider.return_value = False
+            await close_evaluator()
+
+            evaluator = get_evaluator()
+            assert get_evaluator() is evaluator
+
+            await close_evaluator()
+            assert get_evaluator() is not evaluator
+            await close_evaluator()
+
+
+@pytest.mark.fast
+class TestComparisonReportJson:
+    """Tests for the /eval/compare/report response encoding."""
+
+    def test_matches_dict_encoding(self):
+        """Test that the encoded body matches the dict-based payload."""
+        import json
+
+        from app.api.v1.eval import _comparison_report_json
+
+        comparison = EvalComparison(
+            query="test query",
+            prompt_type="text",
+            total_duration_ms=1500,
+            results=[
+                EvalModelResult(
+                    model_id="model1",
+                    provider="google",
+                    label="Model 1",
+                    success=True,
+                    latency_ms=1000,
+                    started_at=datetime.utcnow(),
+                    completed_at=datetime.utcnow(),
+                ),
+            ],
+        )
+        comparison.compute_stats()
+        report = format_comparison_report(comparison)
+
+        body = json.loads(_comparison_report_json(comparison, report))
+
+        assert body == {
+            "comparison": comparison.model_dump(mode="json"),
+            "report": report,
+        }
+
+
+@pytest.mark.fast
+class TestCompareStreamEvents:
+    """Tests for the /eval/compare/stream SSE events."""
+
+    @pytest.mark.asyncio
+    async def test_result_events_then_done(self):
+        """Test one result event per model followed by the comparison."""
+        import json
+
+        from app.api.v1.eval import _stream_comparison
+
+        result = EvalModelResult(
+            model_id="model1",
+            provider="google",
+            label="Model 1",
+            success=True,
+            latency_ms=1000,
+            started_at=datetime.utcnow(),
+            completed_at=datetime.utcnow(),
+        )
+
+        async def compare_stream(request, models):
+            yield result
+
+        evaluator = MagicMock()
+        evaluator.prepare = AsyncMock(return_value=[])
+        evaluator.compare_stream = compare_stream
+        request = EvalRequest(query="test query")
+
+        events = [
+            json.loads(chunk.removeprefix("data: "))
+            async for chunk in _stream_comparison(request, evaluator)
+        ]
+
+        assert [e["event"] for e in events] == ["result", "done"]
+        assert events[0]["data"] == result.model_dump(mode="json")
+        assert events[1]["data"]["models_tested"] == 1
+        assert events[1]["data"]["fastest_model"] == "model1"
+
+    @pytest.mark.asyncio
+    async def test_error_event(self):
+        """Test a failing comparison ends with an error event."""
+        import json
+
+        from app.api.v1.eval import _stream_comparison
+
+        async def compare_stream(request, models):
+            raise RuntimeError("boom")
+            yield
+
+        evaluator = MagicMock()
+        evaluator.prepare = AsyncMock(return_value=[])
+        evaluator.compare_stream = compare_stream
+
+        events = [
+            json.loads(chunk.removeprefix("data: "))
+            async for chunk in _stream_comparison(EvalRequest(query="q"), evaluator)
+        ]
+
+        assert events == [{"event": "error", "data": "boom"}]
@@ -0,0 +1,354 @@
+"""Tests for historical validation.
+
+Tests:
+    - Era lookup by year and location
+    - Batch era lookup
+    - Confusion risk detection
+    - Famous scene keyword detection
+    - Mutual exclusion checks
+    - Memoized scene validation
+    - Batch scene validation
+    - Era-specific negative prompts
+"""
+
+import pytest
+
+from app.core.historical_validation import (
+    CONFUSION_PAIRS,
+    ERA_NEGATIVE_JOINED,
+    ERAS,
+    FAMOUS_SCENE_KEYWORDS,
+    MUTUAL_EXCLUSIONS,
+    SCENES_BY_NAME,
+    check_mutual_exclusions,
+    detect_confusion_risks,
+    detect_famous_scene_risks,
+    get_era_for_year,
+    get_era_negative_prompts,
+    get_eras_for_years,
+    validate_historical_scene,
+    validate_many,
+)
+
+
+@pytest.mark.fast
+class TestGetEraForYear:
+    """Tests for get_era_for_year."""
+
+    def test_regional_match(self):
+        """Test that a regional era matches a location containing its region."""
+        assert get_era_for_year(1793, "Paris, France") == "french_revolution"
+
+    def test_no_location_matches_regional_era(self):
+        """Test that a missing location accepts any regional era."""
+        assert get_era_for_year(1793) == "french_revolution"
+
+    def test_region_mismatch_skips_era(self):
+        """Test that a non-matching location falls through to later eras."""
+        assert get_era_for_year(1450, "Japan") is None
+        assert get_era_for_year(1916, "Japan") == "world_war_1"
+
+    def test_overlapping_eras_use_declaration_order(self):
+        """Test that the first matching era in ERAS wins for overlaps."""
+        # late_medieval (1300-1500) is declared before renaissance (1400-1600)
+        assert get_era_for_year(1450, "Europe") == "late_medieval"
+        assert get_era_for_year(1550, "Europe") == "renaissance"
+
+    def test_boundaries_are_inclusive(self):
+        """Test that start and end years are both inside the era."""
+        assert get_era_for_year(1914, None) == "world_war_1"
+        assert get_era_for_year(1789, "France") == "french_revolution"
+
+    def test_out_of_range_year(self):
+        """Test that years outside every era return None."""
+        assert get_era_for_year(-5000) is None
+        assert get_era_for_year(2020, "France") is None
+
+    def test_matches_linear_scan(self):
+        """Test that the lookup agrees with a naive scan of ERAS."""
+
+        def linear(year, location):
+            location_lower = (location or "").lower()
+            for era in ERAS:
+                if era.start <= year <= era.end:
+                    if not era.region or not location or era.region.lower() in location_lower:
+                        return era.name
+            return None
+
+        for year in range(-3200, 2000, 13):
+            for location in (None, "Rome", "London, England", "Boston, America", "Tokyo"):
+                assert get_era_for_year(year, location) == linear(year, location)
+
+
+@pytest.mark.fast
+class TestGetErasForYears:
+    """Tests for get_eras_for_years."""
+
+    def test_matches_single_lookups(self):
+        """Test that batch results match per-item lookups in order."""
+        years = [1793, 1450, 1916, 1793, -5000]
+        locations = ["Paris, France", "Japan", "Japan", "Paris, France", None]
+
+        assert get_eras_for_years(years, locations) == [
+            get_era_for_year(year, location) for year, location in zip(years, locations, strict=True)
+        ]
+
+    def test_locations_optional(self):
+        """Test that omitting locations behaves like passing None."""
+        assert get_eras_for_years([1914, 2020]) == ["world_war_1", None]
+
+    def test_length_mismatch(self):
+        """Test that mismatched inputs are rejected."""
+        with pytest.raises(ValueError):
+            get_eras_for_years([1914, 1915], ["France"])
+
+
+@pytest.mark.fast
+class TestEraNegativePrompts:
+    """Tests for get_era_negative_prompts."""
+
+    def test_known_era(self):
+        """Test that a known era returns its negative prompts."""
+        negatives = get_era_negative_prompts(1793, "France")
+        assert "roman toga" in negatives
+
+    def test_unknown_era_defaults(self):
+        """Test that unknown eras return generic negative prompts."""
+        negatives = get_era_negative_prompts(2020, "Tokyo")
+        assert "anachronistic elements" in negatives
+
+    def test_prompts_are_immutable(self):
+        """Test that shared prompt tables cannot be mutated by callers."""
+        negatives = get_era_negative_prompts(1793, "France")
+        assert isinstance(negatives, tuple)
+        assert get_era_negative_prompts(1793, "France") is negatives
+
+
+@pytest.mark.fast
+class TestDetectConfusionRisks:
+    """Tests for detect_confusion_risks."""
+
+    def test_sorted_by_risk(self):
+        """Test that risks for an era come back highest risk first."""
+        risks = detect_confusion_risks(1793, "France")
+        assert [r.confused_with for r in risks] == ["roman_republic", "napoleonic"]
+
+    def test_matches_linear_scan(self):
+        """Test that the era index agrees with scanning CONFUSION_PAIRS."""
+        for era in {pair.target_era for pair in CONFUSION_PAIRS}:
+            year = next(e.start for e in ERAS if e.name == era)
+            location = next(e.region for e in ERAS if e.name == era)
+            expected = sorted(
+                (p for p in CONFUSION_PAIRS if p.target_era == get_era_for_year(year, location)),
+                key=lambda r: r.risk_level,
+                reverse=True,
+            )
+            assert detect_confusion_risks(year, location) == expected
+
+    def test_unknown_era(self):
+        """Test that years outside every era have no risks."""
+        assert detect_confusion_risks(2020, "Tokyo") == []
+
+    def test_risks_are_frozen_and_hashable(self):
+        """Test that shared risk entries can't be modified and can be hashed."""
+        risk = detect_confusion_risks(1793, "France")[0]
+        with pytest.raises(AttributeError):
+            risk.risk_level = 0.0
+        assert len({risk, *detect_confusion_risks(1793, "France")}) == 2
+
+
+@pytest.mark.fast
+class TestDetectFamousSceneRisks:
+    """Tests for detect_famous_scene_risks."""
+
+    def test_keyword_match(self):
+        """Test that a scene keyword flags its scene."""
+        risks = detect_famous_scene_risks("The Ides of March in Rome", -44)
+        assert [r.name for r in risks] == ["Death of Caesar"]
+
+    def test_shared_keyword_flags_all_scenes(self):
+        """Test that a keyword used by several scenes flags each in order."""
+        risks = detect_famous_scene_risks("Assassination in the bath", 1793)
+        assert [r.name for r in risks] == ["Death of Caesar", "Death of Marat"]
+
+    def test_no_match(self):
+        """Test that unrelated queries return no risks."""
+        assert detect_famous_scene_risks("Moon landing 1969", 1969) == []
+
+    def test_matches_naive_scan(self):
+        """Test that the single-pass scan agrees with per-keyword substring checks."""
+
+        def naive(query):
+            query_lower = query.lower()
+            return [
+                SCENES_BY_NAME[name]
+                for keywords, name in FAMOUS_SCENE_KEYWORDS.items()
+                if any(kw in query_lower for kw in keywords)
+            ]
+
+        queries = [
+            "Washington crossing the Delaware river by boat",
+            "Napoleon on horseback crossing the Alps",
+            "signing of the Declaration of Independence",
+            "SWORDS raised: the oath of three brothers",
+            "Liberty leading the people over the barricade with a flag",
+            "Charlotte Corday and Marat",
+            "senatenapoleonsignings",
+            "marching crowds beside the river",
+            "",
+        ]
+        for query in queries:
+            assert detect_famous_scene_risks(query, 1800) == naive(query)
+
+
+@pytest.mark.fast
+class TestCheckMutualExclusions:
+    """Tests for check_mutual_exclusions."""
+
+    def test_violation_detected(self):
+        """Test that elements from both sides of a rule are reported."""
+        violations = check_mutual_exclusions(["Roman Toga", "musket", "gladius"])
+        assert [v.reason for v in violations] == [
+            "Ancient Roman weapons cannot appear with firearms",
+        ]
+
+    def test_one_side_only(self):
+        """Test that elements from a single side are not a violation."""
+        assert check_mutual_exclusions(["toga", "roman sandals"]) == []
+
+    def test_unknown_elements(self):
+        """Test that elements outside every rule are ignored."""
+        assert check_mutual_exclusions(["sunlight", "crowd"]) == []
+
+    def test_free_text_elements(self):
+        """Test that rule terms inside longer descriptions are detected."""
+        violations = check_mutual_exclusions([
+            "A senator draped in a Roman toga",
+            "an officer in a tricorn hat",
+        ])
+        assert len(violations) == 1
+        assert violations[0].element_a == "roman toga"
+        assert violations[0].element_b == "tricorn hat"
+
+    def test_nested_terms_reported_once(self):
+        """Test that a term inside a longer found term is not reported separately."""
+        violations = check_mutual_exclusions(["roman toga", "bicorne hat"])
+        assert [(v.element_a, v.element_b) for v in violations] == [
+            ("roman toga", "bicorne hat"),
+        ]
+
+    def test_terms_do_not_span_elements(self):
+        """Test that a term split across two elements is not matched."""
+        assert check_mutual_exclusions(["musket and roman", "sword"]) == []
+
+    def test_matches_full_scan(self):
+        """Test that the inverted index agrees with checking every rule."""
+        elements = ["toga", "tricorn hat", "colosseum", "skyscraper", "parthenon",
+                    "candle light", "neon sign", "quill pen", "computer"]
+        expected = [
+            reason for set_a, set_b, reason in MUTUAL_EXCLUSIONS
+            if set(elements) & set_a and set(elements) & set_b
+        ]
+        assert [v.reason for v in check_mutual_exclusions(elements)] == expected
+
+
+@pytest.mark.fast
+class TestValidateHistoricalScene:
+    """Tests for validate_historical_scene."""
+
+    def test_french_revolution_scene(self):
+        """Test validation of a high-risk scene."""
+        result = validate_historical_scene(1793, "Paris, France", "Death of Marat")
+        assert result.era == "french_revolution"
+        assert result.confusion_risks[0].confused_with == "roman_republic"
+        assert [s.name for s in result.famous_scene_risks] == ["Death of Marat"]
+        assert result.confidence_score < 1.0
+
+    def test_exclusion_violations(self):
+        """Test that conflicting visual elements are reported."""
+        result = validate_historical_scene(
+            1793, "France", visual_elements=["Toga", "powdered wig"]
+        )
+        assert len(result.exclusion_violations) == 1
+        assert any("EXCLUSION VIOLATION" in w for w in result.accuracy_warnings)
+
+    def test_repeated_calls_return_independent_results(self):
+        """Test that memoized results can be mutated without affecting later calls."""
+        first = validate_historical_scene(1793, "France", "Death of Marat")
+        first.negative_prompts.append("mutated")
+        first.accuracy_warnings.clear()
+
+        second = validate_historical_scene(1793, "France", "Death of Marat")
+        assert second is not first
+        assert "mutated" not in second.negative_prompts
+        assert second.accuracy_warnings
+
+    def test_combined_negative_prompt_deduplicates(self):
+        """Test that combined prompts drop case-insensitive duplicates in order."""
+        result = validate_historical_scene(1793, "France")
+        result.negative_prompts = ["Roman Toga", "roman toga", "parthenon"]
+
+        combined = result.get_combined_negative_prompt().split(", ")
+
+        # roman_republic (risk 0.9) contributes its first five prompts
+        assert combined[:3] == ["Roman Toga", "parthenon", "greek idealized"]
+        assert len(combined) == len({item.lower() for item in combined})
+
+    def test_combined_negative_prompt_uses_prejoined_era_prompts(self):
+        """Test that a result without high risks returns the era's joined prompts."""
+        # ancient_greece's only confusion risk is exactly 0.7, below the threshold
+        result = validate_historical_scene(-500, "Athens, Greece")
+
+        assert result.era == "ancient_greece"
+        assert result.get_combined_negative_prompt() is ERA_NEGATIVE_JOINED[result.era]
+        assert result.get_combined_negative_prompt() == ", ".join(result.negative_prompts)
+
+    def test_combined_prompt_and_guidance_are_cached(self):
+        """Test that derived strings are computed once per result."""
+        result = validate_historical_scene(1793, "France")
+
+        assert result.get_combined_negative_prompt() is result.get_combined_negative_prompt()
+        assert result.get_distinguishing_guidance() is result.distinguishing_guidance
+        assert result.distinguishing_guidance.startswith("To distinguish from roman_republic")
+
+    def test_confidence_score(self):
+        """Test confidence penalties for risks, scenes and violations."""
+        assert validate_historical_scene(2020, "Tokyo").confidence_score == 1.0
+
+        result = validate_historical_scene(1793, "France", "Death of Marat")
+        assert result.confidence_score == pytest.approx(1.0 - 0.9 * 0.3 - 0.1)
+
+        result = validate_historical_scene(
+            1793, "France", "Death of Marat", ["toga", "powdered wig", "gladius", "musket"]
+        )
+        assert result.confidence_score == pytest.approx(1.0 - 0.9 * 0.3 - 0.1 - 0.2 * 2)
+
+        result = validate_historical_scene(
+            1793, "France", "Death of Marat",
+            ["toga", "powdered wig", "gladius", "musket", "quill pen", "computer"],
+        )
+        assert result.confidence_score == 0.1
+
+
+@pytest.mark.fast
+class TestValidateMany:
+    """Tests for validate_many."""
+
+    def test_matches_single_validation(self):
+        """Test that batch results match per-item validation in order."""
+        items = [
+            (1793, "France", "Death of Marat"),
+            (1916, None, "trench warfare"),
+            (1793, "France", "Death of Marat"),
+            (2020, "Tokyo", ""),
+        ]
+        results = validate_many(items)
+
+        assert [r.era for r in results] == ["french_revolution", "world_war_1", "french_revolution", None]
+        for result, (year, location, query) in zip(results, items, strict=True):
+            assert result == validate_historical_scene(year, location, query)
+
+    def test_duplicate_items_get_independent_results(self):
+        """Test that repeated items do not share mutable lists."""
+        first, second = validate_many([(1793, "France", ""), (1793, "France", "")])
+        assert first.negative_prompts is not second.negative_prompts
@@ -0,0 +1,147 @@
+"""Tests for LLM request batching.
+
+Tests:
+    - Identical concurrent requests share one call
+    - Distinct keys run independently
+    - Errors propagate to every waiter
+    - Keys are released once the call finishes
+    - The call is cancelled when every waiter leaves
+    - Shared results are copied for all but one waiter
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.llm_batcher import LLMRequestBatcher
+
+
+@pytest.mark.fast
+class TestLLMRequestBatcher:
+    """Tests for LLMRequestBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_call(self):
+        """Test that concurrent submissions with one key make one call."""
+        batcher = LLMRequestBatcher()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*(batcher.submit("key", call) for _ in range(5)))
+
+        assert results == ["result"] * 5
+        assert calls == 1
+        assert batcher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_distinct_keys_run_separately(self):
+        """Test that different keys each make their own call."""
+        batcher = LLMRequestBatcher()
+
+        async def echo(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(
+            batcher.submit("a", lambda: echo("a")),
+            batcher.submit("b", lambda: echo("b")),
+        )
+
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """Test that a failing shared call raises for every waiter."""
+        batcher = LLMRequestBatcher()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            batcher.submit("key", fail),
+            batcher.submit("key", fail),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert batcher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_are_not_cached(self):
+        """Test that a finished request is not reused by later callers."""
+        batcher = LLMRequestBatcher()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await batcher.submit("key", call) == 1
+        assert await batcher.submit("key", call) == 2
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_when_last_waiter_leaves(self):
+        """Test that cancelling every waiter cancels the upstream call."""
+        batcher = LLMRequestBatcher()
+        started = asyncio.Event()
+        cancelled = False
+
+        async def call():
+            nonlocal cancelled
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        waiter = asyncio.ensure_future(batcher.submit("key", call))
+        await started.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+
+        assert cancelled
+        assert batcher.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_call_survives_one_cancelled_waiter(self):
+        """Test that the call keeps running while another waiter remains."""
+        batcher = LLMRequestBatcher()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        first = asyncio.ensure_future(batcher.submit("key", call))
+        second = asyncio.ensure_future(batcher.submit("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result"
+
+    @pytest.mark.asyncio
+    async def test_waiters_receive_independent_copies(self):
+        """Test that mutating one waiter's result does not affect another's."""
+        batcher = LLMRequestBatcher()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return {"tags": []}
+
+        def copy(result):
+            return {"tags": list(result["tags"])}
+
+        results = await asyncio.gather(*(batcher.submit("key", call, copy) for _ in range(3)))
+        results[0]["tags"].append("mutated")
+
+        assert len({id(r) for r in results}) == 3
+        assert results[1]["tags"] == [] and results[2]["tags"] == []
@@ -98,3 +98,19 @@ class TestErrorHandling:
         """Test wrong method returns 405."""
         response = await test_client.post("/health")
         assert response.status_code == 405
+
+
+@pytest.mark.fast
+class TestResponseSerialization:
+    """Tests for API response serialization setup."""
+
+    def test_api_routes_use_default_response_class(self):
+        """Test that v1 routes keep FastAPI's pydantic-core JSON path."""
+        from fastapi.datastructures import DefaultPlaceholder
+        from fastapi.routing import APIRoute
+
+        from app.main import app
+
+        routes = [r for r in app.routes if isinstance(r, APIRoute) and r.path.startswith("/api/v1")]
+        assert routes
+        assert all(isinstance(r.response_class, DefaultPlaceholder) for r in routes)
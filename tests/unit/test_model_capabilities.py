@@ -0,0 +1,139 @@
+"""Tests for the model capabilities registry.
+
+Tests:
+    - Image model config lookup and defaults
+    - Text model config lookup and defaults
+    - Memoized config lookups
+    - Image config parameter building
+    - Interaction model listing
+"""
+
+import json
+
+import pytest
+
+from app.core.model_capabilities import (
+    _TEXT_MODEL_REGISTRY,
+    DEFAULT_IMAGE_CONFIG,
+    DEFAULT_TEXT_CONFIG,
+    IMAGE_MODEL_REGISTRY,
+    TEXT_MODEL_REGISTRY,
+    build_image_config_params,
+    clear_model_config_caches,
+    get_available_interaction_models,
+    get_image_model_config,
+    get_text_model_config,
+    is_default_image_model,
+    should_include_image_size,
+)
+
+
+@pytest.mark.fast
+class TestModelConfigLookup:
+    """Tests for get_image_model_config and get_text_model_config."""
+
+    def test_known_image_model(self):
+        """Test that registered image models return their config."""
+        assert get_image_model_config("gemini-2.5-flash-image") is IMAGE_MODEL_REGISTRY[
+            "gemini-2.5-flash-image"
+        ]
+
+    def test_unknown_models_use_defaults(self):
+        """Test that unknown models fall back to the default configs."""
+        assert get_image_model_config("no-such-model") is DEFAULT_IMAGE_CONFIG
+        assert get_text_model_config("no-such-model") is DEFAULT_TEXT_CONFIG
+
+    def test_public_registries_are_read_only(self):
+        """Test that the exported registries cannot be modified."""
+        with pytest.raises(TypeError):
+            TEXT_MODEL_REGISTRY["custom-model"] = DEFAULT_TEXT_CONFIG  # type: ignore[index]
+        with pytest.raises(TypeError):
+            IMAGE_MODEL_REGISTRY["custom-model"] = DEFAULT_IMAGE_CONFIG  # type: ignore[index]
+
+    def test_is_default_image_model(self):
+        """Test that only unregistered image models report the default config."""
+        assert is_default_image_model("no-such-model")
+        assert not is_default_image_model("gemini-2.5-flash-image")
+
+    def test_lookups_are_memoized(self):
+        """Test that repeated lookups hit the cache until it is cleared."""
+        clear_model_config_caches()
+
+        get_text_model_config("gemini-2.5-flash")
+        get_text_model_config("gemini-2.5-flash")
+        assert get_text_model_config.cache_info().hits == 1
+
+        clear_model_config_caches()
+        assert get_text_model_config.cache_info().currsize == 0
+
+    def test_configs_use_slots(self):
+        """Test that model configs have no per-instance __dict__."""
+        assert not hasattr(DEFAULT_IMAGE_CONFIG, "__dict__")
+        assert not hasattr(DEFAULT_TEXT_CONFIG, "__dict__")
+
+    def test_cache_clear_picks_up_patched_registry(self, monkeypatch):
+        """Test that clearing the cache exposes registry changes."""
+        patched = TEXT_MODEL_REGISTRY["gemini-2.5-flash"]
+        monkeypatch.setitem(_TEXT_MODEL_REGISTRY, "custom-model", patched)
+
+        clear_model_config_caches()
+        assert get_text_model_config("custom-model") is patched
+        clear_model_config_caches()
+
+
+@pytest.mark.fast
+class TestBuildImageConfigParams:
+    """Tests for build_image_config_params and should_include_image_size."""
+
+    def test_supported_size_is_included(self):
+        """Test that a supported size is passed with camelCase keys."""
+        params = build_image_config_params(
+            "gemini-3-pro-image-preview", aspect_ratio="16:9", image_size="2K"
+        )
+        assert params == {"aspectRatio": "16:9", "imageSize": "2K"}
+
+    def test_unsupported_size_is_dropped(self):
+        """Test that sizes are dropped for models or values that don't support them."""
+        assert build_image_config_params("gemini-2.5-flash-image", image_size="2K") == {}
+        assert build_image_config_params("gemini-3-pro-image-preview", image_size="8K") == {}
+
+    def test_no_requested_params(self):
+        """Test that nothing is built when no parameters are requested."""
+        assert build_image_config_params("gemini-3-pro-image-preview") == {}
+        assert build_image_config_params("no-such-model", aspect_ratio="1:1") == {
+            "aspectRatio": "1:1"
+        }
+
+    def test_should_include_image_size(self):
+        """Test the public size check against the registry."""
+        assert should_include_image_size("gemini-3-pro-image-preview", "4K")
+        assert should_include_image_size("gemini-3-pro-image-preview", None)
+        assert not should_include_image_size("gemini-3-pro-image-preview", "8K")
+        assert not should_include_image_size("gemini-2.5-flash-image", "1K")
+
+
+@pytest.mark.fast
+class TestAvailableInteractionModels:
+    """Tests for get_available_interaction_models."""
+
+    def test_lists_streaming_json_models(self):
+        """Test that every registered streaming JSON-mode model is listed."""
+        ids = [model["id"] for model in get_available_interaction_models()]
+        assert ids == [
+            model_id
+            for model_id, config in TEXT_MODEL_REGISTRY.items()
+            if config.supports_streaming and config.supports_json_mode
+        ]
+
+    def test_entries_are_independent_copies(self):
+        """Test that callers cannot mutate the shared model info."""
+        models = get_available_interaction_models()
+        models[0]["notes"] = "changed"
+        models.clear()
+
+        assert get_available_interaction_models()[0]["notes"] != "changed"
+
+    def test_entries_are_json_serializable(self):
+        """Test that the model list can be encoded as JSON."""
+        models = get_available_interaction_models()
+        assert json.loads(json.dumps(models)) == models
@@ -18,6 +18,7 @@ from app.core.providers import (
     ProviderError,
     RateLimitError,
 )
+from app.core.providers.openrouter import OpenRouterProvider, close_http_clients
 
 
 @pytest.mark.fast
@@ -225,3 +226,36 @@ class TestOpenRouterProvider:
         """Test OpenRouter provider health check."""
         is_healthy = await mock_openrouter_provider.health_check()
         assert is_healthy is True
+
+
+@pytest.mark.fast
+class TestOpenRouterClientPool:
+    """Tests for the shared OpenRouter HTTP client pool."""
+
+    @pytest.mark.asyncio
+    async def test_providers_share_pooled_client(self):
+        """Test that providers with the same settings reuse one client."""
+        first = OpenRouterProvider(api_key="sk-or-test")
+        second = OpenRouterProvider(api_key="sk-or-test")
+        other = OpenRouterProvider(api_key="sk-or-other")
+
+        assert first.client is second.client
+        assert first.client is not other.client
+
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_provider_close_keeps_shared_client_open(self):
+        """Test that closing one provider does not close the pool for others."""
+        first = OpenRouterProvider(api_key="sk-or-test")
+        second = OpenRouterProvider(api_key="sk-or-test")
+        client = second.client
+
+        await first.close()
+        assert not client.is_closed
+
+        await close_http_clients()
+        assert client.is_closed
+        assert second.client is not client
+
+        await close_http_clients()
@@ -9,11 +9,14 @@ import time
 
 import pytest
 
+from app.core import rate_limiter
 from app.core.rate_limiter import (
     TIER_RATE_LIMITS,
     RateLimiterRegistry,
     TokenBucket,
     acquire_rate_limit,
+    acquire_rate_limits,
+    get_registry,
     get_tier_from_model,
     reset_rate_limiters,
 )
@@ -88,6 +91,57 @@ class TestTokenBucket:
         # Should have waited some time (but not too long due to fast refill)
         assert elapsed > 0.01
 
+    def test_token_bucket_acquire_without_suspending(self) -> None:
+        """Uncontended acquire with tokens available completes without yielding."""
+        bucket = TokenBucket(capacity=2, refill_rate=0.1)
+
+        with pytest.raises(StopIteration) as finished:
+            bucket.acquire().send(None)
+
+        assert finished.value.value is True
+        assert bucket.tokens < 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_concurrent_acquires_do_not_over_issue(self) -> None:
+        """Concurrent acquires never hand out more tokens than are available."""
+        bucket = TokenBucket(capacity=2, refill_rate=0.1)
+
+        results = await asyncio.gather(*(bucket.acquire(timeout=0.05) for _ in range(3)))
+
+        assert sorted(results) == [False, True, True]
+
+    def test_token_bucket_uses_slots(self) -> None:
+        """Buckets have no per-instance __dict__."""
+        bucket = TokenBucket(capacity=1, refill_rate=1.0)
+        assert not hasattr(bucket, "__dict__")
+
+    def test_full_bucket_does_not_bank_idle_time(self) -> None:
+        """Time spent at capacity is not credited after tokens are spent."""
+        bucket = TokenBucket(capacity=2, refill_rate=1.0)
+        bucket.last_refill -= 100  # Idle at capacity for a long time
+
+        bucket.available_tokens()
+        bucket.tokens -= 2
+
+        assert bucket.available_tokens() < 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_acquire_many(self) -> None:
+        """A burst takes its tokens at once and may run the bucket into debt."""
+        bucket = TokenBucket(capacity=2, refill_rate=100.0)
+
+        assert await bucket.acquire_many(3) is True
+        # Reserved 3 from 2, then slept until the debt was repaid
+        assert 0 <= bucket.available_tokens() < 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_acquire_many_timeout(self) -> None:
+        """A burst that can't be granted in time reserves nothing."""
+        bucket = TokenBucket(capacity=2, refill_rate=0.1)
+
+        assert await bucket.acquire_many(5, timeout=1.0) is False
+        assert bucket.tokens == pytest.approx(2, abs=0.01)
+
     @pytest.mark.asyncio
     async def test_token_bucket_capacity_limit(self) -> None:
         """Tokens don't exceed capacity."""
@@ -130,6 +184,51 @@ class TestTierDetection:
         assert get_tier_from_model("") == "paid"
         assert get_tier_from_model(None) == "paid"  # type: ignore
 
+    def test_unprefixed_gemini_names_are_native(self) -> None:
+        """Unprefixed IDs containing gemini are NATIVE regardless of case."""
+        assert get_tier_from_model("Gemini-2.5-Flash") == "native"
+        assert get_tier_from_model("models-gemini-pro") == "native"
+        assert get_tier_from_model("gemini/other") == "paid"
+
+    @pytest.mark.parametrize(
+        "model_id",
+        [
+            "gemini-2.5-flash",
+            "gemini-2.5-flash/preview",
+            "gemini-exp/1206",
+            "GEMINI-exp/1206",
+            "gemini/other",
+            "models-gemini-pro",
+            "google/gemini-2.0-flash-001",
+            "google/gemini-2.0-flash-001:free",
+            "gemini-2.5-flash/free",
+            "openai/gpt-4",
+            "",
+        ],
+    )
+    def test_matches_original_classification(self, model_id: str) -> None:
+        """Tier detection agrees with the original string checks."""
+        model_lower = model_id.lower()
+        if not model_id:
+            expected = "paid"
+        elif ":free" in model_lower or "/free" in model_lower:
+            expected = "free"
+        elif model_lower.startswith("gemini-") or (
+            "/" not in model_lower and "gemini" in model_lower
+        ):
+            expected = "native"
+        else:
+            expected = "paid"
+
+        assert get_tier_from_model(model_id) == expected
+
+    def test_tier_lookup_is_memoized(self) -> None:
+        """Repeated lookups for a model are served from the cache."""
+        get_tier_from_model.cache_clear()
+        get_tier_from_model("gemini-2.5-flash")
+        get_tier_from_model("gemini-2.5-flash")
+        assert get_tier_from_model.cache_info().hits == 1
+
 
 class TestRateLimiterRegistry:
     """Tests for RateLimiterRegistry class."""
@@ -175,6 +274,20 @@ class TestRateLimiterRegistry:
             assert "capacity" in tier_stats
             assert "refill_rate" in tier_stats
 
+    @pytest.mark.asyncio
+    async def test_registry_stats_refresh_in_place(self) -> None:
+        """Stats are one read-only mapping, refreshed on each call."""
+        registry = RateLimiterRegistry()
+        stats = registry.get_stats()
+        full = stats["native"]["available_tokens"]
+
+        await registry.acquire("native")
+
+        assert registry.get_stats() is stats
+        assert stats["native"]["available_tokens"] < full
+        with pytest.raises(TypeError):
+            stats["native"]["capacity"] = 0  # type: ignore[index]
+
 
 class TestAcquireRateLimit:
     """Tests for acquire_rate_limit convenience function."""
@@ -202,6 +315,33 @@ class TestAcquireRateLimit:
         result = await acquire_rate_limit("google/gemini-2.0-flash-001")
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_acquire_rate_limits_groups_by_tier(self) -> None:
+        """A burst takes one token per model from each model's tier."""
+        registry = await get_registry()
+
+        result = await acquire_rate_limits(
+            ["gemini-2.5-flash", "gemini-2.5-pro", "openai/gpt-4o"]
+        )
+
+        assert result is True
+        native = TIER_RATE_LIMITS["native"].burst
+        paid = TIER_RATE_LIMITS["paid"].burst
+        assert registry.get_limiter("native").tokens == pytest.approx(native - 2, abs=0.1)
+        assert registry.get_limiter("paid").tokens == pytest.approx(paid - 1, abs=0.1)
+
+    @pytest.mark.asyncio
+    async def test_reset_replaces_registry(self) -> None:
+        """Resetting installs a fresh, already-built registry."""
+        before = await get_registry()
+        await acquire_rate_limit("gemini-2.5-flash")
+
+        reset_rate_limiters()
+        after = await get_registry()
+
+        assert after is not before
+        assert after.get_limiter("native").tokens == TIER_RATE_LIMITS["native"].burst
+
 
 class TestTierRateLimits:
     """Tests for tier rate limit configuration."""
@@ -212,9 +352,9 @@ class TestTierRateLimits:
         paid = TIER_RATE_LIMITS["paid"]
         native = TIER_RATE_LIMITS["native"]
 
-        assert free["rpm"] < paid["rpm"]
-        assert free["rpm"] < native["rpm"]
-        assert free["burst"] < paid["burst"]
+        assert free.rpm < paid.rpm
+        assert free.rpm < native.rpm
+        assert free.burst < paid.burst
 
     def test_native_tier_has_highest_limits(self) -> None:
         """Native tier has the most generous limits."""
@@ -222,17 +362,17 @@ class TestTierRateLimits:
         paid = TIER_RATE_LIMITS["paid"]
         native = TIER_RATE_LIMITS["native"]
 
-        assert native["rpm"] >= paid["rpm"]
-        assert native["burst"] >= paid["burst"]
+        assert native.rpm >= paid.rpm
+        assert native.burst >= paid.burst
 
     def test_refill_rate_matches_rpm(self) -> None:
         """Refill rate is approximately rpm/60."""
         for tier, config in TIER_RATE_LIMITS.items():
-            expected_rate = config["rpm"] / 60.0
-            actual_rate = config["refill_rate"]
+            expected_rate = config.rpm / 60.0
+            actual_rate = config.refill_rate
             # Allow 10% tolerance
             assert abs(actual_rate - expected_rate) / expected_rate < 0.15, \
-                f"Tier {tier}: refill_rate {actual_rate} doesn't match rpm {config['rpm']}"
+                f"Tier {tier}: refill_rate {actual_rate} doesn't match rpm {config.rpm}"
 
 
 class TestGracefulDegradation:
@@ -250,23 +390,53 @@ class TestGracefulDegradation:
         bucket = TokenBucket(capacity=0, refill_rate=0)  # Empty bucket
 
         # Manually disable
-        TokenBucket._disabled = True
+        rate_limiter._disabled = True
 
         result = await bucket.acquire()
         assert result is True  # Should allow through when disabled
 
         # Reset for other tests
-        TokenBucket._disabled = False
+        rate_limiter._disabled = False
 
     def test_reset_failures_clears_state(self) -> None:
         """reset_failures clears both counters."""
-        TokenBucket._consecutive_failures = 10
-        TokenBucket._disabled = True
+        rate_limiter._consecutive_failures = 10
+        rate_limiter._disabled = True
 
         TokenBucket.reset_failures()
 
-        assert TokenBucket._consecutive_failures == 0
-        assert TokenBucket._disabled is False
+        assert rate_limiter._consecutive_failures == 0
+        assert rate_limiter._disabled is False
+
+    @pytest.mark.asyncio
+    async def test_repeated_errors_trip_kill_switch(self) -> None:
+        """Errors are counted per bucket and globally; enough of them disable limiting."""
+        broken = TokenBucket(capacity=0, refill_rate=0)  # Waiting divides by zero
+        healthy = TokenBucket(capacity=1, refill_rate=1.0)
+
+        for _ in range(rate_limiter.MAX_CONSECUTIVE_FAILURES - 1):
+            assert await broken.acquire() is True
+
+        assert broken.failures == rate_limiter.MAX_CONSECUTIVE_FAILURES - 1
+        assert healthy.failures == 0
+        assert rate_limiter._disabled is False
+
+        await broken.acquire()
+        assert rate_limiter._disabled is True
+
+        TokenBucket.reset_failures()
+
+    @pytest.mark.asyncio
+    async def test_success_resets_consecutive_failures(self) -> None:
+        """A successful acquire anywhere clears the global error streak."""
+        broken = TokenBucket(capacity=0, refill_rate=0)
+        healthy = TokenBucket(capacity=1, refill_rate=1.0)
+
+        await broken.acquire()
+        await healthy.acquire()
+
+        assert rate_limiter._consecutive_failures == 0
+        assert broken.failures == 1
 
 
 class TestConcurrency:
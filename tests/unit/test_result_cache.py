@@ -0,0 +1,79 @@
+"""Tests for the structured result cache.
+
+Tests:
+    - Cache key stability
+    - Hit/miss behaviour and copy-on-read
+    - TTL expiry and LRU eviction
+"""
+
+import pytest
+
+from app.core.result_cache import ResultCache, make_cache_key
+from app.schemas import Character, CharacterRole
+
+
+def make_character(name: str = "Julius Caesar") -> Character:
+    """Create a minimal Character for caching."""
+    return Character(name=name, role=CharacterRole.PRIMARY, description="Roman dictator")
+
+
+@pytest.mark.fast
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_key_ignores_dict_order(self):
+        """Test that key order does not change the cache key."""
+        assert make_cache_key({"a": 1, "b": 2}) == make_cache_key({"b": 2, "a": 1})
+
+    def test_key_depends_on_values(self):
+        """Test that different values produce different keys."""
+        assert make_cache_key({"prompt": "a"}) != make_cache_key({"prompt": "b"})
+
+
+@pytest.mark.fast
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored result is returned on the next lookup."""
+        cache = ResultCache()
+        key = {"model": "m", "prompt": "p"}
+
+        assert cache.get(key) is None
+        cache.put(key, make_character(), model_used="m")
+
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.content.name == "Julius Caesar"
+        assert cached.model_used == "m"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_returns_copies(self):
+        """Test that mutating a returned result does not affect the cache."""
+        cache = ResultCache()
+        key = {"prompt": "p"}
+        cache.put(key, make_character())
+
+        cache.get(key).content.name = "Brutus"
+        assert cache.get(key).content.name == "Julius Caesar"
+
+    def test_expired_entries_are_dropped(self):
+        """Test that entries past their TTL are treated as misses."""
+        cache = ResultCache(ttl_seconds=0)
+        key = {"prompt": "p"}
+        cache.put(key, make_character())
+
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = ResultCache(max_entries=2)
+        cache.put({"k": 1}, make_character("One"))
+        cache.put({"k": 2}, make_character("Two"))
+        cache.get({"k": 1})
+        cache.put({"k": 3}, make_character("Three"))
+
+        assert cache.get({"k": 2}) is None
+        assert cache.get({"k": 1}).content.name == "One"
+        assert cache.get({"k": 3}).content.name == "Three"
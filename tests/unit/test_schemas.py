@@ -7,15 +7,27 @@ Tests:
     - CharacterData validation (max 8)
     - DialogData validation (max 7)
     - ImagePromptData validation
+    - ChatMessage prompt formatting
+    - Stream event factories
+    - SurveyResult response lookups
 """
 
 import pytest
+from pydantic import ValidationError
 
 from app.schemas import (
     CameraData,
     Character,
     CharacterData,
     CharacterRole,
+    CharacterSurveyResponse,
+    ChatMessage,
+    ChatRole,
+    ChatStreamEvent,
+    DialogStreamEvent,
+    SurveyMode,
+    SurveyResult,
+    SurveyStreamEvent,
     DialogData,
     DialogLine,
     Faction,
@@ -556,3 +568,123 @@ class TestGraphData:
 
         no_faction = graph.get_faction_for("Unknown")
         assert no_faction is None
+
+
+# ChatMessage Tests
+
+
+@pytest.mark.fast
+class TestChatMessage:
+    """Tests for ChatMessage schema."""
+
+    def test_to_prompt_format(self):
+        """Test each role renders its prompt line."""
+        assert ChatMessage(role=ChatRole.USER, content="Hi").to_prompt_format() == "User: Hi"
+        assert ChatMessage(
+            role=ChatRole.CHARACTER, content="Hello", character_name="Franklin"
+        ).to_prompt_format() == "Franklin: Hello"
+        assert ChatMessage(
+            role=ChatRole.CHARACTER, content="Hello"
+        ).to_prompt_format() == "Character: Hello"
+        assert ChatMessage(
+            role="system", content="Scene starts"
+        ).to_prompt_format() == "[System: Scene starts]"
+
+    def test_join_transcript(self):
+        """Test a transcript joins each message's prompt line."""
+        messages = [
+            ChatMessage(role=ChatRole.USER, content="Hi"),
+            ChatMessage(role=ChatRole.CHARACTER, content="Hello", character_name="Franklin"),
+        ]
+        assert ChatMessage.join_transcript(messages) == "\n".join(
+            m.to_prompt_format() for m in messages
+        )
+        assert ChatMessage.join_transcript([]) == ""
+
+    def test_messages_are_frozen(self):
+        """Test messages cannot be modified after construction."""
+        message = ChatMessage(role=ChatRole.USER, content="Hi")
+        with pytest.raises(ValidationError):
+            message.content = "changed"
+
+
+@pytest.mark.fast
+class TestStreamEventFactories:
+    """Tests for the unvalidated stream event factories."""
+
+    def test_factories_match_validated_events(self):
+        """Test each factory builds the same event as the constructor."""
+        pairs = [
+            (ChatStreamEvent.token("Hel", "Franklin"),
+             ChatStreamEvent(event="token", data="Hel", character_name="Franklin")),
+            (ChatStreamEvent.error("boom"), ChatStreamEvent(event="error", data="boom")),
+            (DialogStreamEvent.line({"text": "Hi"}, "Adams", 1),
+             DialogStreamEvent(event="line", data={"text": "Hi"}, speaker="Adams", line_number=1)),
+            (SurveyStreamEvent.response("Yes", "Adams", "Agree?", 50),
+             SurveyStreamEvent(
+                 event="response", data="Yes", character_name="Adams",
+                 question="Agree?", progress=50,
+             )),
+            (SurveyStreamEvent.done({}), SurveyStreamEvent(event="done", data={}, progress=100)),
+        ]
+        for built, validated in pairs:
+            assert built.model_dump() == validated.model_dump()
+
+
+@pytest.mark.fast
+class TestSurveyResultLookups:
+    """Tests for SurveyResult response lookups."""
+
+    def _result(self) -> SurveyResult:
+        responses = [
+            CharacterSurveyResponse(character_name=name, question=question, response="...")
+            for name in ("Caesar", "Brutus")
+            for question in ("Why?", "When?")
+        ]
+        return SurveyResult(
+            timepoint_id="tp-1",
+            questions=["Why?", "When?"],
+            responses=responses,
+            mode=SurveyMode.PARALLEL,
+            total_characters=2,
+        )
+
+    def test_lookups_match_scan(self):
+        """Test that lookups return the same responses, in order, as a scan."""
+        result = self._result()
+
+        by_name = result.get_responses_by_character("caesar")
+        assert by_name == [r for r in result.responses if r.character_name == "Caesar"]
+        by_question = result.get_responses_by_question("When?")
+        assert by_question == [r for r in result.responses if r.question == "When?"]
+        assert result.get_responses_by_character("Cicero") == []
+        assert result.get_responses_by_question("Where?") == []
+
+    def test_lookups_see_reassigned_responses(self):
+        """Test that assigning a new responses list rebuilds the indexes."""
+        result = self._result()
+        assert len(result.get_responses_by_character("Cicero")) == 0
+
+        result.responses = [
+            *result.responses,
+            CharacterSurveyResponse(character_name="Cicero", question="Why?", response="..."),
+        ]
+        assert len(result.get_responses_by_character("CICERO")) == 1
+        assert len(result.get_responses_by_question("Why?")) == 3
+
+    def test_same_length_replacement_rebuilds_indexes(self):
+        """Test that a same-length replacement list is not served from a stale index."""
+        result = self._result()
+        assert len(result.get_responses_by_character("Caesar")) == 2
+
+        result.responses = [
+            r.model_copy(update={"character_name": "Cicero"}) for r in result.responses
+        ]
+        assert result.get_responses_by_character("Caesar") == []
+        assert len(result.get_responses_by_character("Cicero")) == 4
+
+    def test_returned_lists_are_copies(self):
+        """Test that mutating a returned list does not affect later lookups."""
+        result = self._result()
+        result.get_responses_by_character("Caesar").clear()
+        assert len(result.get_responses_by_character("Caesar")) == 2